@@ -9,7 +9,6 @@
 Python Wires
 """
 
-from __future__ import absolute_import
 
 
 
@@ -27,9 +26,30 @@ __email__ = 'tiago.montes@gmail.com'
 
 from . _wires import Wires
 from . _shared import w
-
-
-__all__ = ['Wires', 'w']
+from . _hooks import WiresHook
+from . _profiler import WiresProfiler
+from . _tracing import WiresTracer
+from . _failures import WiringFailure
+from . _importpath import wire_table
+from . _snapshot import snapshot, restore
+from . _shm import SharedMemoryChannel
+from . _bridge import SocketBridge, BridgeServer
+from . _fanin import FanIn
+from . _recorder import Recorder, Replayer
+from . _outbox import Outbox
+from . _routing import Equals
+from . _memo import MemoCache
+from . _breaker import CircuitBreaker, CircuitOpen
+from . _timeout import WiringTimeout
+
+
+__all__ = [
+    'Wires', 'w', 'WiresHook', 'WiresProfiler', 'WiresTracer', 'WiringFailure',
+    'wire_table', 'snapshot', 'restore', 'SharedMemoryChannel',
+    'SocketBridge', 'BridgeServer', 'FanIn', 'Recorder', 'Replayer',
+    'Outbox', 'Equals', 'MemoCache', 'CircuitBreaker', 'CircuitOpen',
+    'WiringTimeout',
+]
 
 
 # ----------------------------------------------------------------------------
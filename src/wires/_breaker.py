@@ -0,0 +1,226 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`CircuitBreaker` Class.
+
+Wirings to repeatedly failing functions, like those depending on an
+unavailable downstream service, may be skipped for a while, instead of being
+called, and failing, on every call:
+
+>>> w.orders.with_options(breaker=CircuitBreaker(failures=5, cooldown=30)).wire(notify)
+
+After ``failures`` consecutive exceptions, within ``window`` seconds, if
+given, the breaker opens: the wiring is skipped for ``cooldown`` seconds.
+Then, the breaker is half-open: the next call is a probe, closing the
+breaker if it succeeds, or opening it for another ``cooldown`` seconds if it
+fails; other calls are skipped while the probe is in progress.
+
+Skipped wirings are not called: in call results, and call raised
+``RuntimeError`` arguments, they have a :class:`CircuitOpen` exception,
+which is not raised, subject to the ``exception_detail`` setting; otherwise,
+they are handled as if they had raised it, including when
+``ignore_exceptions`` is ``False``. Wiring hooks are not called for skipped
+wirings.
+
+A single breaker may be shared by many wirings: each wired function has its
+own circuit, with unhashable ones told apart by identity. Breakers count
+calls, failures, skips and trips.
+"""
+
+import threading
+import time
+
+
+
+_clock = time.monotonic
+
+
+
+class CircuitOpen(Exception):
+
+    """
+    Call result exception for wirings skipped by an open
+    :class:`CircuitBreaker`; the single argument is the wired function.
+    """
+
+
+
+def _circuit_key(function):
+
+    # Circuits are keyed by wired function, or its id, if unhashable.
+
+    try:
+        hash(function)
+    except TypeError:
+        return id(function)
+    return function
+
+
+
+class _Circuit(object):
+
+    # Per wired function breaker state.
+
+    __slots__ = ('failures', 'first_failure', 'opened', 'probing')
+
+    def __init__(self):
+
+        # Consecutive failure count and time of the first one.
+        self.failures = 0
+        self.first_failure = None
+
+        # When the breaker opened, or the last probe started, or None if
+        # closed.
+        self.opened = None
+
+        # Whether a half-open probe call is in progress.
+        self.probing = False
+
+
+
+class CircuitBreaker(object):
+
+    """
+    Thread safe, per wired function, circuit breaker.
+    """
+
+    def __init__(self, failures=5, window=None, cooldown=30.0):
+        """
+        :param failures: Consecutive failure count that opens the breaker.
+        :type failures: ``int`` > 0
+
+        :param window: Seconds within which ``failures`` consecutive failures
+                       open the breaker, or ``None``, meaning no limit.
+        :type window: ``float`` > 0 or ``None``
+
+        :param cooldown: Seconds wirings are skipped for, once open.
+        :type cooldown: ``float`` >= 0
+        """
+        if failures < 1:
+            raise ValueError('failures must be positive')
+        if window is not None and window <= 0:
+            raise ValueError('window must be positive or None')
+        if cooldown < 0:
+            raise ValueError('cooldown must not be negative')
+
+        self._failures = failures
+        self._window = window
+        self._cooldown = cooldown
+        self._lock = threading.Lock()
+
+        # {<wired function, or its id>: <_Circuit>}
+        self._circuits = {}
+
+        # Allowed, failed and skipped wiring call counts, and how many times
+        # the breaker opened.
+        self.calls = 0
+        self.failures = 0
+        self.skips = 0
+        self.trips = 0
+
+
+    def __repr__(self):
+
+        return '<%s calls=%r failures=%r skips=%r trips=%r>' % (
+            self.__class__.__name__, self.calls, self.failures, self.skips,
+            self.trips,
+        )
+
+
+    def __reduce__(self):
+
+        # Pickled and copied closed.
+        return (self.__class__, (self._failures, self._window, self._cooldown))
+
+
+    def state(self, function):
+        """
+        Returns the breaker state for the wired ``function``: one of
+        ``'closed'``, ``'open'`` or ``'half-open'``.
+        """
+        with self._lock:
+            circuit = self._circuits.get(_circuit_key(function))
+            if circuit is None or circuit.opened is None:
+                return 'closed'
+            if circuit.probing or _clock() - circuit.opened >= self._cooldown:
+                return 'half-open'
+            return 'open'
+
+
+    def reset(self):
+        """
+        Closes the breaker for all wired functions; keeps the counts.
+        """
+        with self._lock:
+            self._circuits.clear()
+
+
+    def allow(self, function):
+        """
+        Returns whether the wired ``function`` is to be called, counting it
+        as a call or a skip. Allowed calls must be followed by a
+        :meth:`succeeded` or :meth:`failed` call.
+        """
+        with self._lock:
+            circuit = self._circuits.get(_circuit_key(function))
+            if circuit is not None and circuit.opened is not None:
+                now = _clock()
+                if now - circuit.opened < self._cooldown:
+                    self.skips += 1
+                    return False
+                # Half-open: skip others for another cooldown, while probing.
+                circuit.opened = now
+                circuit.probing = True
+            self.calls += 1
+            return True
+
+
+    def succeeded(self, function):
+        """
+        Records a successful call to the wired ``function``.
+        """
+        with self._lock:
+            # Successful calls on closed breakers leave no state behind.
+            self._circuits.pop(_circuit_key(function), None)
+
+
+    def failed(self, function):
+        """
+        Records a failed call to the wired ``function``.
+        """
+        now = _clock()
+        key = _circuit_key(function)
+        with self._lock:
+            self.failures += 1
+            try:
+                circuit = self._circuits[key]
+            except KeyError:
+                circuit = self._circuits[key] = _Circuit()
+
+            if circuit.probing:
+                # Failed half-open probe: open again.
+                circuit.probing = False
+                circuit.opened = now
+                self.trips += 1
+                return
+            if circuit.opened is not None:
+                # Allowed before opening, concurrently: already open.
+                return
+
+            window = self._window
+            if window is not None and circuit.failures and now - circuit.first_failure > window:
+                circuit.failures = 0
+            if not circuit.failures:
+                circuit.first_failure = now
+            circuit.failures += 1
+            if circuit.failures >= self._failures:
+                circuit.opened = now
+                self.trips += 1
+
+
+# ----------------------------------------------------------------------------
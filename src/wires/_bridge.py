@@ -0,0 +1,394 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`SocketBridge` and :class:`BridgeServer` Classes.
+
+Delivers calls from one :class:`Wires <wires._wires.Wires>` object to another,
+possibly on another host, over TCP or Unix sockets. On the receiving end, a
+:class:`BridgeServer` dispatches received calls to its
+:class:`Wires <wires._wires.Wires>` object's callables:
+
+>>> server = BridgeServer(w, ('0.0.0.0', 9999))
+>>> server.start()
+
+On the sending end, a :class:`SocketBridge` forwards calls to selected
+callables:
+
+>>> bridge = SocketBridge(('server-host', 9999))
+>>> bridge.forward(w.one_callable)
+>>> w.one_callable('hi')                # Delivered to the server's Wires.
+
+Calls are batched, with batches sent when they reach ``max_batch`` calls, or
+every ``flush_interval`` seconds, by a background thread, over a pool of
+persistent connections. Each batch is a length prefixed frame holding a list
+of ``(<name>, <args>, <kwargs>)`` tuples serialized with :mod:`pickle`, by
+default, or any other serializer.
+
+Calls are delivered at most once: batches failing to send, after one
+reconnection attempt, raise from the forwarding call that triggered sending,
+or are dropped and counted, when sent in the background. Up to ``pool_size``
+batches are taken and sent at a time, each over its own connection: use a
+``pool_size`` of 1, the default, for strict ordering.
+
+Only use :mod:`pickle`, the default serializer, with trusted peers.
+"""
+
+import os
+import pickle
+import queue
+import socket
+import socketserver
+import struct
+import threading
+
+from . import _forward
+
+
+
+# Frames are prefixed by their length.
+_LENGTH = struct.Struct('>I')
+
+
+
+class SocketBridge(object):
+
+    """
+    Batching, connection pooling, call forwarder.
+    """
+
+    def __init__(self, address, pool_size=1, flush_interval=0.005,
+                 max_batch=256, serializer=None, timeout=5.0):
+        """
+        :param address: A ``(<host>, <port>)`` TCP address or a Unix socket
+                        path.
+
+        :param pool_size: Maximum number of persistent connections.
+        :type pool_size: ``int`` > 0
+
+        :param flush_interval: Seconds between background sends of pending
+                               calls; if ``None``, pending calls are only sent
+                               on reaching ``max_batch`` or on :meth:`flush`.
+        :type flush_interval: ``float`` or ``None``
+
+        :param max_batch: Pending call count triggering an immediate send.
+        :type max_batch: ``int`` > 0
+
+        :param serializer: An object with ``dumps`` and ``loads`` functions,
+                           like :mod:`pickle`, the default.
+
+        :param timeout: Connection and send timeout, in seconds; also, how
+                        long to wait for a pooled connection.
+        :type timeout: ``float``
+        """
+        if pool_size < 1:
+            raise ValueError('pool_size must be positive')
+        if max_batch < 1:
+            raise ValueError('max_batch must be positive')
+
+        self._address = address
+        self._pool_size = pool_size
+        self._max_batch = max_batch
+        self._dumps = (serializer or pickle).dumps
+        self._timeout = timeout
+
+        # Pending (<name>, <args>, <kwargs>) calls and the connection count,
+        # guarded by `_lock`.
+        self._lock = threading.Lock()
+        self._pending = []
+        self._connection_count = 0
+
+        # Idle connections.
+        self._pool = queue.LifoQueue()
+
+        # Held from taking pending calls until they're sent, so that a single
+        # connection sends batches in the order they were taken.
+        self._senders = threading.BoundedSemaphore(pool_size)
+
+        # Background send failures: calls dropped and the last exception.
+        self.dropped = 0
+        self.last_error = None
+
+        self._closed = threading.Event()
+        if flush_interval is None:
+            self._flusher = None
+        else:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name='wires-bridge-flusher',
+            )
+            self._flusher.daemon = True
+            self._flusher.start()
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self._address)
+
+
+    def _connect(self):
+
+        if isinstance(self._address, tuple):
+            connection = socket.create_connection(self._address, self._timeout)
+            # We batch, ourselves.
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+            try:
+                connection.connect(self._address)
+            except Exception:
+                connection.close()
+                raise
+        return connection
+
+
+    def _acquire(self):
+
+        # Returns an idle pooled connection, a new one if the pool isn't full,
+        # or waits for one to become idle.
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._connection_count < self._pool_size
+            if create:
+                self._connection_count += 1
+        if not create:
+            return self._pool.get(timeout=self._timeout)
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._connection_count -= 1
+            raise
+
+
+    def _send_batch(self, batch):
+
+        frame = self._dumps(batch)
+        data = _LENGTH.pack(len(frame)) + frame
+
+        connection = self._acquire()
+        try:
+            connection.sendall(data)
+        except OSError:
+            # Maybe a stale connection: reconnect, once.
+            connection.close()
+            try:
+                connection = self._connect()
+                connection.sendall(data)
+            except Exception:
+                connection.close()
+                with self._lock:
+                    self._connection_count -= 1
+                raise
+        self._pool.put(connection)
+
+
+    def _take_pending(self):
+
+        with self._lock:
+            batch, self._pending = self._pending, []
+        return batch
+
+
+    def _flush_periodically(self, flush_interval):
+
+        while not self._closed.wait(flush_interval):
+            with self._senders:
+                batch = self._take_pending()
+                if not batch:
+                    continue
+                try:
+                    self._send_batch(batch)
+                except Exception as e:
+                    self.dropped += len(batch)
+                    self.last_error = e
+
+
+    def send(self, name, args, kwargs):
+        """
+        Queues a call to the remote ``name`` callable, with ``args`` and
+        ``kwargs``, sending pending calls if ``max_batch`` is reached.
+
+        :raises RuntimeError: If closed.
+        :raises OSError: If sending fails; the pending calls are dropped.
+        """
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError('bridge closed')
+            self._pending.append((name, args, kwargs))
+            if len(self._pending) < self._max_batch:
+                return
+        self.flush()
+
+
+    def forward(self, wires_callable, name=None):
+        """
+        Wires a forwarder to ``wires_callable`` that sends its calls to the
+        ``name`` remote callable, defaulting to the same name, and returns
+        it, for later unwiring.
+        """
+        return _forward.forward(wires_callable, self.send, name)
+
+
+    def flush(self):
+        """
+        Sends pending calls now.
+
+        :raises OSError: If sending fails; the pending calls are dropped.
+        """
+        with self._senders:
+            batch = self._take_pending()
+            if batch:
+                self._send_batch(batch)
+
+
+    def close(self):
+        """
+        Stops the background thread, sends pending calls, and closes all
+        connections.
+        """
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        try:
+            self.flush()
+        finally:
+            while True:
+                try:
+                    self._pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+
+        bridge_server = self.server.bridge_server
+        while True:
+            header = self.rfile.read(_LENGTH.size)
+            if len(header) < _LENGTH.size:
+                return
+            size = _LENGTH.unpack(header)[0]
+            frame = self.rfile.read(size)
+            if len(frame) < size:
+                return
+            bridge_server._dispatch(frame)
+
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+
+        daemon_threads = True
+
+
+
+class BridgeServer(object):
+
+    """
+    Receives calls from :class:`SocketBridge`\\s, dispatching them to a
+    :class:`Wires <wires._wires.Wires>` object's callables, one at a time.
+    """
+
+    def __init__(self, wires, address, serializer=None):
+        """
+        :param wires: Where to dispatch received calls to.
+        :type wires: :class:`Wires <wires._wires.Wires>`
+
+        :param address: A ``(<host>, <port>)`` TCP address, where ``<port>``
+                         may be ``0`` to pick a free one, or a Unix socket
+                         path; listening starts immediately.
+
+        :param serializer: An object with ``dumps`` and ``loads`` functions,
+                           like :mod:`pickle`, the default.
+        """
+        self._wires = wires
+        self._loads = (serializer or pickle).loads
+        self._dispatch_lock = threading.Lock()
+        self._thread = None
+
+        # Dispatch raised exception count.
+        self.errors = 0
+
+        server_class = _TCPServer if isinstance(address, tuple) else _UnixServer
+        self._server = server_class(address, _RequestHandler)
+        self._server.bridge_server = self
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self.address)
+
+
+    @property
+    def address(self):
+        """
+        The listening address.
+        """
+        return self._server.server_address
+
+
+    def _dispatch(self, frame):
+
+        batch = self._loads(frame)
+        with self._dispatch_lock:
+            for name, args, kwargs in batch:
+                try:
+                    _forward.deliver(self._wires, name, args, kwargs)
+                except Exception:
+                    # Like Wires with ignore_exceptions set: keep going.
+                    self.errors += 1
+
+
+    def start(self):
+        """
+        Starts serving connections in a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            # How often shutdown requests are checked for.
+            args=(0.05,),
+            name='wires-bridge-server',
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+
+    def close(self):
+        """
+        Stops serving and closes the listening socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+        if not isinstance(self.address, tuple):
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+
+# ----------------------------------------------------------------------------
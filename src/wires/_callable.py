@@ -29,6 +29,27 @@ them a combination of the optional wire-time and optional call-time arguments:
 hi world!
 bye world!
 
+:meth:`wire_many <WiresCallable.wire_many>` and
+:meth:`unwire_many <WiresCallable.unwire_many>` add and remove many wirings
+at once, validating the whole batch a single time;
+:meth:`replace_wirings <WiresCallable.replace_wirings>` and
+:meth:`transaction <WiresCallable.transaction>` swap all wirings at once, as
+seen by concurrent calls.
+
+:meth:`with_options <WiresCallable.with_options>` adds wirings with options,
+like a routing key, used by :meth:`call_key <WiresCallable.call_key>` to
+call only the wirings for that key, or a predicate deciding, per call,
+whether to call the wiring, see :mod:`wires._routing`, or a priority, taking
+precedence over wiring order:
+
+>>> w.prices.with_options(key='EUR').wire(update_eur_widget)
+>>> w.prices.call_key('EUR', 1.08)
+>>> w.prices.with_options(priority=10).wire(invalidate_cache)
+
+Other options, like result memoization, see :mod:`wires._memo`, circuit
+breaking, see :mod:`wires._breaker`, or a timeout, see :mod:`wires._timeout`,
+change how the wiring is called.
+
 :class:`WiresCallable`\\s have a :attr:`wirings <WiresCallable.wirings>`
 attribute, representing all current wirings, and include support for :func:`len`,
 returning the wiring count:
@@ -42,11 +63,236 @@ returning the wiring count:
 :class:`Wires <wires._wires.Wires>` object's settings and on their own
 :attr:`min_wirings <WiresCallable.min_wirings>`,
 :attr:`max_wirings <WiresCallable.max_wirings>`,
-:attr:`returns <WiresCallable.returns>` and
-:attr:`ignore_exceptions <WiresCallable.ignore_exceptions>` attributes.
+:attr:`returns <WiresCallable.returns>`,
+:attr:`ignore_exceptions <WiresCallable.ignore_exceptions>`,
+:attr:`exception_detail <WiresCallable.exception_detail>` and
+:attr:`timeout <WiresCallable.timeout>` attributes.
 """
 
-from __future__ import absolute_import
+import bisect
+import contextlib
+import functools
+import operator
+import threading
+
+from . import _breaker, _failures, _importpath, _memo, _routing, _timeout
+
+
+
+class _Wiring(tuple):
+
+    # A (<function>, <args>, <kwargs>) wiring tuple with wiring options, as
+    # attributes; equal to, and usable as, the plain tuple. Class attributes
+    # hold the default options.
+
+    key = None
+    where = None
+    priority = 0
+    memoize = None
+    breaker = None
+    timeout = None
+
+    def __new__(cls, wiring, options):
+
+        self = tuple.__new__(cls, wiring)
+        self.__dict__.update(options)
+        return self
+
+
+    def __reduce__(self):
+
+        return (self.__class__, (tuple(self), self.__dict__))
+
+
+
+def _negated_priority(wiring):
+
+    # Sort key for wirings: by descending priority.
+
+    return -getattr(wiring, 'priority', 0)
+
+
+
+def _wiring_tuple(wiring):
+
+    # Returns a validated (<function>, <args>, <kwargs>) wiring tuple from
+    # `wiring`, in any of the forms `WiresCallable.wire_many` takes; wirings
+    # with options, already validated, are returned as is.
+
+    if type(wiring) is _Wiring:
+        return wiring
+
+    if isinstance(wiring, (list, tuple)):
+        function = wiring[0]
+        args = tuple(wiring[1]) if len(wiring) > 1 else ()
+        kwargs = dict(wiring[2]) if len(wiring) > 2 else {}
+    else:
+        function, args, kwargs = wiring, (), {}
+
+    if isinstance(function, str):
+        function = _importpath.ImportPath(function)
+    elif not callable(function):
+        raise TypeError('argument not callable: %r' % (function,))
+
+    return function, args, kwargs
+
+
+
+def _remove_wiring(wirings, function, args, kwargs):
+
+    # Removes the first wiring in `wirings` matching `function`, `args` and
+    # `kwargs`, like `WiresCallable.unwire` documents.
+
+    if args or kwargs:
+        wirings.remove((function, args, kwargs))
+    else:
+        tuples_to_remove = [v for v in wirings if v[0] == function]
+        if not tuples_to_remove:
+            raise ValueError('non-wired function %r' % (function,))
+        wirings.remove(tuples_to_remove[0])
+
+
+
+def _without_hashed(wirings, to_remove):
+
+    # Returns `wirings` without those in `to_remove`, in a single pass,
+    # grouping removals by function: raises TypeError if any is unhashable.
+
+    removals = {}
+    for function, args, kwargs in to_remove:
+        removals.setdefault(function, []).append((args, kwargs))
+
+    remaining = []
+    for wiring in wirings:
+        function_removals = removals.get(wiring[0])
+        if function_removals:
+            for index, (args, kwargs) in enumerate(function_removals):
+                if not (args or kwargs) or (args, kwargs) == wiring[1:]:
+                    del function_removals[index]
+                    break
+            else:
+                remaining.append(wiring)
+        else:
+            remaining.append(wiring)
+
+    for function, function_removals in removals.items():
+        if function_removals:
+            raise ValueError('non-wired function %r' % (function,))
+
+    return remaining
+
+
+
+class _OptionedWirings(list):
+
+    # Wiring list type for lists including wirings with options.
+
+    __slots__ = ()
+
+
+
+class _PendingWirings(object):
+
+    # Stands in for the wirings list while wirings are added to it: held
+    # per priority, each added in constant time, then built into a new
+    # list, once, when next needed; see `WiresCallable._current_wirings`.
+    # Being neither list type, calls notice it with the type checks they
+    # already do.
+
+    __slots__ = ('_buckets', '_priorities', '_optioned', '_length')
+
+    def __init__(self, wirings):
+
+        # Wiring lists, by negated priority, and their sorted keys.
+        self._buckets = {}
+        self._priorities = []
+        self._optioned = False
+        self._length = 0
+        self.extend(wirings)
+
+
+    def extend(self, wirings):
+
+        # Priorities first: either all wirings are added or, if any priority
+        # fails negating, none is.
+        prioritized = [(_negated_priority(wiring), wiring) for wiring in wirings]
+
+        buckets = self._buckets
+        for priority, wiring in prioritized:
+            bucket = buckets.get(priority)
+            if bucket is None:
+                bucket = buckets[priority] = []
+                bisect.insort(self._priorities, priority)
+            bucket.append(wiring)
+            if type(wiring) is not tuple:
+                self._optioned = True
+            self._length += 1
+
+
+    def build(self):
+
+        wirings = _OptionedWirings() if self._optioned else []
+        buckets = self._buckets
+        for priority in self._priorities:
+            wirings.extend(buckets[priority])
+        return wirings
+
+
+    def __len__(self):
+
+        return self._length
+
+
+
+# Serializes building `_PendingWirings` into lists, at call time, with adding
+# to them: no added wiring is lost to a concurrent call's build.
+_pending_lock = threading.Lock()
+
+
+
+def _plain_call(function, args, kwargs):
+
+    return function(*args, **kwargs)
+
+
+
+class WiringOptions(object):
+
+    """
+    Adds wirings with options to a :class:`WiresCallable`; get one from
+    :meth:`WiresCallable.with_options`.
+    """
+
+    __slots__ = ('_wires_callable', '_options')
+
+    def __init__(self, wires_callable, options):
+
+        self._wires_callable = wires_callable
+        self._options = options
+
+
+    def __repr__(self):
+
+        return '<%s %r %r>' % (
+            self.__class__.__name__, self._wires_callable.__name__, self._options,
+        )
+
+
+    def wire(self, function, *args, **kwargs):
+        """
+        Like :meth:`WiresCallable.wire`, with this object's options.
+        """
+        self.wire_many([(function, args, kwargs)])
+
+
+    def wire_many(self, wirings):
+        """
+        Like :meth:`WiresCallable.wire_many`, with this object's options.
+        """
+        options = self._options
+        self._wires_callable.wire_many([
+            _Wiring(_wiring_tuple(wiring), options) for wiring in wirings
+        ])
 
 
 
@@ -87,15 +333,30 @@ class WiresCallable(object):
         # Call-time settings.
         self._calltime_settings = {}
 
-        # Wired (<callable>, <wire-time-args>, <wire-time-kwargs>) tuples.
+        # Wired (<callable>, <wire-time-args>, <wire-time-kwargs>) tuples,
+        # in an `_OptionedWirings` list if any has options, or in a
+        # `_PendingWirings` object, while being added to.
         self._wirings = []
 
+        # Wiring selection structures, built from `_wirings` when needed.
+        self._wiring_index = None
+
 
     def __repr__(self):
 
         return '<%s %r at 0x%x>' % (self.__class__.__name__, self._name, id(self))
 
 
+    def __reduce__(self):
+
+        # Pickled as its Wires object plus name: unpickling and deep copying
+        # get the callable with the same name in the new Wires object, while
+        # copying gets self. Wirings to callables of the same Wires object
+        # are pickled and copied by name, in its state: see `Wires.__getstate__`.
+
+        return (operator.getitem, (self._wires, self._name))
+
+
     @property
     def __name__(self):
         """
@@ -222,6 +483,55 @@ class WiresCallable(object):
         self._callable_settings['ignore_exceptions'] = value
 
 
+    @property
+    def exception_detail(self):
+        """
+        ``str`` value defining what call results hold for wiring raised
+        exceptions: one of ``'full'``, ``'no_traceback'``, ``'compact'`` or
+        ``'summary'``; see :mod:`wires._failures`.
+
+        Reading returns the per-:class:`WiresCallable` value, if set, falling
+        back to the containing :class:`Wires <wires._wires.Wires>`'s setting.
+        Writing assigns a per-:class:`WiresCallable` value.
+
+        :raises ValueError: When assigned invalid values.
+        """
+        return self._effective_setting('exception_detail')
+
+
+    @exception_detail.setter
+    def exception_detail(self, value):
+
+        if value not in _failures.EXCEPTION_DETAILS:
+            raise ValueError('invalid exception_detail: %r' % (value,))
+
+        self._callable_settings['exception_detail'] = value
+
+
+    @property
+    def timeout(self):
+        """
+        Seconds calls have to complete, or ``None``, meaning no limit; see
+        :mod:`wires._timeout`.
+
+        Reading returns the per-:class:`WiresCallable` value, if set, falling
+        back to the containing :class:`Wires <wires._wires.Wires>`'s setting.
+        Writing assigns a per-:class:`WiresCallable` value.
+
+        :raises ValueError: When assigned invalid values.
+        """
+        return self._effective_setting('timeout')
+
+
+    @timeout.setter
+    def timeout(self, value):
+
+        if value is not None and value <= 0:
+            raise ValueError('timeout must be positive or None')
+
+        self._callable_settings['timeout'] = value
+
+
     # Used as a guard for non-set arguments in the `set` method call; `None`
     # would not be appropriate given than `min_wirings` and `max_wirings` take
     # `None` as valid value.
@@ -229,7 +539,8 @@ class WiresCallable(object):
     _not_set = object()
 
     def set(self, min_wirings=_not_set, max_wirings=_not_set, returns=_not_set,
-            ignore_exceptions=_not_set, _next_call_only=False):
+            ignore_exceptions=_not_set, exception_detail=_not_set,
+            timeout=_not_set, _next_call_only=False):
         """
         Sets one or more per-:class:`WiresCallable` settings.
 
@@ -241,6 +552,10 @@ class WiresCallable(object):
 
         :param ignore_exceptions: See :attr:`ignore_exceptions`.
 
+        :param exception_detail: See :attr:`exception_detail`.
+
+        :param timeout: See :attr:`timeout`.
+
         :param _next_call_only: **IMPORTANT**: This argument is considered
                                 private and may be changed or removed in future
                                 releases.
@@ -262,7 +577,10 @@ class WiresCallable(object):
         # at a somewhat "meta-ish" level.
 
         local_names = locals()
-        arg_names = ('min_wirings', 'max_wirings', 'returns', 'ignore_exceptions')
+        arg_names = (
+            'min_wirings', 'max_wirings', 'returns', 'ignore_exceptions',
+            'exception_detail', 'timeout',
+        )
         for name in arg_names:
             if local_names[name] is not self._not_set:
                 target_settings[name] = local_names[name]
@@ -300,22 +618,107 @@ class WiresCallable(object):
         del self._callable_settings[name]
 
 
+    def with_options(self, key=None, where=None, priority=None, memoize=None,
+                     breaker=None, timeout=None):
+        """
+        Returns a :class:`WiringOptions` object, whose ``wire`` and
+        ``wire_many`` methods add wirings with the given options:
+
+        >>> w.prices.with_options(key='EUR').wire(update_eur_widget)
+
+        :param key: Routing key: see :meth:`call_key`. Wirings without a key
+                    are called by every :meth:`call_key` call.
+        :type key: hashable
+
+        :param where: Predicate, passed the call-time arguments: the wiring
+                      is only called if it returns a true value; see
+                      :mod:`wires._routing`.
+        :type where: callable
+
+        :param priority: Wirings are called by descending priority, then in
+                         wiring order; defaults to ``0``.
+        :type priority: ``int``
+
+        :param memoize: Result cache for wirings to pure functions, or
+                        ``True``, for a new default one shared by the
+                        wirings added via the returned object; see
+                        :mod:`wires._memo`.
+        :type memoize: :class:`MemoCache <wires._memo.MemoCache>` or ``bool``
+
+        :param breaker: Circuit breaker skipping repeatedly failing wirings,
+                        or ``True``, for a new default one shared by the
+                        wirings added via the returned object; see
+                        :mod:`wires._breaker`.
+        :type breaker: :class:`CircuitBreaker <wires._breaker.CircuitBreaker>`
+                       or ``bool``
+
+        :param timeout: Seconds to wait for the wiring to complete; see
+                        :mod:`wires._timeout`.
+        :type timeout: ``float`` > 0
+
+        :raises TypeError: If ``key`` is not hashable.
+        :raises ValueError: If ``timeout`` is not positive.
+        """
+        if key is not None:
+            try:
+                hash(key)
+            except TypeError:
+                raise TypeError('key not hashable: %r' % (key,)) from None
+        if where is not None and not callable(where):
+            raise TypeError('where not callable: %r' % (where,))
+        if memoize is True:
+            memoize = _memo.MemoCache()
+        elif memoize is False:
+            memoize = None
+        elif memoize is not None and not isinstance(memoize, _memo.MemoCache):
+            raise TypeError('memoize not a MemoCache: %r' % (memoize,))
+        if breaker is True:
+            breaker = _breaker.CircuitBreaker()
+        elif breaker is False:
+            breaker = None
+        elif breaker is not None and not isinstance(breaker, _breaker.CircuitBreaker):
+            raise TypeError('breaker not a CircuitBreaker: %r' % (breaker,))
+        if timeout is not None and timeout <= 0:
+            raise ValueError('timeout must be positive or None')
+
+        options = {
+            'key': key, 'where': where, 'priority': priority, 'memoize': memoize,
+            'breaker': breaker, 'timeout': timeout,
+        }
+        return WiringOptions(self, {
+            name: value for name, value in options.items() if value is not None
+        })
+
+
     def wire(self, function, *args, **kwargs):
         """
         Adds a new wiring to ``function``, with ``args`` and ``kwargs`` as
         wire-time arguments.
 
+        ``function`` may be a ``'<module>:<attribute>'`` import path string,
+        resolved on first call; see :mod:`wires._importpath`.
+
         :raises TypeError: If ``function`` is not :func:`callable`.
+        :raises ValueError: If ``function`` is an invalid import path.
         :raises RuntimeError: If :attr:`max_wirings` would be violated.
         """
-        if not callable(function):
+        if isinstance(function, str):
+            function = _importpath.ImportPath(function)
+        elif not callable(function):
             raise TypeError('argument not callable: %r' % (function,))
 
         # self._max_wirings can be None, meaning "no limit": comparison ok
-        if len(self._wirings) == self.max_wirings:
+        wirings = self._wirings
+        if len(wirings) == self.max_wirings:
             raise RuntimeError('max_wirings limit reached')
 
-        self._wirings.append((function, args, kwargs))
+        # Wirings are sorted by priority, which defaults to 0: appending is
+        # fine, unless there are negative priority wirings.
+        if type(wirings) is list or (
+                type(wirings) is _OptionedWirings and _negated_priority(wirings[-1]) <= 0):
+            wirings.append((function, args, kwargs))
+        else:
+            self._add_pending([(function, args, kwargs)])
 
 
     def unwire(self, function, *args, **kwargs):
@@ -326,39 +729,248 @@ class WiresCallable(object):
         ``function`` with those wire-time arguments; otherwise, unwires the
         first wired ``function``, regardless of wire-time arguments.
 
+        ``function`` may be an import path string, matching wirings to that
+        same import path only.
+
         :raises TypeError: If ``function`` is not :func:`callable`.
         :raises ValueError: If no matching wiring is found.
         :raises RuntimeError: If :attr:`min_wirings` would be violated.
         """
-        if not callable(function):
+        if isinstance(function, str):
+            function = _importpath.ImportPath(function)
+        elif not callable(function):
             raise TypeError('argument not callable: %r' % (function,))
 
         # self.min_wirings can be None, meaning "no limit": comparison ok
         if len(self._wirings) == self.min_wirings:
             raise RuntimeError('min_wirings limit reached')
 
-        if args or kwargs:
-            self._wirings.remove((function, args, kwargs))
+        wirings = list(self._current_wirings())
+        _remove_wiring(wirings, function, args, kwargs)
+        self._set_wirings(wirings)
+
+
+    def wire_many(self, wirings):
+        """
+        Adds new wirings, all at once: either all are added or, if any fails
+        validation, none is.
+
+        :param wirings: Wirings, each either a function, an import path
+                        string, or a ``(<function>, <args>)`` or
+                        ``(<function>, <args>, <kwargs>)`` sequence, where
+                        ``<args>`` and ``<kwargs>`` are wire-time arguments.
+        :type wirings: iterable
+
+        :raises: See :meth:`wire`; :attr:`max_wirings` is checked once,
+                 against the final wiring count.
+        """
+        new_wirings = [_wiring_tuple(wiring) for wiring in wirings]
+
+        max_wirings = self.max_wirings
+        if max_wirings is not None and len(self._wirings) + len(new_wirings) > max_wirings:
+            raise RuntimeError('max_wirings limit reached')
+
+        self._add_pending(new_wirings)
+
+
+    def unwire_many(self, wirings):
+        """
+        Removes wirings, all at once: either all are removed or, if any is
+        not found, none is.
+
+        :param wirings: Wirings to remove, like :meth:`wire_many` takes; each
+                        is matched like :meth:`unwire` matches its arguments.
+        :type wirings: iterable
+
+        :raises: See :meth:`unwire`; :attr:`min_wirings` is checked once,
+                 against the final wiring count.
+        """
+        to_remove = [_wiring_tuple(wiring) for wiring in wirings]
+        if not to_remove:
+            return
+
+        wirings = self._current_wirings()
+        try:
+            remaining = _without_hashed(wirings, to_remove)
+        except TypeError:
+            # Unhashable functions: fall back to one by one removal.
+            remaining = list(wirings)
+            for function, args, kwargs in to_remove:
+                _remove_wiring(remaining, function, args, kwargs)
+
+        min_wirings = self.min_wirings
+        if min_wirings is not None and len(remaining) < min_wirings:
+            raise RuntimeError('min_wirings limit reached')
+
+        self._set_wirings(remaining)
+
+
+    def replace_wirings(self, wirings):
+        """
+        Replaces all wirings with ``wirings``, at once: calls in progress, or
+        made concurrently, use either all the previous wirings or all the
+        new ones.
+
+        :param wirings: The new wirings, like :meth:`wire_many` takes.
+        :type wirings: iterable
+
+        :raises: See :meth:`wire`; :attr:`min_wirings` and
+                 :attr:`max_wirings` are checked against the new wiring count
+                 only.
+        """
+        self._publish([_wiring_tuple(wiring) for wiring in wirings])
+
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Context manager for reconfiguring wirings in several steps, replacing
+        them all, like :meth:`replace_wirings`, on exit:
+
+        >>> with w.one_callable.transaction() as staged:
+        ...     staged.unwire(old_handler)
+        ...     staged.wire(new_handler)
+
+        ``staged`` is a :class:`WiresCallable`, with the current wirings and
+        no wiring limits: :attr:`min_wirings` and :attr:`max_wirings` are
+        checked on exit only. Nothing is changed if the block raises.
+        Wirings changed by others, meanwhile, are overwritten.
+        """
+        staged = WiresCallable(self._wires, self._name, self._wires_settings)
+        staged._callable_settings.update(min_wirings=None, max_wirings=None)
+        staged._set_wirings(list(self._current_wirings()))
+        yield staged
+        self._publish(staged._current_wirings())
+
+
+    def _publish(self, wirings):
+
+        # Validates the new `wirings` list's wiring count and makes it the
+        # current one: dispatching iterates whichever list is current when
+        # a call starts, and lists are not mutated once replaced.
+
+        min_wirings = self.min_wirings
+        if min_wirings is not None and len(wirings) < min_wirings:
+            raise RuntimeError('min_wirings limit reached')
+        max_wirings = self.max_wirings
+        if max_wirings is not None and len(wirings) > max_wirings:
+            raise RuntimeError('max_wirings limit reached')
+
+        self._set_wirings(wirings)
+
+
+    def _set_wirings(self, wirings):
+
+        # Makes `wirings`, a new list, the current one. Calls go through the
+        # wiring index and honor options only for `_OptionedWirings` lists:
+        # being the list type, it's consistent with the list it applies to,
+        # for concurrent calls.
+
+        if all(type(wiring) is tuple for wiring in wirings):
+            self._wirings = wirings if type(wirings) is list else list(wirings)
         else:
-            tuples_to_remove = [v for v in self._wirings if v[0] == function]
-            if not tuples_to_remove:
-                raise ValueError('non-wired function %r' % (function,))
-            self._wirings.remove(tuples_to_remove[0])
+            wirings = _OptionedWirings(wirings)
+            # Stable: keeps wiring order within equal priority. Lists are
+            # mostly sorted already, making it cheap.
+            wirings.sort(key=_negated_priority)
+            self._wirings = wirings
+
+
+    def _add_pending(self, new_wirings):
+
+        # Adds `new_wirings`, validated, to the current wirings, without
+        # building a new list: that's left to `_current_wirings`, once, no
+        # matter how many are added meanwhile.
+
+        if not new_wirings:
+            return
+        with _pending_lock:
+            wirings = self._wirings
+            if type(wirings) is not _PendingWirings:
+                wirings = _PendingWirings(wirings)
+            wirings.extend(new_wirings)
+            self._wirings = wirings
+
+
+    def _current_wirings(self):
+
+        # Returns the current wirings list, building it first, if wirings
+        # are being added to it.
+
+        wirings = self._wirings
+        if type(wirings) is not _PendingWirings:
+            return wirings
+        with _pending_lock:
+            wirings = self._wirings
+            if type(wirings) is _PendingWirings:
+                wirings = self._wirings = wirings.build()
+        return wirings
+
+
+    def _index(self, wirings):
+
+        # Returns the `wirings` list's `WiringIndex`, building it if needed:
+        # lists are replaced, never mutated, other than appended to, changing
+        # their length.
+
+        index = self._wiring_index
+        if index is None or index.wirings is not wirings or index.length != len(wirings):
+            index = self._wiring_index = _routing.WiringIndex(wirings)
+        return index
 
 
     @property
     def wirings(self):
         """
-        List of ``(<function>, <args>, <kwargs>)`` wiring tuples, in wiring
+        List of ``(<function>, <args>, <kwargs>)`` wiring tuples, in call
         order, where ``<args>`` and ``<kwargs>`` are the wire-time arguments
         passed to :meth:`wire`.
+
+        Wirings added via :meth:`with_options` have their options as
+        attributes, like ``key``; call order is by descending ``priority``,
+        then wiring order.
         """
-        return list(self._wirings)
+        return list(self._current_wirings())
+
+
+    @property
+    def is_wired(self):
+        """
+        ``True`` if there is at least one wiring, ``False`` otherwise.
+
+        Cheap to check: useful to skip building expensive call-time arguments
+        for unwired callables; see also :meth:`call_lazy`.
+        """
+        return bool(self._wirings)
+
+
+    def call_lazy(self, thunk):
+        """
+        Calls ``thunk``, with no arguments, only if there are wirings, then
+        calls self with its result as the single positional call-time
+        argument, shared by all wirings; otherwise, calls self with no
+        arguments.
+
+        :returns: See :meth:`__call__`.
+        :raises: See :meth:`__call__`; exceptions raised by ``thunk`` are
+                 propagated.
+        """
+        if not self._wirings:
+            return self()
+
+        try:
+            payload = thunk()
+        except Exception:
+            # Call-time settings are single use: discard them.
+            self._calltime_settings.clear()
+            raise
+
+        return self(payload)
 
 
     def __call__(self, *args, **kwargs):
         """
-        Calls wired callables, in wiring order.
+        Calls wired callables, in :attr:`wirings` order.
 
         :raises ValueError: If the wiring count is lower than
                             :attr:`min_wirings`, when set to an ``int`` > 0.
@@ -377,10 +989,11 @@ class WiresCallable(object):
         * :attr:`ignore_exceptions`: if ``False``, calling wirings stops on the
           first wiring-raised exception; otherwise, all wirings will be called.
 
-        :returns: A list of ``(<exception>, <result>)`` tuples, in wiring order,
+        :returns: A list of ``(<exception>, <result>)`` tuples, in call order,
                   where: ``<exception>`` is ``None`` and ``<result>`` holds the
                   returned value from that wiring, if no exception was raised;
-                  otherwise, ``<exception>`` is the raised exception and
+                  otherwise, ``<exception>`` is the raised exception, or a
+                  record of it, depending on :attr:`exception_detail`, and
                   ``<result>`` is ``None``.
 
         :raises RuntimeError: Only if :attr:`returns` is ``True``,
@@ -392,29 +1005,134 @@ class WiresCallable(object):
                               ``<exception>`` as a non-``None`` value.
         """
 
+        wirings = self._wirings
+        if type(wirings) is list:
+            return self._call(wirings, args, kwargs, self._dispatch)
+
+        if type(wirings) is _PendingWirings:
+            wirings = self._current_wirings()
+            if type(wirings) is list:
+                return self._call(wirings, args, kwargs, self._dispatch)
+
+        selected = self._index(wirings).select(wirings, args, kwargs)
+        return self._call(selected, args, kwargs, self._dispatch_options)
+
+
+    def call_key(self, key, *args, **kwargs):
+        """
+        Calls the wired callables whose routing key is ``key``, plus those
+        with no key, in :attr:`wirings` order; otherwise, like :meth:`__call__`.
+
+        Wirings with a routing key are added via :meth:`with_options`;
+        finding those for ``key`` is a single dict lookup, regardless of how
+        many other keys there are.
+
+        ``key`` is not passed to hooks, nor forwarded by transports: hooks,
+        like :class:`Recorder <wires._recorder.Recorder>`, see a plain call
+        with the remaining arguments, and transports deliver one, calling
+        all remote wirings.
+
+        :raises TypeError: If ``key`` is not hashable.
+        """
+        wirings = self._current_wirings()
+        index = self._index(wirings)
+        selected = index.select(index.route(key), args, kwargs)
+        if type(wirings) is list:
+            return self._call(selected, args, kwargs, self._dispatch)
+        return self._call(selected, args, kwargs, self._dispatch_options)
+
+
+    def _call(self, wirings, args, kwargs, dispatch):
+
+        # Calls `wirings`, a selection of the current ones, through
+        # `dispatch`, one of the `_dispatch*` methods.
+
+        # Settings for this call: like `_effective_setting`, merging the
+        # three levels only if there are call-time or per-callable ones.
+        calltime_settings = self._calltime_settings
+        if calltime_settings or self._callable_settings:
+            settings = dict(self._wires_settings)
+            settings.update(self._callable_settings)
+            settings.update(calltime_settings)
+        else:
+            settings = self._wires_settings
+
         # Calling with wiring count < `min_wirings`, if set, is an error.
-        min_wirings = self.min_wirings
+        min_wirings = settings['min_wirings']
         if min_wirings and len(self._wirings) < min_wirings:
             raise ValueError('less than min_wirings wired')
 
-        # Get call coupling behaviour for this call from our Wires, resetting
-        # it, to account for correct "default" vs "overridden" behaviour.
-        return_or_raise = self.returns
-        ignore_exceptions = self.ignore_exceptions
-        self._calltime_settings.clear()
+        # Get call coupling behaviour for this call, resetting call-time
+        # settings, to account for correct "default" vs "overridden" behaviour.
+        return_or_raise = settings['returns']
+        ignore_exceptions = settings['ignore_exceptions']
+        exception_detail = settings['exception_detail']
+        timeout = settings['timeout']
+        if calltime_settings:
+            calltime_settings.clear()
+
+        # Calls with a timeout call each wiring with the remaining time.
+        if timeout is not None:
+            dispatch = functools.partial(
+                self._dispatch_options, deadline=_timeout._clock() + timeout,
+            )
+
+        # Attached hooks, if any, are called around each wiring call; they
+        # get to decide whether they're interested in this call first.
+        hooks = self._wires._hooks
+        if hooks:
+            entered = []
+            try:
+                for hook in hooks:
+                    if hook.enter(self, args, kwargs):
+                        entered.append(hook)
+            except Exception:
+                # Hooks already entered still get to leave.
+                for hook in reversed(entered):
+                    hook.leave(self)
+                raise
+            hooks = entered
+            if hooks:
+                try:
+                    return dispatch(
+                        wirings, args, kwargs, return_or_raise,
+                        ignore_exceptions, exception_detail, hooks,
+                    )
+                finally:
+                    for hook in reversed(hooks):
+                        hook.leave(self)
+
+        return dispatch(
+            wirings, args, kwargs, return_or_raise, ignore_exceptions,
+            exception_detail, hooks,
+        )
+
+
+    def _dispatch(self, wirings, args, kwargs, return_or_raise,
+                  ignore_exceptions, exception_detail, hooks):
+
+        # Calls each of `wirings` with `args` and `kwargs` as call-time
+        # arguments, honoring the given call coupling behaviour.
 
         # Will contain (<exception>, <result>) per-wiring tuples.
         call_result = []
 
-        for wired_callable, wire_args, wire_kwargs in self._wirings:
+        for wired_callable, wire_args, wire_kwargs in wirings:
             try:
                 combined_args = list(wire_args)
                 combined_args.extend(args)
                 combined_kwargs = dict(wire_kwargs)
                 combined_kwargs.update(kwargs)
-                wired_result = wired_callable(*combined_args, **combined_kwargs)
+                if hooks:
+                    wired_result = self._hooked_call(
+                        hooks, wired_callable, combined_args, combined_kwargs,
+                    )
+                else:
+                    wired_result = wired_callable(*combined_args, **combined_kwargs)
                 call_result.append((None, wired_result))
             except Exception as wired_exception:
+                if exception_detail != 'full':
+                    wired_exception = _failures.record(wired_exception, exception_detail)
                 call_result.append((wired_exception, None))
                 if not ignore_exceptions:
                     if return_or_raise:
@@ -425,6 +1143,100 @@ class WiresCallable(object):
         return call_result if return_or_raise else None
 
 
+    def _dispatch_options(self, wirings, args, kwargs, return_or_raise,
+                          ignore_exceptions, exception_detail, hooks,
+                          deadline=None):
+
+        # Like `_dispatch`, for wirings with options, or calls with a
+        # `deadline`, a `_timeout._clock` time.
+
+        call_result = []
+
+        if hooks:
+            call = functools.partial(self._hooked_call, hooks)
+        else:
+            call = _plain_call
+
+        for wiring in wirings:
+            wired_callable, wire_args, wire_kwargs = wiring
+            breaker = getattr(wiring, 'breaker', None)
+            timeout = getattr(wiring, 'timeout', None)
+            if deadline is not None:
+                remaining = deadline - _timeout._clock()
+                if timeout is None or remaining < timeout:
+                    timeout = remaining
+            if timeout is not None and timeout <= 0:
+                # Out of time: not called, as if timed out.
+                wired_exception = _timeout.WiringTimeout(wired_callable)
+            elif breaker is not None and not breaker.allow(wired_callable):
+                # Skipped, as if failed, without raising.
+                wired_exception = _breaker.CircuitOpen(wired_callable)
+            else:
+                if timeout is None:
+                    wiring_call = call
+                elif hooks:
+                    # Hooks are called on this thread, around the wait.
+                    wiring_call = functools.partial(
+                        self._hooked_call, hooks,
+                        call=_timeout.timed_call(_plain_call, timeout),
+                    )
+                else:
+                    wiring_call = _timeout.timed_call(_plain_call, timeout)
+                try:
+                    combined_args = list(wire_args)
+                    combined_args.extend(args)
+                    combined_kwargs = dict(wire_kwargs)
+                    combined_kwargs.update(kwargs)
+                    memoize = getattr(wiring, 'memoize', None)
+                    if memoize is not None:
+                        wired_result = memoize.call(
+                            wiring_call, wired_callable, combined_args, combined_kwargs,
+                        )
+                    else:
+                        wired_result = wiring_call(wired_callable, combined_args, combined_kwargs)
+                except Exception as exception:
+                    wired_exception = exception
+                    if breaker is not None:
+                        breaker.failed(wired_callable)
+                else:
+                    if breaker is not None:
+                        breaker.succeeded(wired_callable)
+                    call_result.append((None, wired_result))
+                    continue
+
+            if exception_detail != 'full':
+                wired_exception = _failures.record(wired_exception, exception_detail)
+            call_result.append((wired_exception, None))
+            if not ignore_exceptions:
+                if return_or_raise:
+                    raise RuntimeError(*call_result)
+                else:
+                    break
+
+        return call_result if return_or_raise else None
+
+
+    def _hooked_call(self, hooks, wired_callable, args, kwargs, call=None):
+
+        # Calls `wired_callable`, or `call` with the same arguments, if given,
+        # letting each hook in `hooks` know about it.
+
+        for hook in hooks:
+            hook.before(self, wired_callable)
+        try:
+            if call is None:
+                wired_result = wired_callable(*args, **kwargs)
+            else:
+                wired_result = call(wired_callable, args, kwargs)
+        except Exception as wired_exception:
+            for hook in hooks:
+                hook.exception(self, wired_callable, wired_exception)
+            raise
+        for hook in hooks:
+            hook.after(self, wired_callable, wired_result)
+        return wired_result
+
+
     def __len__(self):
         """
         Wiring count.
@@ -0,0 +1,251 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires disabled :class:`Wires <wires._wires.Wires>` support.
+
+Disabled :class:`Wires <wires._wires.Wires>` objects, created with
+``enabled=False``, are instances of :class:`DisabledWires`, keeping the full
+wiring API in place while never calling any wirings:
+
+>>> w = Wires(enabled=False)
+>>> w.one_callable.wire(print, 'hi')    # Recorded...
+>>> w.one_callable('world')             # ...but never called.
+>>> w.one_callable.wirings
+[(<built-in function print>, ('hi',), {})]
+
+Callables are plain instance attributes after first access, avoiding any
+further :meth:`Wires.__getattr__ <wires._wires.Wires.__getattr__>` overhead,
+and calling them costs little more than calling an empty function. Call-time
+settings overrides are ignored, other than ``returns``, deciding what calling
+returns:
+
+>>> w(returns=True).one_callable('world')
+[]
+
+The shared :data:`wires.w` instance is disabled if the ``WIRES_DISABLED``
+environment variable is set to a non-empty value, other than ``0``, when
+:mod:`wires` is first imported.
+"""
+
+from . import _callable, _wires
+
+
+
+class DisabledCallable(_callable.WiresCallable):
+
+    """
+    :class:`WiresCallable <wires._callable.WiresCallable>` that records
+    wirings, but never calls them.
+    """
+
+    def __init__(self, _wires, _name, _wires_settings):
+
+        super(DisabledCallable, self).__init__(_wires, _name, _wires_settings)
+
+        # What calling returns, given the effective `returns` setting, kept
+        # up to date by our `returns` setter and `set` method.
+        self._returns_list = bool(_wires_settings['returns'])
+
+
+    def _set_returns(self, value):
+
+        self._callable_settings['returns'] = value
+        self._returns_list = bool(value)
+
+
+    returns = _callable.WiresCallable.returns.setter(_set_returns)
+
+
+    def set(self, *args, **kwargs):
+        """
+        Like :meth:`WiresCallable.set <wires._callable.WiresCallable.set>`.
+        """
+        super(DisabledCallable, self).set(*args, **kwargs)
+        self._returns_list = bool(self._callable_settings.get(
+            'returns', self._wires_settings['returns'],
+        ))
+
+
+    @property
+    def is_wired(self):
+        """
+        Always ``False``: wirings are never called.
+        """
+        return False
+
+
+    def call_lazy(self, thunk):
+        """
+        Like calling: ``thunk`` is never called.
+        """
+        return [] if self._returns_list else None
+
+
+    def __call__(self, *args, **kwargs):
+        """
+        Calls nothing, returning an empty list, if :attr:`returns` is ``True``,
+        or ``None``, otherwise.
+        """
+        return [] if self._returns_list else None
+
+
+    def call_key(self, key, *args, **kwargs):
+        """
+        Like calling.
+        """
+        return [] if self._returns_list else None
+
+
+
+class _CallTimeCallable(object):
+
+    # A `DisabledCallable` as seen through a `_CallTimeWires`: calling it
+    # returns as per the call-time `returns` setting.
+
+    __slots__ = ('_wires_callable', '_returns_list')
+
+    def __init__(self, wires_callable, returns_list):
+
+        self._wires_callable = wires_callable
+        self._returns_list = returns_list
+
+
+    def __getattr__(self, name):
+
+        return getattr(self._wires_callable, name)
+
+
+    def __call__(self, *args, **kwargs):
+
+        return [] if self._returns_list else None
+
+
+    def call_lazy(self, thunk):
+
+        return [] if self._returns_list else None
+
+
+    def call_key(self, key, *args, **kwargs):
+
+        return [] if self._returns_list else None
+
+
+
+class _CallTimeWires(object):
+
+    # What calling a `DisabledWires` with a call-time `returns` setting
+    # returns: callables accessed through it honor it.
+
+    __slots__ = ('_wires', '_returns_list')
+
+    def __init__(self, wires, returns_list):
+
+        self._wires = wires
+        self._returns_list = returns_list
+
+
+    def __getattr__(self, name):
+
+        if name[:2] == '__' and name[-2:] == '__':
+            raise AttributeError(name)
+        return _CallTimeCallable(self._wires[name], self._returns_list)
+
+
+    def __getitem__(self, name):
+
+        return _CallTimeCallable(self._wires[name], self._returns_list)
+
+
+
+class DisabledWires(_wires.Wires):
+
+    """
+    :class:`Wires <wires._wires.Wires>` whose callables never call their
+    wirings. Create them with ``Wires(enabled=False)``.
+    """
+
+    def __repr__(self):
+
+        return '%s(%s)' % (
+            _wires.Wires.__name__,
+            ', '.join(
+                ['%s=%r' % (k, v) for k, v in self._settings.items()] +
+                ['enabled=False']
+            ),
+        )
+
+
+    def __getattr__(self, name):
+
+        # Only called on first access: from then on, the callable is found
+        # as a regular instance attribute.
+
+        if name[:2] == '__' and name[-2:] == '__':
+            raise AttributeError(name)
+        if name in _wires._STATE_ATTRIBUTES:
+            raise AttributeError(name)
+
+        try:
+            the_callable = self._callables[name]
+        except KeyError:
+            the_callable = DisabledCallable(
+                _wires=self,
+                _name=name,
+                _wires_settings=self._settings,
+            )
+            self._callables[name] = the_callable
+
+        self.__dict__[name] = the_callable
+        return the_callable
+
+
+    def _restore_callable(self, name, callable_settings, wirings):
+
+        wires_callable = super(DisabledWires, self)._restore_callable(
+            name, callable_settings, wirings,
+        )
+        wires_callable._returns_list = bool(wires_callable.returns)
+        return wires_callable
+
+
+    def __getitem__(self, name):
+
+        try:
+            return self._callables[name]
+        except KeyError:
+            return self.__getattr__(name)
+
+
+    def __delattr__(self, name):
+
+        try:
+            del self._callables[name]
+        except KeyError:
+            super(DisabledWires, self).__delattr__(name)
+        else:
+            self.__dict__.pop(name, None)
+
+
+    def __dir__(self):
+
+        # Callables are both in `_callables` and in `__dict__`: dedupe.
+        return sorted(set(super(DisabledWires, self).__dir__()))
+
+
+    def __call__(self, returns=None, ignore_exceptions=None,
+                 exception_detail=None, timeout=None):
+        """
+        Call-time settings are ignored, other than ``returns``, deciding what
+        calling returns.
+        """
+        if returns is None:
+            return self
+        return _CallTimeWires(self, bool(returns))
+
+
+# ----------------------------------------------------------------------------
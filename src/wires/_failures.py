@@ -0,0 +1,124 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`WiringFailure` Class.
+
+Wiring raised exceptions hold their traceback which, in turn, holds every
+frame it went through, along with all their local variables: keeping such
+exceptions in call results keeps all of that alive.
+
+The ``exception_detail`` setting, available at the
+:class:`Wires <wires._wires.Wires>`,
+:class:`WiresCallable <wires._callable.WiresCallable>` and call-time levels,
+controls what call results and call raised ``RuntimeError`` arguments hold in
+place of wiring raised exceptions:
+
+* ``'full'``: the exception itself, the default.
+* ``'no_traceback'``: the exception itself, with its traceback, and that of
+  any chained exceptions, dropped.
+* ``'compact'``: a :class:`WiringFailure` holding the exception type and
+  message.
+* ``'summary'``: like ``'compact'``, adding a traceback summary, holding no
+  frames, with source lines read only when formatted.
+
+>>> w = Wires(returns=True, exception_detail='summary')
+>>> w.one_callable.wire(int, 'not a number')
+>>> [(failure, _)] = w.one_callable()
+>>> failure
+<WiringFailure ValueError: invalid literal for int() with base 10: 'not a number'>
+>>> failure.type is ValueError
+True
+"""
+
+import traceback
+
+
+
+EXCEPTION_DETAILS = ('full', 'no_traceback', 'compact', 'summary')
+
+
+
+class WiringFailure(object):
+
+    """
+    Compact record of a wiring raised exception.
+    """
+
+    __slots__ = ('type', 'message', 'summary')
+
+    def __init__(self, exception_type, message, summary=None):
+
+        # The exception's class and str().
+        self.type = exception_type
+        self.message = message
+
+        # A traceback.StackSummary or None.
+        self.summary = summary
+
+
+    def __repr__(self):
+
+        return '<%s %s: %s>' % (
+            self.__class__.__name__, self.type.__name__, self.message,
+        )
+
+
+    def format_traceback(self):
+        """
+        Returns the formatted traceback summary, like the standard Python
+        ``Traceback (most recent call last):`` lines, or an empty string if
+        no summary is available.
+        """
+        if self.summary is None:
+            return ''
+        lines = ['Traceback (most recent call last):\n']
+        lines.extend(self.summary.format())
+        type_name = self.type.__name__
+        if self.type.__module__ not in ('builtins', '__main__'):
+            type_name = '%s.%s' % (self.type.__module__, type_name)
+        if self.message:
+            lines.append('%s: %s\n' % (type_name, self.message))
+        else:
+            lines.append('%s\n' % (type_name,))
+        return ''.join(lines)
+
+
+
+def _drop_tracebacks(exception):
+
+    # Drops the traceback of `exception` and of its chained exceptions.
+
+    seen = set()
+    while exception is not None and id(exception) not in seen:
+        seen.add(id(exception))
+        exception.__traceback__ = None
+        exception = exception.__cause__ or exception.__context__
+
+
+
+def record(exception, exception_detail):
+    """
+    Returns what call results should hold for ``exception``, given the
+    ``exception_detail`` setting.
+    """
+    if exception_detail == 'no_traceback':
+        _drop_tracebacks(exception)
+        return exception
+
+    if exception_detail == 'summary':
+        summary = traceback.StackSummary.extract(
+            traceback.walk_tb(exception.__traceback__),
+            lookup_lines=False,
+        )
+    else:
+        summary = None
+
+    return WiringFailure(type(exception), str(exception), summary)
+
+
+# ----------------------------------------------------------------------------
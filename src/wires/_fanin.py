@@ -0,0 +1,218 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`FanIn` Class.
+
+Gives :mod:`multiprocessing` and :mod:`concurrent.futures` worker processes a
+proxy :class:`Wires <wires._wires.Wires>` object: calls to its callables are
+batched and shipped back to the parent process, where they are dispatched to
+the parent's :class:`Wires <wires._wires.Wires>` object's callables of the
+same name:
+
+>>> w.progress.wire(print)
+>>> fan_in = FanIn(w)
+>>> with multiprocessing.Pool(initializer=fan_in.initializer,
+...                           initargs=fan_in.initargs) as pool:
+...     pool.map(work, items)
+...     pool.close()
+...     pool.join()
+>>> fan_in.close()
+
+Where ``work`` runs in worker processes:
+
+>>> def work(item):
+...     w = FanIn.worker_wires()
+...     w.progress(item)                # Dispatched in the parent.
+
+Each worker queues calls, sending one batch per ``max_batch`` calls, every
+``flush_interval`` seconds, and at worker exit. The parent dispatches them
+from a background thread, in batch order: calls from any one worker keep
+their order. Arguments must be picklable.
+"""
+
+import multiprocessing
+import threading
+
+from multiprocessing import util
+
+from . import _forward, _wires
+
+
+
+# This process's proxy Wires, if a FanIn worker.
+_worker_wires = None
+
+
+
+class _Sender(object):
+
+    # Worker side call batching.
+
+    def __init__(self, queue, max_batch, flush_interval):
+
+        self._queue = queue
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending = []
+
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name='wires-fan-in-flusher',
+        )
+        self._flusher.daemon = True
+        self._flusher.start()
+
+        # Runs at worker exit, before the queue's own finalizers, with
+        # priority 10, stop its feeder thread.
+        util.Finalize(self, self.flush, exitpriority=100)
+
+
+    def _flush_periodically(self, flush_interval):
+
+        event = threading.Event()
+        while not event.wait(flush_interval):
+            self.flush()
+
+
+    # Queue puts, which only buffer data for the queue's feeder thread, are
+    # done holding the lock: the exit time flush must not miss a batch taken
+    # by the, then killed, daemon flusher thread.
+
+    def send(self, name, args, kwargs):
+
+        with self._lock:
+            self._pending.append((name, args, kwargs))
+            if len(self._pending) >= self._max_batch:
+                self._queue.put(self._pending)
+                self._pending = []
+
+
+    def flush(self):
+
+        with self._lock:
+            if self._pending:
+                self._queue.put(self._pending)
+                self._pending = []
+
+
+
+class _ProxyWires(_wires.Wires):
+
+    # Wires whose callables are auto-wired to forward calls to the parent.
+
+    def __init__(self, sender):
+
+        super(_ProxyWires, self).__init__()
+        self._sender = sender
+
+
+    def __getattr__(self, name):
+
+        new = name not in self._callables
+        the_callable = super(_ProxyWires, self).__getattr__(name)
+        if new:
+            _forward.forward(the_callable, self._sender.send)
+        return the_callable
+
+
+
+def _initialize_worker(queue, max_batch, flush_interval, initializer, initargs):
+
+    global _worker_wires
+    _worker_wires = _ProxyWires(_Sender(queue, max_batch, flush_interval))
+    if initializer is not None:
+        initializer(*initargs)
+
+
+
+class FanIn(object):
+
+    """
+    Worker to parent call delivery, for process pools.
+    """
+
+    def __init__(self, wires, max_batch=256, flush_interval=0.05,
+                 context=None, initializer=None, initargs=()):
+        """
+        :param wires: Where to dispatch worker calls to, in the parent.
+        :type wires: :class:`Wires <wires._wires.Wires>`
+
+        :param max_batch: Per worker pending call count triggering a send.
+        :type max_batch: ``int`` > 0
+
+        :param flush_interval: Seconds between per worker sends of pending
+                               calls.
+        :type flush_interval: ``float``
+
+        :param context: The :mod:`multiprocessing` context the pool uses.
+
+        :param initializer: Additional worker initializer, called with
+                            ``initargs``, for pools that need their own.
+        """
+        if max_batch < 1:
+            raise ValueError('max_batch must be positive')
+
+        self._wires = wires
+        self._queue = (context or multiprocessing).Queue()
+
+        # Dispatch raised exception count.
+        self.errors = 0
+
+        self.initargs = (self._queue, max_batch, flush_interval, initializer, initargs)
+
+        self._receiver = threading.Thread(
+            target=self._receive,
+            name='wires-fan-in-receiver',
+        )
+        self._receiver.daemon = True
+        self._receiver.start()
+
+
+    # Pass as the pool initializer, with `initargs` as its arguments.
+    initializer = staticmethod(_initialize_worker)
+
+
+    @staticmethod
+    def worker_wires():
+        """
+        Returns the proxy :class:`Wires <wires._wires.Wires>` object, in
+        worker processes.
+
+        :raises RuntimeError: If not in a :class:`FanIn` initialized worker.
+        """
+        if _worker_wires is None:
+            raise RuntimeError('not a FanIn worker process')
+        return _worker_wires
+
+
+    def _receive(self):
+
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            for name, args, kwargs in batch:
+                try:
+                    _forward.deliver(self._wires, name, args, kwargs)
+                except Exception:
+                    self.errors += 1
+
+
+    def close(self):
+        """
+        Dispatches calls received so far and stops receiving: call after
+        the pool's workers have exited.
+        """
+        self._queue.put(None)
+        self._receiver.join()
+        self._queue.close()
+        self._queue.join_thread()
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,73 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires call forwarding support.
+
+Transports deliver calls to :class:`Wires <wires._wires.Wires>` objects
+elsewhere, by wiring a :class:`Forwarder` to each local
+:class:`WiresCallable <wires._callable.WiresCallable>` whose calls are to be
+delivered: calling it hands the callable name and call-time arguments over to
+the transport. Routing keys, from
+:meth:`call_key <wires._callable.WiresCallable.call_key>` calls, are not
+forwarded: delivered calls call all the remote callable's wirings.
+"""
+
+
+
+
+class Forwarder(object):
+
+    """
+    Wiring that forwards calls to a transport.
+    """
+
+    __slots__ = ('name', '_send')
+
+    def __init__(self, send, name):
+
+        # The remote callable name.
+        self.name = name
+
+        # Called with (<name>, <args>, <kwargs>) per call.
+        self._send = send
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self.name)
+
+
+    def __call__(self, *args, **kwargs):
+
+        self._send(self.name, args, kwargs)
+
+
+
+def forward(wires_callable, send, name=None):
+    """
+    Wires a :class:`Forwarder` calling ``send`` to ``wires_callable``, and
+    returns it, for later unwiring.
+
+    :param name: The remote callable name, defaulting to that of
+                 ``wires_callable``.
+    """
+    forwarder = Forwarder(send, wires_callable.__name__ if name is None else name)
+    wires_callable.wire(forwarder)
+    return forwarder
+
+
+
+def deliver(wires, name, args, kwargs):
+    """
+    Calls the ``name`` callable in ``wires`` with ``args`` and ``kwargs``:
+    what receiving transports do.
+    """
+    return wires[name](*args, **kwargs)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,116 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`WiresHook` Class.
+
+:class:`WiresHook`\\s are attached to :class:`Wires <wires._wires.Wires>`
+objects and get called around each call to any of its
+:class:`WiresCallable <wires._callable.WiresCallable>`\\s and, if interested
+in that call, around each of its wiring calls:
+
+>>> class PrintingHook(WiresHook):
+...     def before(self, wires_callable, function):
+...         print('calling', wires_callable.__name__)
+>>> w = Wires()
+>>> w.one_callable.wire(print, 'hi')
+>>> hook = PrintingHook()
+>>> hook.attach(w)
+>>> w.one_callable()
+calling one_callable
+hi
+>>> hook.detach(w)
+
+Hooks should not raise exceptions: if they do, those raised by
+:meth:`WiresHook.before`, :meth:`WiresHook.after` and :meth:`WiresHook.exception`
+are handled as if raised by the wiring being called, while those raised by
+:meth:`WiresHook.enter` and :meth:`WiresHook.leave` propagate to the caller;
+hooks already entered still get their :meth:`WiresHook.leave` call.
+"""
+
+
+
+
+class WiresHook(object):
+
+    """
+    :class:`WiresHook` Base Class.
+
+    Subclasses override one or more of :meth:`enter`, :meth:`leave`,
+    :meth:`before`, :meth:`after` and :meth:`exception`, which, by default, do
+    nothing other than having :meth:`enter` declare interest in every call.
+    """
+
+    def attach(self, wires):
+        """
+        Attaches this hook to ``wires``, a :class:`Wires <wires._wires.Wires>`
+        object.
+
+        :raises ValueError: If already attached to ``wires``.
+        """
+        if self in wires._hooks:
+            raise ValueError('hook already attached')
+
+        # Rebind instead of mutating: in-progress calls keep iterating the
+        # previous hooks.
+        wires._hooks = wires._hooks + (self,)
+
+
+    def detach(self, wires):
+        """
+        Detaches this hook from ``wires``, a :class:`Wires <wires._wires.Wires>`
+        object.
+
+        :raises ValueError: If not attached to ``wires``.
+        """
+        if self not in wires._hooks:
+            raise ValueError('hook not attached')
+
+        wires._hooks = tuple(h for h in wires._hooks if h is not self)
+
+
+    def enter(self, wires_callable, args, kwargs):
+        """
+        Called when ``wires_callable`` is called with ``args`` and ``kwargs``,
+        before any of its wirings are; for
+        :meth:`call_key <wires._callable.WiresCallable.call_key>` calls, the
+        routing key is not passed.
+
+        :returns: ``True`` if interested in this call, in which case
+                  :meth:`before`, :meth:`after`, :meth:`exception` will be
+                  called for each of its wirings, followed by :meth:`leave`;
+                  ``False`` otherwise.
+        """
+        return True
+
+
+    def leave(self, wires_callable):
+        """
+        Called when an interesting ``wires_callable`` call completes, whether
+        it returns or raises.
+        """
+
+
+    def before(self, wires_callable, function):
+        """
+        Called before ``wires_callable`` calls its wired ``function``.
+        """
+
+
+    def after(self, wires_callable, function, result):
+        """
+        Called after ``wires_callable``'s wired ``function`` returns ``result``.
+        """
+
+
+    def exception(self, wires_callable, function, exception):
+        """
+        Called after ``wires_callable``'s wired ``function`` raises ``exception``.
+        """
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires import path wirings.
+
+:meth:`wire <wires._callable.WiresCallable.wire>` and
+:meth:`unwire <wires._callable.WiresCallable.unwire>` accept
+``'<module>:<attribute>'`` import path strings in place of callables: the
+module is imported, and the attribute looked up, on first call, not at wiring
+time, keeping start up cheap when subscribers live in modules that are slow
+to import:
+
+>>> w = Wires()
+>>> w.one_callable.wire('myapp.audit:record', 'wire-time')
+>>> w.one_callable.wirings
+[(<ImportPath 'myapp.audit:record'>, ('wire-time',), {})]
+
+Import or lookup failures are raised when calling, like any other wiring
+raised exception, and resolution is retried on the next call. Unwiring
+requires the same import path string: import path wirings are not matched by
+the callable they resolve to.
+
+:func:`wire_table` wires a whole declarative table of import path wirings,
+such as one loaded from a JSON or a Python module, at once:
+
+>>> wire_table(w, {
+...     'user_created': ['myapp.audit:record', 'myapp.mail:welcome'],
+...     'user_deleted': [('myapp.audit:record', ['deleted'])],
+... })
+"""
+
+import importlib
+
+
+
+class ImportPath(object):
+
+    """
+    Callable proxy to the ``'<module>:<attribute>'`` import path target,
+    resolved on first call. Compares equal to other :class:`ImportPath`
+    objects with the same :attr:`path`.
+    """
+
+    __slots__ = ('path', '_module_name', '_attribute_names', '_target')
+
+    def __init__(self, path):
+        """
+        :param path: A ``'<module>:<attribute>'`` import path, where
+                     ``<module>`` is an absolute module name and
+                     ``<attribute>`` a dotted attribute name.
+        :type path: ``str``
+
+        :raises ValueError: If ``path`` is not an import path.
+        """
+        module_name, colon, attribute_name = path.partition(':')
+        attribute_names = attribute_name.split('.')
+        if not colon or not module_name or not all(attribute_names):
+            raise ValueError('invalid import path: %r' % (path,))
+
+        self.path = path
+        self._module_name = module_name
+        self._attribute_names = attribute_names
+
+        # The resolved callable, once resolved.
+        self._target = None
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self.path)
+
+
+    def __reduce__(self):
+
+        # Pickled and copied unresolved.
+        return (self.__class__, (self.path,))
+
+
+    def __eq__(self, other):
+
+        if not isinstance(other, ImportPath):
+            return NotImplemented
+        return self.path == other.path
+
+
+    def __ne__(self, other):
+
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+
+    def __hash__(self):
+
+        return hash(self.path)
+
+
+    @property
+    def resolved(self):
+        """
+        ``True`` if the import path target has been resolved.
+        """
+        return self._target is not None
+
+
+    def resolve(self):
+        """
+        Imports the module and looks up the attribute, once, returning the
+        resolved callable.
+
+        :raises ImportError: If the module can't be imported.
+        :raises AttributeError: If the attribute can't be found.
+        :raises TypeError: If the attribute is not :func:`callable`.
+        """
+        target = self._target
+        if target is None:
+            target = importlib.import_module(self._module_name)
+            for attribute_name in self._attribute_names:
+                target = getattr(target, attribute_name)
+            if not callable(target):
+                raise TypeError('import path target not callable: %r' % (self.path,))
+            self._target = target
+        return target
+
+
+    def __call__(self, *args, **kwargs):
+
+        target = self._target
+        if target is None:
+            target = self.resolve()
+        return target(*args, **kwargs)
+
+
+
+def wire_table(wires, table):
+    """
+    Wires each callable in ``wires`` to the wirings in ``table``.
+
+    :param wires: The object whose callables are wired.
+    :type wires: :class:`Wires <wires._wires.Wires>`
+
+    :param table: Maps callable names to sequences of wirings, each either a
+                  function, an import path string, or a
+                  ``(<function>, <args>)`` or ``(<function>, <args>, <kwargs>)``
+                  sequence, where ``<function>`` is a function or an import
+                  path string, and ``<args>`` and ``<kwargs>`` are wire-time
+                  arguments.
+    :type table: ``dict``
+
+    :raises: See :meth:`wire_many <wires._callable.WiresCallable.wire_many>`,
+             used once per callable; callables preceding the failing one
+             keep their new wirings.
+    """
+    for name, wirings in table.items():
+        wires[name].wire_many(wirings)
+
+
+# ----------------------------------------------------------------------------
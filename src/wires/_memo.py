@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`MemoCache` Class.
+
+Wirings to pure functions, whose results depend only on their arguments, may
+have their results cached: calling the wiring again with equal, hashable,
+combined wire-time and call-time arguments returns the cached result,
+without calling the function:
+
+>>> w.price.with_options(memoize=MemoCache(maxsize=1000, ttl=60)).wire(lookup)
+
+Caches evict the least recently used result beyond ``maxsize`` results, and
+never return results older than ``ttl`` seconds, if given. A single cache may
+be shared by all of a :class:`WiresCallable <wires._callable.WiresCallable>`'s
+wirings: cached results are keyed by wired function, too. Raised exceptions
+are not cached, and calls with unhashable arguments are not cached, nor
+counted as hits or misses. Wiring hooks are not called on cache hits.
+"""
+
+import collections
+import threading
+import time
+
+
+
+_clock = time.monotonic
+
+
+
+class MemoCache(object):
+
+    """
+    Bounded, thread safe, wiring result cache.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        """
+        :param maxsize: Maximum cached result count, or ``None``, meaning no
+                        limit.
+        :type maxsize: ``int`` > 0 or ``None``
+
+        :param ttl: Seconds results are cached for, or ``None``, meaning no
+                    limit.
+        :type ttl: ``float`` > 0 or ``None``
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be positive or None')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive or None')
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+        # {<key>: (<result>, <expiry time or None>)}, least recently used first.
+        self._results = collections.OrderedDict()
+
+        # Cached and computed result counts.
+        self.hits = 0
+        self.misses = 0
+
+
+    def __repr__(self):
+
+        return '<%s maxsize=%r ttl=%r hits=%r misses=%r>' % (
+            self.__class__.__name__, self._maxsize, self._ttl, self.hits,
+            self.misses,
+        )
+
+
+    def __reduce__(self):
+
+        # Pickled and copied empty.
+        return (self.__class__, (self._maxsize, self._ttl))
+
+
+    def __len__(self):
+
+        return len(self._results)
+
+
+    def clear(self):
+        """
+        Discards all cached results; keeps the hit and miss counts.
+        """
+        with self._lock:
+            self._results.clear()
+
+
+    def call(self, call, function, args, kwargs):
+        """
+        Returns the cached result for ``function`` with ``args`` and
+        ``kwargs``, or the result of ``call(function, args, kwargs)``,
+        caching it.
+        """
+        try:
+            key = (function, tuple(args), tuple(sorted(kwargs.items())) if kwargs else ())
+            hash(key)
+        except TypeError:
+            return call(function, args, kwargs)
+
+        with self._lock:
+            try:
+                result, expiry = self._results[key]
+            except KeyError:
+                pass
+            else:
+                if expiry is None or expiry > _clock():
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._results[key]
+            self.misses += 1
+
+        result = call(function, args, kwargs)
+
+        expiry = None if self._ttl is None else _clock() + self._ttl
+        with self._lock:
+            self._results[key] = (result, expiry)
+            self._results.move_to_end(key)
+            if self._maxsize is not None and len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+        return result
+
+
+# ----------------------------------------------------------------------------
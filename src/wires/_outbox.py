@@ -0,0 +1,353 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`Outbox` Class.
+
+Defers calls to a :class:`Wires <wires._wires.Wires>` object's callables,
+persisting each to an append-only file before it is dispatched: calls not yet
+dispatched when the process stops, or crashes, are dispatched when an
+:class:`Outbox` is next created on the same file.
+
+>>> outbox = Outbox('/var/lib/app/billing.outbox', billing_wires)
+>>> outbox.forward(w.charge)            # w.charge calls go through the outbox,
+>>> w.charge(customer, amount)          # returning once persisted.
+
+Writes are group committed: a background thread writes and :func:`os.fsync`\\s
+all calls made while the previous commit was in progress, and during the
+optional ``commit_interval``, at once; callers wait for their call's commit,
+by default. Committed calls are then dispatched, in order, by a background
+thread, and an acknowledgement record is appended for each, committed along
+with the next group. Calls are dispatched at least once: those dispatched but
+not yet acknowledged when crashing are dispatched again.
+
+Each record is a 4 byte length, a 4 byte CRC32 and a :mod:`pickle`
+serialized payload: arguments must be picklable. A torn record at the end of
+the file, from a crash, is discarded on recovery. Acknowledged calls are
+only removed from the file by :meth:`Outbox.compact`.
+"""
+
+import collections
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+
+from . import _forward
+
+
+
+# Record header: payload length and CRC32.
+_HEADER = struct.Struct('<II')
+
+# Record kinds.
+_CALL = 'c'
+_ACK = 'a'
+
+
+
+def _encode(payload):
+
+    data = pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(data), zlib.crc32(data)) + data
+
+
+
+def _read_records(f):
+
+    # Yields payloads from `f`, stopping at the first incomplete or corrupt
+    # record; returns, via StopIteration, the offset of the valid data end.
+
+    offset = 0
+    while True:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return offset
+        size, crc = _HEADER.unpack(header)
+        data = f.read(size)
+        if len(data) < size or zlib.crc32(data) != crc:
+            return offset
+        yield pickle.loads(data)
+        offset += _HEADER.size + size
+
+
+
+class Outbox(object):
+
+    """
+    Durable, deferred, call dispatch.
+    """
+
+    def __init__(self, path, wires, commit_interval=0.0, background=True,
+                 retry_interval=1.0):
+        """
+        :param path: The outbox file path; created if needed, recovered
+                     otherwise.
+        :type path: ``str``
+
+        :param wires: Where calls are dispatched to.
+        :type wires: :class:`Wires <wires._wires.Wires>`
+
+        :param commit_interval: How long to wait, after a call is made, for
+                                others to be committed along with it.
+        :type commit_interval: ``float``
+
+        :param background: If ``True``, committed calls are dispatched by a
+                           background thread; otherwise, by :meth:`dispatch`.
+        :type background: ``bool``
+
+        :param retry_interval: How long the background thread waits before
+                               retrying a call whose dispatch raised.
+        :type retry_interval: ``float``
+        """
+        self._path = path
+        self._wires = wires
+        self._commit_interval = commit_interval
+        self._retry_interval = retry_interval
+
+        # Guards everything below, except the file, guarded by `_io_lock`.
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+
+        # Not yet acknowledged calls: {<id>: (<name>, <args>, <kwargs>)}.
+        self._pending = collections.OrderedDict()
+
+        # Ids of calls to dispatch, in order, and encoded records to write.
+        self._queue = collections.deque()
+        self._buffer = []
+
+        self._recover()
+        self._file = open(path, 'ab')
+
+        # Background dispatch failures: count and last exception.
+        self.errors = 0
+        self.last_error = None
+
+        self._closing = False
+        self._committer = self._start_thread(self._commit_forever, 'committer')
+        self._dispatcher = None
+        if background:
+            self._dispatcher = self._start_thread(self._dispatch_forever, 'dispatcher')
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self._path)
+
+
+    def _start_thread(self, target, name):
+
+        thread = threading.Thread(target=target, name='wires-outbox-%s' % (name,))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+    def _recover(self):
+
+        last_id = 0
+        if os.path.exists(self._path):
+            with open(self._path, 'r+b') as f:
+                records = _read_records(f)
+                while True:
+                    try:
+                        payload = next(records)
+                    except StopIteration as e:
+                        valid_size = e.value
+                        break
+                    if payload[0] == _CALL:
+                        call_id = payload[1]
+                        self._pending[call_id] = payload[2:]
+                        last_id = max(last_id, call_id)
+                    else:
+                        self._pending.pop(payload[1], None)
+                # Discard a torn tail, so that new records follow valid ones.
+                f.truncate(valid_size)
+
+        self._queue.extend(self._pending)
+        self._last_id = last_id
+        self._committed_id = last_id
+
+
+    def _commit_forever(self):
+
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closing:
+                    self._cond.wait()
+                if not self._buffer:
+                    return
+            if self._commit_interval and not self._closing:
+                time.sleep(self._commit_interval)
+            with self._cond:
+                data = b''.join(self._buffer)
+                self._buffer = []
+                last_id = self._last_id
+            with self._io_lock:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                # Before releasing the file: compact keeps committed calls.
+                with self._cond:
+                    self._committed_id = last_id
+                    self._cond.notify_all()
+
+
+    def _next_call(self, block):
+
+        # Returns the next committed (<id>, <call>) to dispatch, waiting for
+        # one if `block`, or None.
+
+        with self._cond:
+            while True:
+                if block and self._closing:
+                    return None
+                if self._queue and self._queue[0] <= self._committed_id:
+                    call_id = self._queue.popleft()
+                    return call_id, self._pending[call_id]
+                if not block:
+                    return None
+                self._cond.wait()
+
+
+    def _dispatch_one(self, call_id, call):
+
+        try:
+            _forward.deliver(self._wires, *call)
+        except Exception:
+            with self._cond:
+                self._queue.appendleft(call_id)
+            raise
+        with self._cond:
+            del self._pending[call_id]
+            self._buffer.append(_encode((_ACK, call_id)))
+            self._cond.notify_all()
+
+
+    def _dispatch_forever(self):
+
+        while True:
+            next_call = self._next_call(block=True)
+            if next_call is None:
+                return
+            try:
+                self._dispatch_one(*next_call)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+                with self._cond:
+                    self._cond.wait(self._retry_interval)
+
+
+    @property
+    def pending(self):
+        """
+        List of ``(<name>, <args>, <kwargs>)`` calls not yet acknowledged,
+        in call order.
+        """
+        with self._cond:
+            return list(self._pending.values())
+
+
+    def send(self, name, args, kwargs, wait=True):
+        """
+        Persists a call to the ``name`` callable, with ``args`` and
+        ``kwargs``, for later dispatch.
+
+        :param wait: If ``True``, returns only once the call is committed.
+        :type wait: ``bool``
+
+        :raises RuntimeError: If closed.
+        """
+        data = (name, args, kwargs)
+        with self._cond:
+            if self._closing:
+                raise RuntimeError('outbox closed')
+            self._last_id += 1
+            call_id = self._last_id
+            self._buffer.append(_encode((_CALL, call_id) + data))
+            self._pending[call_id] = data
+            self._queue.append(call_id)
+            self._cond.notify_all()
+            if wait:
+                while self._committed_id < call_id:
+                    self._cond.wait()
+
+
+    def forward(self, wires_callable, name=None, wait=True):
+        """
+        Wires a forwarder to ``wires_callable`` that sends its calls through
+        this outbox to the ``name`` callable, defaulting to the same name,
+        and returns it, for later unwiring.
+        """
+        def send(name, args, kwargs):
+            self.send(name, args, kwargs, wait)
+
+        return _forward.forward(wires_callable, send, name)
+
+
+    def dispatch(self, max_calls=None):
+        """
+        Dispatches committed calls, when not doing so in the background.
+
+        :returns: The number of dispatched calls.
+        :raises: Whatever dispatching raises; that call stays pending.
+        """
+        count = 0
+        while count != max_calls:
+            next_call = self._next_call(block=False)
+            if next_call is None:
+                break
+            self._dispatch_one(*next_call)
+            count += 1
+        return count
+
+
+    def compact(self):
+        """
+        Rewrites the file with only the pending calls.
+        """
+        with self._io_lock, self._cond:
+            # Calls past the committed id are yet to be written, by the
+            # committer, to the new file; acks for calls not in it are
+            # ignored on recovery.
+            temporary_path = self._path + '.compact'
+            with open(temporary_path, 'wb') as f:
+                for call_id, call in self._pending.items():
+                    if call_id <= self._committed_id:
+                        f.write(_encode((_CALL, call_id) + call))
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(temporary_path, self._path)
+            self._file = open(self._path, 'ab')
+
+
+    def close(self):
+        """
+        Commits outstanding records and stops the background threads, once
+        the call being dispatched, if any, completes; calls not yet
+        dispatched stay pending, for the next :class:`Outbox` on the file.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._committer.join()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        # Acks from the final dispatch, if any, in the buffer.
+        with self._io_lock:
+            self._file.write(b''.join(self._buffer))
+            self._buffer = []
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+# ----------------------------------------------------------------------------
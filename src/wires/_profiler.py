@@ -0,0 +1,249 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`WiresProfiler` Class.
+
+:class:`WiresProfiler`\\s are :class:`WiresHook <wires._hooks.WiresHook>`\\s
+that attribute wall and CPU time to each ``(<callable name>, <function>)``
+pair, optionally flagging wirings that exceed a given time budget:
+
+>>> w = Wires()
+>>> w.one_callable.wire(time.sleep)
+>>> profiler = WiresProfiler(budget=0.01)
+>>> profiler.attach(w)
+>>> w.one_callable(0.02)
+>>> profiler.slow_wirings
+[('one_callable', <built-in function sleep>, 0.0201...)]
+>>> print(profiler.report())
+callable      function                         calls  failures  wall (s)  cpu (s)  max wall (s)  over budget
+one_callable  <built-in function sleep>            1         0    0.0201   0.0000        0.0201            1
+
+Times are inclusive: a wiring that calls other
+:class:`WiresCallable <wires._callable.WiresCallable>`\\s is attributed the
+time spent in their wirings, too. Unhashable wired functions are accounted for
+by their id. Profiling never changes call results: accounting raised
+exceptions, including those raised by ``on_slow``, are counted, not raised.
+"""
+
+import collections
+import threading
+import time
+
+from . import _hooks
+
+
+
+_wall_clock = time.perf_counter
+_cpu_clock = getattr(time, 'thread_time', time.process_time)
+
+
+
+def _stats_key(name, function):
+
+    # Stats are keyed by callable name and wired function, or its id, if
+    # unhashable.
+
+    try:
+        hash(function)
+    except TypeError:
+        return (name, id(function))
+    return (name, function)
+
+
+
+class WiringStats(object):
+
+    """
+    Accumulated timing statistics for a single ``(<callable name>, <function>)``
+    pair.
+    """
+
+    __slots__ = (
+        'calls', 'failures', 'wall_time', 'cpu_time', 'max_wall_time',
+        'over_budget',
+    )
+
+    def __init__(self):
+
+        self.calls = 0
+        self.failures = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.max_wall_time = 0.0
+        self.over_budget = 0
+
+
+    def __repr__(self):
+
+        return '<%s calls=%r wall_time=%.6f cpu_time=%.6f>' % (
+            self.__class__.__name__, self.calls, self.wall_time, self.cpu_time,
+        )
+
+
+
+class WiresProfiler(_hooks.WiresHook):
+
+    """
+    :class:`WiresProfiler` Class.
+    """
+
+    def __init__(self, budget=None, on_slow=None, max_slow_wirings=1000):
+        """
+        :param budget: Per-wiring call wall time budget, in seconds, or
+                       ``None`` for no budget.
+        :type budget: ``float`` or ``None``
+
+        :param on_slow: Called with ``(<callable name>, <function>, <wall time>)``
+                        whenever a wiring call exceeds ``budget``.
+        :type on_slow: ``callable`` or ``None``
+
+        :param max_slow_wirings: How many over budget wiring calls are kept in
+                                 :attr:`slow_wirings`; older ones are discarded.
+        :type max_slow_wirings: ``int``
+        """
+        self.budget = budget
+        self._on_slow = on_slow
+
+        # Keys are (<callable name>, <function, or its id>), values are
+        # WiringStats.
+        self._stats = {}
+
+        # Exceptions raised while accounting for wiring calls.
+        self.errors = 0
+
+        # Most recent (<callable name>, <function>, <wall time>) over budget.
+        self._slow_wirings = collections.deque(maxlen=max_slow_wirings)
+
+        # Per-thread stack of (<wall start>, <cpu start>) tuples: wirings may
+        # call other WiresCallables, nesting `before`/`after` calls.
+        self._local = threading.local()
+
+
+    def _start_stack(self):
+
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+
+    def before(self, wires_callable, function):
+
+        self._start_stack().append((_wall_clock(), _cpu_clock()))
+
+
+    def _account(self, wires_callable, function, failed):
+
+        cpu_end = _cpu_clock()
+        wall_end = _wall_clock()
+        try:
+            self._add_stats(wires_callable, function, failed, wall_end, cpu_end)
+        except Exception:
+            # Profiling must not change call results.
+            self.errors += 1
+
+
+    def _add_stats(self, wires_callable, function, failed, wall_end, cpu_end):
+
+        wall_start, cpu_start = self._start_stack().pop()
+        wall_time = wall_end - wall_start
+
+        key = _stats_key(wires_callable.__name__, function)
+        try:
+            stats = self._stats[key]
+        except KeyError:
+            stats = self._stats[key] = WiringStats()
+
+        stats.calls += 1
+        stats.failures += failed
+        stats.wall_time += wall_time
+        stats.cpu_time += cpu_end - cpu_start
+        if wall_time > stats.max_wall_time:
+            stats.max_wall_time = wall_time
+
+        if self.budget is not None and wall_time > self.budget:
+            stats.over_budget += 1
+            self._slow_wirings.append(key + (wall_time,))
+            if self._on_slow is not None:
+                self._on_slow(key[0], function, wall_time)
+
+
+    def after(self, wires_callable, function, result):
+
+        self._account(wires_callable, function, False)
+
+
+    def exception(self, wires_callable, function, exception):
+
+        self._account(wires_callable, function, True)
+
+
+    @property
+    def stats(self):
+        """
+        Dict of ``(<callable name>, <function>)`` keys and :class:`WiringStats`
+        values; unhashable functions are replaced by their id.
+        """
+        return dict(self._stats)
+
+
+    @property
+    def slow_wirings(self):
+        """
+        List of the most recent ``(<callable name>, <function>, <wall time>)``
+        tuples for wiring calls exceeding the budget, oldest first.
+        """
+        return list(self._slow_wirings)
+
+
+    def reset(self):
+        """
+        Discards all collected statistics.
+        """
+        self._stats.clear()
+        self._slow_wirings.clear()
+
+
+    def report(self, limit=None):
+        """
+        Returns a plain text table of the collected statistics, sorted by
+        descending total wall time, limited to ``limit`` rows, if not ``None``.
+        """
+        items = sorted(
+            self._stats.items(),
+            key=lambda item: item[1].wall_time,
+            reverse=True,
+        )[:limit]
+
+        rows = [(
+            'callable', 'function', 'calls', 'failures', 'wall (s)',
+            'cpu (s)', 'max wall (s)', 'over budget',
+        )]
+        for (name, function), stats in items:
+            rows.append((
+                name,
+                repr(function),
+                str(stats.calls),
+                str(stats.failures),
+                '%.4f' % stats.wall_time,
+                '%.4f' % stats.cpu_time,
+                '%.4f' % stats.max_wall_time,
+                str(stats.over_budget),
+            ))
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = []
+        for row in rows:
+            cells = [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+            cells.extend(cell.rjust(width) for cell, width in zip(row[2:], widths[2:]))
+            lines.append('  '.join(cells).rstrip())
+        return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,264 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`Recorder` and :class:`Replayer` Classes.
+
+A :class:`Recorder` is a :class:`WiresHook <wires._hooks.WiresHook>` that
+appends a ``(<timestamp>, <callable name>, <args>, <kwargs>)`` record per
+call to any callable of the :class:`Wires <wires._wires.Wires>` objects it is
+attached to, into memory mapped, fixed size, segment files in a directory:
+
+>>> recorder = Recorder('/var/tmp/wires-capture')
+>>> recorder.attach(w)
+>>> ...                                 # Production traffic.
+>>> recorder.detach(w)
+>>> recorder.close()
+
+A :class:`Replayer` feeds recorded calls back through a
+:class:`Wires <wires._wires.Wires>` object's callables, at the recorded pace,
+scaled by ``speed``, or as fast as possible:
+
+>>> Replayer('/var/tmp/wires-capture').replay(w, speed=None)
+
+Segment files are named ``<prefix>-<index>.wlog``; recording into a directory
+with existing segments continues after them. Each record is a 4 byte length
+followed by the :mod:`pickle` serialized tuple; a zero length ends a segment.
+Calls with unpicklable arguments are not recorded, but counted.
+:meth:`call_key <wires._callable.WiresCallable.call_key>` calls are recorded
+without their routing key: replaying them calls all wirings. Calls made
+by the wirings of another call, on the same thread, are not recorded:
+replaying the outer call makes them again.
+"""
+
+import glob
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+
+from . import _hooks
+
+
+
+_LENGTH = struct.Struct('<I')
+
+
+
+def _segment_paths(directory, prefix):
+
+    # Existing segment file paths, in index order.
+
+    return sorted(glob.glob(os.path.join(directory, '%s-*.wlog' % (prefix,))))
+
+
+
+class Recorder(_hooks.WiresHook):
+
+    """
+    Records calls to memory mapped segment files.
+    """
+
+    def __init__(self, directory, segment_size=16 << 20, prefix='wires'):
+        """
+        :param directory: Where segment files are written; created if needed.
+        :type directory: ``str``
+
+        :param segment_size: Segment file size, in bytes; records that don't
+                             fit in an empty segment get one of their own.
+        :type segment_size: ``int``
+
+        :param prefix: Segment file name prefix.
+        :type prefix: ``str``
+        """
+        if segment_size < 64:
+            raise ValueError('segment_size must be >= 64')
+
+        self._directory = directory
+        self._segment_size = segment_size
+        self._prefix = prefix
+        self._lock = threading.Lock()
+
+        # Per-thread flag, set while a top level call is in progress.
+        self._local = threading.local()
+
+        # Records written and calls not recorded, due to unpicklable arguments.
+        self.recorded = 0
+        self.errors = 0
+
+        os.makedirs(directory, exist_ok=True)
+        existing = _segment_paths(directory, prefix)
+        if existing:
+            last = os.path.basename(existing[-1])
+            self._next_index = int(last[len(prefix) + 1:-len('.wlog')]) + 1
+        else:
+            self._next_index = 0
+
+        # The current segment's file, mmap and write offset; opened lazily.
+        self._file = None
+        self._mmap = None
+        self._offset = 0
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self._directory)
+
+
+    def _close_segment(self):
+
+        # Truncates the current segment to its used size.
+
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._file = self._mmap = None
+
+
+    def _open_segment(self, size):
+
+        self._close_segment()
+        path = os.path.join(
+            self._directory, '%s-%06d.wlog' % (self._prefix, self._next_index),
+        )
+        self._next_index += 1
+        self._file = open(path, 'w+b')
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._offset = 0
+
+
+    def enter(self, wires_callable, args, kwargs):
+
+        local = self._local
+        if getattr(local, 'in_call', False):
+            # Nested call: replaying the top level one makes it again.
+            return False
+        # Only top level calls get a `leave` call, clearing the flag.
+        local.in_call = True
+
+        try:
+            data = pickle.dumps(
+                (time.time(), wires_callable.__name__, args, kwargs),
+                pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:
+            self.errors += 1
+            return True
+
+        # Leave room for the zero length end marker.
+        needed = _LENGTH.size + len(data)
+        with self._lock:
+            if self._mmap is None or self._offset + needed > len(self._mmap) - _LENGTH.size:
+                self._open_segment(max(self._segment_size, needed + _LENGTH.size))
+            offset = self._offset
+            _LENGTH.pack_into(self._mmap, offset, len(data))
+            self._mmap[offset + _LENGTH.size:offset + needed] = data
+            self._offset = offset + needed
+            self.recorded += 1
+
+        return True
+
+
+    def leave(self, wires_callable):
+
+        self._local.in_call = False
+
+
+    def flush(self):
+        """
+        Flushes the current segment to disk.
+        """
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+
+
+    def close(self):
+        """
+        Closes the current segment, truncating it to its used size; later
+        calls are recorded into a new segment.
+        """
+        with self._lock:
+            self._close_segment()
+
+
+
+class Replayer(object):
+
+    """
+    Reads and replays :class:`Recorder` segment files.
+    """
+
+    def __init__(self, directory, prefix='wires'):
+        """
+        :param directory: Where segment files are.
+        :type directory: ``str``
+
+        :param prefix: Segment file name prefix.
+        :type prefix: ``str``
+        """
+        self._directory = directory
+        self._prefix = prefix
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self._directory)
+
+
+    def records(self):
+        """
+        Yields ``(<timestamp>, <callable name>, <args>, <kwargs>)`` records,
+        in recording order.
+        """
+        for path in _segment_paths(self._directory, self._prefix):
+            with open(path, 'rb') as f:
+                if not os.fstat(f.fileno()).st_size:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    offset = 0
+                    while offset + _LENGTH.size <= len(m):
+                        size = _LENGTH.unpack_from(m, offset)[0]
+                        if not size:
+                            break
+                        offset += _LENGTH.size
+                        yield pickle.loads(m[offset:offset + size])
+                        offset += size
+
+
+    def replay(self, wires, speed=1.0):
+        """
+        Calls the recorded callables in ``wires``.
+
+        :param speed: Replay pace relative to the recorded one: ``2.0`` is
+                      twice as fast; ``None`` replays as fast as possible.
+        :type speed: ``float`` > 0 or ``None``
+
+        :returns: The number of replayed calls.
+        """
+        count = 0
+        first_recorded = start = None
+        for timestamp, name, args, kwargs in self.records():
+            if speed is not None:
+                if first_recorded is None:
+                    first_recorded = timestamp
+                    start = time.monotonic()
+                delay = (timestamp - first_recorded) / speed - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            wires[name](*args, **kwargs)
+            count += 1
+        return count
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,222 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires wiring selection.
+
+Wirings added via :meth:`with_options <wires._callable.WiresCallable.with_options>`
+may have a routing ``key``, used by
+:meth:`call_key <wires._callable.WiresCallable.call_key>`, and a ``where``
+predicate: a callable, passed the call-time arguments, returning whether the
+wiring is to be called:
+
+>>> w.orders.with_options(where=is_large_order).wire(notify_sales)
+>>> w.orders.with_options(where=Equals('EUR', attribute='currency')).wire(book_eur)
+
+Each distinct predicate is evaluated once per call, regardless of how many
+wirings share it. :class:`Equals` predicates are indexed: those testing the
+same argument are evaluated with a single argument lookup and a single dict
+lookup per call, regardless of how many there are, or how many values they
+test for. Predicate raised exceptions are propagated to the caller.
+"""
+
+
+
+
+def _extract(selector, args, kwargs):
+
+    # Returns the call-time argument, or argument attribute, `selector`, an
+    # (<argument>, <attribute>) tuple, refers to.
+
+    argument, attribute = selector
+    if isinstance(argument, int):
+        value = args[argument]
+    else:
+        value = kwargs[argument]
+    if attribute is not None:
+        value = getattr(value, attribute)
+    return value
+
+
+
+class Equals(object):
+
+    """
+    Indexed ``where`` predicate: ``True`` if a call-time argument, or one of
+    its attributes, equals a given value; ``False`` if it is missing.
+    """
+
+    __slots__ = ('value', 'selector')
+
+    def __init__(self, value, argument=0, attribute=None):
+        """
+        :param value: What to compare with.
+        :type value: hashable, to be indexed
+
+        :param argument: Positional argument index or named argument name.
+        :type argument: ``int`` or ``str``
+
+        :param attribute: Argument attribute name, if comparing it instead.
+        :type attribute: ``str`` or ``None``
+        """
+        self.value = value
+        self.selector = (argument, attribute)
+
+
+    def __repr__(self):
+
+        return '%s(%r, argument=%r, attribute=%r)' % (
+            (self.__class__.__name__, self.value) + self.selector
+        )
+
+
+    def __eq__(self, other):
+
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self.value, self.selector) == (other.value, other.selector)
+
+
+    def __ne__(self, other):
+
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+
+    def __hash__(self):
+
+        return hash((self.value, self.selector))
+
+
+    def __reduce__(self):
+
+        return (self.__class__, (self.value,) + self.selector)
+
+
+    def __call__(self, *args, **kwargs):
+
+        try:
+            return _extract(self.selector, args, kwargs) == self.value
+        except (LookupError, AttributeError):
+            return False
+
+
+
+class _Plan(object):
+
+    # Selects, per call, which of a wiring list's wirings pass their `where`
+    # predicates: holds wiring positions grouped by predicate.
+
+    def __init__(self, wirings):
+
+        # Positions of wirings with no predicate.
+        self.always = []
+
+        # {<selector>: {<value>: <positions>}}, for hashable Equals values.
+        self.indexed = {}
+
+        # {<predicate key>: (<predicate>, <positions>)}, for other ones,
+        # keyed by themselves, if hashable, or by identity.
+        self.predicates = {}
+
+        for position, wiring in enumerate(wirings):
+            where = getattr(wiring, 'where', None)
+            if where is None:
+                self.always.append(position)
+                continue
+            if type(where) is Equals:
+                try:
+                    values = self.indexed.setdefault(where.selector, {})
+                    values.setdefault(where.value, []).append(position)
+                    continue
+                except TypeError:
+                    pass
+            try:
+                hash(where)
+                key = where
+            except TypeError:
+                key = id(where)
+            self.predicates.setdefault(key, (where, []))[1].append(position)
+
+
+    def select(self, wirings, args, kwargs):
+
+        positions = list(self.always)
+        for selector, values in self.indexed.items():
+            try:
+                positions.extend(values.get(_extract(selector, args, kwargs), ()))
+            except (LookupError, AttributeError, TypeError):
+                # Missing or unhashable: equals no indexed value.
+                pass
+        for predicate, predicate_positions in self.predicates.values():
+            if predicate(*args, **kwargs):
+                positions.extend(predicate_positions)
+        positions.sort()
+        return [wirings[position] for position in positions]
+
+
+
+class WiringIndex(object):
+
+    # Wiring selection structures for a `WiresCallable`'s wiring list, built
+    # lazily: callables keep one until their wiring list changes.
+
+    def __init__(self, wirings):
+
+        self.wirings = wirings
+        self.length = len(wirings)
+        self._filtered = any(
+            getattr(wiring, 'where', None) is not None for wiring in wirings
+        )
+        self._routes = None
+        # {<wiring list id>: (<wiring list>, <plan>)}; lists kept alive by
+        # holding them, so that ids are not reused.
+        self._plans = {}
+
+
+    def _build_routes(self):
+
+        keyed = {}
+        catch_all = []
+        for index, wiring in enumerate(self.wirings):
+            key = getattr(wiring, 'key', None)
+            if key is None:
+                catch_all.append((index, wiring))
+            else:
+                keyed.setdefault(key, []).append((index, wiring))
+        routes = {
+            key: [wiring for _, wiring in sorted(key_wirings + catch_all)]
+            for key, key_wirings in keyed.items()
+        }
+        self._routes = (routes, [wiring for _, wiring in catch_all])
+        return self._routes
+
+
+    def route(self, key):
+        """
+        Returns the wirings with routing key ``key`` or none, in order.
+        """
+        routes, catch_all = self._routes or self._build_routes()
+        return routes.get(key, catch_all)
+
+
+    def select(self, wirings, args, kwargs):
+        """
+        Returns those of ``wirings``, the full list or a route, whose
+        predicates pass for the given call-time arguments.
+        """
+        if not self._filtered:
+            return wirings
+        try:
+            plan = self._plans[id(wirings)][1]
+        except KeyError:
+            plan = _Plan(wirings)
+            self._plans[id(wirings)] = (wirings, plan)
+        return plan.select(wirings, args, kwargs)
+
+
+# ----------------------------------------------------------------------------
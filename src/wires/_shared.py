@@ -9,13 +9,14 @@
 Python Wires shared instance.
 """
 
-from __future__ import absolute_import
+import os
 
 from . import _wires
 
 
 
-w = _wires.Wires()
+# Disabled, if the WIRES_DISABLED environment variable is set: see _disabled.
+w = _wires.Wires(enabled=os.environ.get('WIRES_DISABLED', '') in ('', '0'))
 
 
 # ----------------------------------------------------------------------------
@@ -0,0 +1,313 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`SharedMemoryChannel` Class.
+
+Delivers calls from one process's :class:`Wires <wires._wires.Wires>` object
+to another's, on the same host, via a single producer, single consumer, ring
+buffer in :mod:`multiprocessing.shared_memory`:
+
+>>> channel = SharedMemoryChannel()     # In the parent process.
+>>> channel.forward(w.one_callable)     # Calls are sent to the channel...
+>>> p = multiprocessing.Process(target=consumer, args=(channel,))
+
+Where the consumer process, given the pickled channel, dispatches the calls
+to its own :class:`Wires <wires._wires.Wires>` object's callables:
+
+>>> def consumer(channel):
+...     w = Wires()
+...     w.one_callable.wire(print)
+...     while True:
+...         channel.receive(w, timeout=1)
+
+Messages are ``(<name>, <args>, <kwargs>)`` tuples serialized with
+:mod:`pickle`, by default. Sending waits for the consumer to make room when
+the ring is full. The consumer is woken by a :class:`multiprocessing.Event`
+only when it is waiting for messages, keeping the common case syscall free.
+
+Each channel supports exactly one sending and one receiving process: use one
+channel per consumer process. Any number of threads in the sending process
+may send, or call forwarded callables, concurrently.
+
+Channels require :mod:`multiprocessing.shared_memory`, new in Python 3.8:
+creating them raises :class:`RuntimeError` on earlier versions.
+"""
+
+import functools
+import multiprocessing
+import pickle
+import struct
+import sys
+import threading
+import time
+import weakref
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # Python < 3.8: channels are unavailable.
+    resource_tracker = shared_memory = None
+
+from . import _forward
+
+
+
+# Header: write position, read position, consumer waiting flag; positions are
+# ever increasing byte counts, taken modulo the capacity.
+_HEADER = struct.Struct('<QQI4x')
+_POSITION = struct.Struct('<Q')
+_WRITE_OFFSET = 0
+_READ_OFFSET = 8
+_FLAG = struct.Struct('<I')
+_WAITING_OFFSET = 16
+
+# Each message is prefixed by its length.
+_LENGTH = struct.Struct('<I')
+
+# How long senders sleep between checks for room in a full ring.
+_FULL_POLL_INTERVAL = 0.0005
+
+
+
+class SharedMemoryChannel(object):
+
+    """
+    Shared memory ring buffer call delivery.
+    """
+
+    def __init__(self, capacity=1 << 20, serializer=None, event=None,
+                 _name=None):
+        """
+        :param capacity: The ring buffer size, in bytes; bounds the size of
+                         each serialized message.
+        :type capacity: ``int``
+
+        :param serializer: An object with ``dumps`` and ``loads`` functions,
+                           like :mod:`pickle`, the default; must itself be
+                           picklable.
+
+        :param event: The :class:`multiprocessing.Event` waking the consumer;
+                      by default, one is created from the default
+                      :mod:`multiprocessing` context.
+
+        :raises RuntimeError: If :mod:`multiprocessing.shared_memory` is not
+                              available.
+        """
+        if shared_memory is None:
+            raise RuntimeError('SharedMemoryChannel requires multiprocessing.shared_memory')
+        if capacity < 64:
+            raise ValueError('capacity must be >= 64')
+
+        self._capacity = capacity
+        self._serializer = serializer
+        self._dumps = (serializer or pickle).dumps
+        self._loads = (serializer or pickle).loads
+        self._event = multiprocessing.Event() if event is None else event
+        self._owner = _name is None
+
+        # Serializes this process's senders: each reserves, copies into and
+        # publishes its message's space, in turn.
+        self._put_lock = threading.Lock()
+
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=_HEADER.size + capacity,
+            )
+            _HEADER.pack_into(self._shm.buf, 0, 0, 0, 0)
+        else:
+            self._shm = shared_memory.SharedMemory(name=_name)
+            if sys.version_info < (3, 13):
+                # Attaching registers the segment for unlinking on exit: only
+                # the creating process should do that.
+                resource_tracker.unregister(self._shm._name, 'shared_memory')
+
+        self._buf = self._shm.buf
+
+        # Closes, and unlinks if owned, when closed or garbage collected.
+        self._finalizer = weakref.finalize(self, _release, self._shm, self._owner)
+
+
+    def __repr__(self):
+
+        return '<%s %r capacity=%d>' % (
+            self.__class__.__name__, self._shm.name, self._capacity,
+        )
+
+
+    def __reduce__(self):
+
+        # Pickled, when passed to new processes, as a reference to the same
+        # shared memory segment and event.
+        return (self.__class__, (
+            self._capacity, self._serializer, self._event, self._shm.name,
+        ))
+
+
+    @property
+    def name(self):
+        """
+        The shared memory segment name.
+        """
+        return self._shm.name
+
+
+    def _positions(self):
+
+        write_position, read_position, _ = _HEADER.unpack_from(self._buf, 0)
+        return write_position, read_position
+
+
+    def _copy_in(self, position, data):
+
+        offset = position % self._capacity
+        first = min(len(data), self._capacity - offset)
+        start = _HEADER.size + offset
+        self._buf[start:start + first] = data[:first]
+        if first < len(data):
+            self._buf[_HEADER.size:_HEADER.size + len(data) - first] = data[first:]
+
+
+    def _copy_out(self, position, size):
+
+        offset = position % self._capacity
+        first = min(size, self._capacity - offset)
+        start = _HEADER.size + offset
+        data = bytes(self._buf[start:start + first])
+        if first < size:
+            data += bytes(self._buf[_HEADER.size:_HEADER.size + size - first])
+        return data
+
+
+    def put(self, data, timeout=None):
+        """
+        Appends ``data``, a bytes object, to the ring, waiting up to
+        ``timeout`` seconds, or forever if ``None``, for room.
+
+        :raises ValueError: If ``data`` can never fit.
+        :raises TimeoutError: If there's no room after ``timeout`` seconds.
+        """
+        needed = _LENGTH.size + len(data)
+        if needed > self._capacity:
+            raise ValueError('message too large: %d bytes' % (len(data),))
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._put_lock.acquire(True, -1 if timeout is None else max(timeout, 0)):
+            # Other senders' messages are still waiting for room.
+            raise TimeoutError('ring buffer full')
+        try:
+            while True:
+                write_position, read_position = self._positions()
+                if self._capacity - (write_position - read_position) >= needed:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError('ring buffer full')
+                time.sleep(_FULL_POLL_INTERVAL)
+
+            self._copy_in(write_position, _LENGTH.pack(len(data)))
+            self._copy_in(write_position + _LENGTH.size, data)
+            # Publish: the consumer only reads up to the write position.
+            _POSITION.pack_into(self._buf, _WRITE_OFFSET, write_position + needed)
+        finally:
+            self._put_lock.release()
+
+        if _FLAG.unpack_from(self._buf, _WAITING_OFFSET)[0]:
+            self._event.set()
+
+
+    def get(self, timeout=None):
+        """
+        Removes and returns the oldest bytes object in the ring, waiting up
+        to ``timeout`` seconds, or forever if ``None``, for one.
+
+        :returns: The bytes object or ``None`` if none was available.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            write_position, read_position = self._positions()
+            if write_position != read_position:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            # Flag we're waiting, then check again: a sender that missed the
+            # flag published before the check. The wait is bounded, just in
+            # case.
+            _FLAG.pack_into(self._buf, _WAITING_OFFSET, 1)
+            if self._positions()[0] == read_position:
+                self._event.wait(0.05 if remaining is None else min(remaining, 0.05))
+            _FLAG.pack_into(self._buf, _WAITING_OFFSET, 0)
+            self._event.clear()
+
+        size = _LENGTH.unpack(self._copy_out(read_position, _LENGTH.size))[0]
+        data = self._copy_out(read_position + _LENGTH.size, size)
+        _POSITION.pack_into(self._buf, _READ_OFFSET, read_position + _LENGTH.size + size)
+        return data
+
+
+    def send(self, name, args, kwargs, timeout=None):
+        """
+        Sends a call to the ``name`` callable, with ``args`` and ``kwargs``.
+
+        :raises: See :meth:`put`.
+        """
+        self.put(self._dumps((name, args, kwargs)), timeout)
+
+
+    def forward(self, wires_callable, name=None, timeout=None):
+        """
+        Wires a forwarder to ``wires_callable`` that sends its calls to the
+        ``name`` callable, defaulting to the same name, and returns it, for
+        later unwiring.
+
+        :param timeout: How long forwarded calls wait for room; on timeout
+                        they raise :class:`TimeoutError`, handled like any
+                        wiring raised exception.
+        """
+        send = functools.partial(self.send, timeout=timeout)
+        return _forward.forward(wires_callable, send, name)
+
+
+    def receive(self, wires, timeout=None, max_messages=None):
+        """
+        Calls the ``wires`` callables per each available message, waiting up
+        to ``timeout`` seconds, or forever if ``None``, for the first one.
+
+        :param max_messages: Stop after this many messages, if not ``None``.
+
+        :returns: The number of messages received.
+        """
+        count = 0
+        data = self.get(timeout)
+        while data is not None:
+            name, args, kwargs = self._loads(data)
+            _forward.deliver(wires, name, args, kwargs)
+            count += 1
+            if count == max_messages:
+                break
+            data = self.get(0)
+        return count
+
+
+    def close(self):
+        """
+        Releases this process's access to the shared memory; the creating
+        process also removes it. Also done on garbage collection.
+        """
+        self._buf = None
+        self._finalizer()
+
+
+
+def _release(shm, unlink):
+
+    shm.close()
+    if unlink:
+        shm.unlink()
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,148 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires configuration snapshots.
+
+:func:`snapshot` serializes a :class:`Wires <wires._wires.Wires>` object's
+settings, its callables' settings and their wirings, with functions recorded
+as import paths, to compact bytes; :func:`restore` creates an equivalent
+object from them, without going through the per-wiring validation of
+:meth:`wire <wires._callable.WiresCallable.wire>`, and without importing any
+wired function's module, by default:
+
+>>> data = snapshot(w)                  # At build/boot time.
+>>> with open('wires.snapshot', 'wb') as f:
+...     f.write(data)
+>>> with open('wires.snapshot', 'rb') as f:
+...     w = restore(f.read())           # In each worker process.
+
+Wiring lists are stored as held, in call order, with one
+:class:`ImportPath <wires._importpath.ImportPath>` per wired function, shared
+by its wirings, and assigned as they are loaded: restoring costs little more
+than unpickling them. Restored wirings are import path proxies, resolved on
+first call, unless restoring with ``resolve=True``.
+
+Snapshots use :mod:`pickle`: wire-time arguments and wiring options must be
+picklable, and snapshots must only be restored from trusted sources.
+Attached hooks and pending call-time settings are not included.
+"""
+
+import pickle
+import sys
+
+from . import _disabled, _importpath, _wires
+
+
+
+# Bumped on incompatible snapshot format changes.
+FORMAT = 2
+
+
+
+def _import_path(function):
+
+    # Returns the '<module>:<qualified name>' import path that resolves to
+    # `function`, raising ValueError if there's none.
+
+    if isinstance(function, _importpath.ImportPath):
+        return function.path
+
+    module_name = getattr(function, '__module__', None)
+    qualified_name = getattr(function, '__qualname__', None)
+    if module_name and qualified_name and '<' not in qualified_name:
+        target = sys.modules.get(module_name)
+        for attribute_name in qualified_name.split('.'):
+            target = getattr(target, attribute_name, None)
+        if target is function:
+            return '%s:%s' % (module_name, qualified_name)
+
+    raise ValueError('wired function not importable: %r' % (function,))
+
+
+
+def snapshot(wires):
+    """
+    Returns a bytes snapshot of ``wires``.
+
+    :param wires: The object to snapshot.
+    :type wires: :class:`Wires <wires._wires.Wires>`
+
+    :raises ValueError: If a wired function can't be found by its module and
+                        qualified name, like lambdas, nested functions or
+                        bound methods.
+    """
+    # Wirings are pickled as they are held, with one shared ImportPath per
+    # wired function: pickled once, referenced by the pickle memo after.
+    import_paths = {}
+
+    callables = []
+    for wires_callable in wires:
+        wirings = wires_callable._current_wirings()
+        snapshot_wirings = type(wirings)()
+        for wiring in wirings:
+            path = _import_path(wiring[0])
+            try:
+                import_path = import_paths[path]
+            except KeyError:
+                import_path = import_paths[path] = _importpath.ImportPath(path)
+            snapshot_wirings.append(_wires._with_function(wiring, import_path))
+        callables.append((
+            wires_callable.__name__,
+            dict(wires_callable._callable_settings),
+            snapshot_wirings,
+        ))
+
+    state = (
+        FORMAT,
+        dict(wires._settings),
+        isinstance(wires, _disabled.DisabledWires),
+        callables,
+    )
+    return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+
+
+def _resolved(wirings):
+
+    # Returns `wirings` with their ImportPaths resolved: shared ones import
+    # their module and look up their target once.
+
+    return type(wirings)(
+        _wires._with_function(wiring, wiring[0].resolve()) for wiring in wirings
+    )
+
+
+
+def restore(data, resolve=False):
+    """
+    Returns a new :class:`Wires <wires._wires.Wires>` object from ``data``,
+    a :func:`snapshot` result.
+
+    :param resolve: If ``True``, wired functions are imported and resolved
+                    now, rather than on first call.
+    :type resolve: ``bool``
+
+    :raises ValueError: If ``data`` has an unsupported format.
+    :raises: See :meth:`ImportPath.resolve <wires._importpath.ImportPath.resolve>`,
+             if ``resolve`` is ``True``.
+    """
+    state = pickle.loads(data)
+    if state[0] != FORMAT:
+        raise ValueError('unsupported snapshot format: %r' % (state[0],))
+    _, settings, disabled, callables = state
+
+    wires = _wires.Wires(enabled=not disabled, **settings)
+    for name, callable_settings, wirings in callables:
+        if resolve:
+            wirings = _resolved(wirings)
+        wires._restore_callable(name, callable_settings, wirings)
+
+    return wires
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,200 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires wiring timeouts.
+
+Wirings may have a timeout, added via
+:meth:`with_options <wires._callable.WiresCallable.with_options>`, and whole
+calls may have one, via the ``timeout`` setting, available at the
+:class:`Wires <wires._wires.Wires>`,
+:class:`WiresCallable <wires._callable.WiresCallable>` and call-time levels:
+
+>>> w.orders.with_options(timeout=0.5).wire(notify_warehouse)
+>>> w(returns=True, timeout=2).orders(order)
+
+Wirings with a timeout, or all wirings, in calls with a timeout, are called
+on worker threads, still one at a time, in order: the caller waits for each,
+up to its timeout or the call's remaining time, whichever comes first.
+Wirings missing it, and those not yet called when the call's time is up,
+are handled as if they had raised a :class:`WiringTimeout` exception,
+including when ``ignore_exceptions`` is ``False``: call results, and call
+raised ``RuntimeError`` arguments, hold it, subject to the
+``exception_detail`` setting.
+
+Timed out wirings keep running on their worker thread: Python threads can't
+be interrupted. Their late results, or raised exceptions, are discarded.
+Until they complete, further calls to the same wired function time out right
+away, without being called: hung wirings hold one worker thread each, not
+one per call. Wiring hooks are called on the calling thread, around the
+wait: timed out wirings get an exception hook call with the
+:class:`WiringTimeout`.
+
+Worker threads are started as needed, up to a limit, and exit after being
+idle for a while. Past the limit, wirings wait for a worker thread to be
+free: those timing out meanwhile are never called.
+"""
+
+import queue
+import threading
+import time
+
+
+
+_clock = time.monotonic
+
+# Seconds idle worker threads wait for work before exiting.
+_IDLE_TIMEOUT = 10.0
+
+# Most worker threads at once.
+_MAX_WORKERS = 32
+
+
+
+class WiringTimeout(Exception):
+
+    """
+    Call result exception for wirings that missed their timeout, or the
+    call's; the single argument is the wired function.
+    """
+
+
+
+class _Workers(object):
+
+    # Daemon worker threads, started as needed, up to `max_workers`,
+    # running submitted callables.
+
+    def __init__(self, idle_timeout, max_workers):
+
+        self._idle_timeout = idle_timeout
+        self._max_workers = max_workers
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+
+        # Waiting worker count, less the queued tasks: negative when tasks
+        # wait for workers.
+        self._idle = 0
+
+        # Worker thread count.
+        self._count = 0
+
+
+    def submit(self, task):
+
+        with self._lock:
+            self._tasks.put(task)
+            self._idle -= 1
+            if self._idle >= 0 or self._count == self._max_workers:
+                return
+            # A new worker, for this task.
+            self._idle += 1
+            self._count += 1
+        thread = threading.Thread(target=self._work, name='wires-timeout-worker')
+        thread.daemon = True
+        thread.start()
+
+
+    def _work(self):
+
+        while True:
+            try:
+                task = self._tasks.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._tasks.empty():
+                        self._idle -= 1
+                        self._count -= 1
+                        return
+                continue
+            task()
+            del task
+            with self._lock:
+                self._idle += 1
+
+
+
+class _Pending(object):
+
+    # A call, run by a worker thread, and its outcome. Overdue ones, whose
+    # caller stopped waiting, are counted in `_overdue`, by wired function
+    # id, until done: the wired function, their first argument, is kept
+    # alive meanwhile, keeping its id unique.
+
+    __slots__ = ('call', 'args', 'done', 'result', 'exception', 'overdue')
+
+    def __init__(self, call, args):
+
+        self.call = call
+        self.args = args
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+        self.overdue = False
+
+
+    def __call__(self):
+
+        # Not called if overdue before starting.
+        with _overdue_lock:
+            overdue = self.overdue
+        if not overdue:
+            try:
+                self.result = self.call(*self.args)
+            except Exception as exception:
+                self.exception = exception
+
+        with _overdue_lock:
+            if self.overdue:
+                key = id(self.args[0])
+                if _overdue[key] == 1:
+                    del _overdue[key]
+                else:
+                    _overdue[key] -= 1
+            self.done.set()
+        # Drop references: late outcomes are all that's kept, if any.
+        self.call = self.args = None
+
+
+
+_workers = _Workers(_IDLE_TIMEOUT, _MAX_WORKERS)
+
+# Overdue call count, by wired function id, and its lock.
+_overdue = {}
+_overdue_lock = threading.Lock()
+
+
+
+def timed_call(call, timeout):
+    """
+    Returns a callable, taking ``call``'s arguments, calling it on a worker
+    thread, waiting up to ``timeout`` seconds for it to return or raise.
+
+    :raises WiringTimeout: If ``call`` does not complete in time, given its
+                           first argument, the wired function, or without
+                           calling it, if an earlier call to it is overdue.
+    """
+    def timed(function, args, kwargs):
+        if id(function) in _overdue:
+            raise WiringTimeout(function)
+        pending = _Pending(call, (function, args, kwargs))
+        _workers.submit(pending)
+        if not pending.done.wait(timeout):
+            with _overdue_lock:
+                if not pending.done.is_set():
+                    pending.overdue = True
+                    key = id(function)
+                    _overdue[key] = _overdue.get(key, 0) + 1
+            if pending.overdue:
+                raise WiringTimeout(function)
+        if pending.exception is not None:
+            raise pending.exception
+        return pending.result
+    return timed
+
+
+# ----------------------------------------------------------------------------
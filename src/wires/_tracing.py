@@ -0,0 +1,261 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires :class:`WiresTracer` Class.
+
+:class:`WiresTracer`\\s are :class:`WiresHook <wires._hooks.WiresHook>`\\s
+that record a sample of :class:`WiresCallable <wires._callable.WiresCallable>`
+calls as trees of :class:`Span`\\s, keeping instrumentation overhead bounded:
+calls that are not sampled cost little more than a counter update.
+
+Sampling is per-callable, either one in every ``sample_every`` calls, at most
+``max_rate`` calls per second, or both:
+
+>>> w = Wires()
+>>> w.inner.wire(time.sleep)
+>>> w.outer.wire(w.inner, 0.01)
+>>> tracer = WiresTracer(sample_every=100)
+>>> tracer.attach(w)
+>>> for _ in range(200):
+...     w.outer()
+>>> len(tracer.spans)
+2
+
+Calls to other :class:`WiresCallable <wires._callable.WiresCallable>`\\s made
+by the wirings in a sampled call are always recorded, as children of the
+respective wiring span, regardless of their own sampling:
+
+>>> root = tracer.spans[0]
+>>> root.name, root.function
+('outer', None)
+>>> wiring_span = root.children[0]
+>>> wiring_span.name, wiring_span.function
+('outer', <WiresCallable 'inner' at 0x1018d4a90>)
+>>> wiring_span.children[0].name
+'inner'
+"""
+
+import collections
+import threading
+import time
+
+from . import _hooks
+
+
+
+_clock = time.perf_counter
+
+
+
+class Span(object):
+
+    """
+    A timed :class:`WiresCallable <wires._callable.WiresCallable>` call, when
+    :attr:`function` is ``None``, or wiring call, otherwise.
+    """
+
+    __slots__ = ('name', 'function', 'start', 'end', 'exception', 'children')
+
+    def __init__(self, name, function=None):
+
+        # The WiresCallable name and, for wiring spans, the wired function.
+        self.name = name
+        self.function = function
+
+        # Clock readings; `end` is None while in progress.
+        self.start = _clock()
+        self.end = None
+
+        # Wiring raised exception, if any.
+        self.exception = None
+
+        # Nested spans, in call order.
+        self.children = []
+
+
+    def __repr__(self):
+
+        return '<%s %r%s %s>' % (
+            self.__class__.__name__,
+            self.name,
+            '' if self.function is None else ' %r' % (self.function,),
+            'in progress' if self.end is None else '%.6fs' % self.duration,
+        )
+
+
+    @property
+    def duration(self):
+        """
+        Span duration in seconds or ``None``, if in progress.
+        """
+        return None if self.end is None else self.end - self.start
+
+
+    def walk(self, depth=0):
+        """
+        Generates ``(<depth>, <span>)`` tuples for this span and all its
+        descendants, depth first.
+        """
+        yield depth, self
+        for child in self.children:
+            for item in child.walk(depth + 1):
+                yield item
+
+
+
+class WiresTracer(_hooks.WiresHook):
+
+    """
+    :class:`WiresTracer` Class.
+    """
+
+    def __init__(self, sample_every=None, max_rate=None, max_spans=1000,
+                 on_span=None):
+        """
+        With neither ``sample_every`` nor ``max_rate`` set, all calls are traced.
+
+        :param sample_every: Trace one in every ``sample_every`` calls, per
+                             callable.
+        :type sample_every: ``int`` > 0 or ``None``
+
+        :param max_rate: Trace at most ``max_rate`` calls per second, per
+                         callable.
+        :type max_rate: ``float`` > 0 or ``None``
+
+        :param max_spans: How many root spans are kept in :attr:`spans`; older
+                          ones are discarded.
+        :type max_spans: ``int``
+
+        :param on_span: Called with each completed root :class:`Span`.
+        :type on_span: ``callable`` or ``None``
+        """
+        if sample_every is not None and sample_every <= 0:
+            raise ValueError('sample_every must be positive or None')
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError('max_rate must be positive or None')
+
+        self._sample_every = sample_every
+        self._max_rate = max_rate
+        self._on_span = on_span
+
+        # Per callable name call counters, for `sample_every`.
+        self._counters = {}
+
+        # Per callable name [<tokens>, <last refill time>], for `max_rate`.
+        self._buckets = {}
+
+        # Completed root spans.
+        self._spans = collections.deque(maxlen=max_spans)
+
+        # Per-thread stack of in-progress spans.
+        self._local = threading.local()
+
+
+    def _span_stack(self):
+
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+
+    def _sampled(self, name):
+
+        # Per-callable sampling decision: both criteria, if set, must agree.
+
+        if self._sample_every is not None:
+            count = self._counters.get(name, 0) + 1
+            if count < self._sample_every:
+                self._counters[name] = count
+                return False
+            self._counters[name] = 0
+
+        if self._max_rate is not None:
+            # Token bucket, holding up to one second's worth of tokens.
+            now = _clock()
+            try:
+                bucket = self._buckets[name]
+            except KeyError:
+                bucket = self._buckets[name] = [self._max_rate, now]
+            tokens = min(
+                self._max_rate,
+                bucket[0] + (now - bucket[1]) * self._max_rate,
+            )
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1
+
+        return True
+
+
+    def enter(self, wires_callable, args, kwargs):
+
+        stack = self._span_stack()
+        name = wires_callable.__name__
+        if not stack and not self._sampled(name):
+            return False
+
+        span = Span(name)
+        if stack:
+            stack[-1].children.append(span)
+        stack.append(span)
+        return True
+
+
+    def leave(self, wires_callable):
+
+        stack = self._span_stack()
+        span = stack.pop()
+        span.end = _clock()
+        if not stack:
+            self._spans.append(span)
+            if self._on_span is not None:
+                self._on_span(span)
+
+
+    def before(self, wires_callable, function):
+
+        stack = self._span_stack()
+        span = Span(wires_callable.__name__, function)
+        stack[-1].children.append(span)
+        stack.append(span)
+
+
+    def after(self, wires_callable, function, result):
+
+        self._span_stack().pop().end = _clock()
+
+
+    def exception(self, wires_callable, function, exception):
+
+        span = self._span_stack().pop()
+        span.end = _clock()
+        span.exception = exception
+
+
+    @property
+    def spans(self):
+        """
+        List of the most recent completed root :class:`Span`\\s, oldest first.
+        """
+        return list(self._spans)
+
+
+    def reset(self):
+        """
+        Discards all recorded spans and sampling state.
+        """
+        self._spans.clear()
+        self._counters.clear()
+        self._buckets.clear()
+
+
+# ----------------------------------------------------------------------------
@@ -38,11 +38,24 @@ Deleting attributes deletes the associated callable:
 >>> del w.one_callable      # Delete and check it's gone.
 >>> len(w)
 0
+
+:class:`Wires` objects can be pickled, copied and deep copied, along with
+their settings, callables and wirings; attached hooks and pending call-time
+settings are not included. Copies share wiring tuples with the original,
+while deep copies share those without wire-time arguments:
+
+>>> w.one_callable.wire(print, 'hi')
+>>> w2 = copy.deepcopy(w)
+>>> w2.one_callable.wirings
+[(<built-in function print>, ('hi',), {})]
+
+Names starting and ending with double underscores, like ``__deepcopy__``, are
+reserved for Python protocols: accessing them does not create callables.
 """
 
-from __future__ import absolute_import
+import copy
 
-from . import _callable
+from . import _callable, _failures
 
 
 
@@ -53,14 +66,26 @@ class Wires(object):
     """
 
     # Holds the default, per-callable, `min_wirings` and `max_wirings` as well
-    # as the default caller/callee call-time coupling settings `returns` and
-    # `ignore_exceptions` settings.
+    # as the default caller/callee call-time coupling settings `returns`,
+    # `ignore_exceptions`, `exception_detail` and `timeout` settings.
     #
     # Tracks wired callabes in `_callables` and call-time override settings in
     # `_calltime_settings`.
 
+    def __new__(cls, *args, **kwargs):
+
+        # Disabled objects are DisabledWires instances: see wires._disabled.
+
+        enabled = args[5] if len(args) > 5 else kwargs.get('enabled', True)
+        if cls is Wires and not enabled:
+            from . import _disabled
+            cls = _disabled.DisabledWires
+        return super(Wires, cls).__new__(cls)
+
+
     def __init__(self, min_wirings=None, max_wirings=None, returns=False,
-                 ignore_exceptions=True):
+                 ignore_exceptions=True, exception_detail='full',
+                 enabled=True, timeout=None):
         """
         Initialization arguments determine default settings for this object's
         :class:`WiresCallable <wires._callable.WiresCallable>`\\s.
@@ -84,6 +109,20 @@ class Wires(object):
                                   if ``False``, wired callable calling will stop
                                   after the first exception.
         :type ignore_exceptions: ``bool``
+
+        :param exception_detail: What call results hold for wiring raised
+                                 exceptions: one of ``'full'``,
+                                 ``'no_traceback'``, ``'compact'`` or
+                                 ``'summary'``; see :mod:`wires._failures`.
+        :type exception_detail: ``str``
+
+        :param enabled: If ``False``, callables record wirings but never call
+                        them; see :mod:`wires._disabled`.
+        :type enabled: ``bool``
+
+        :param timeout: Seconds calls have to complete, or ``None``, meaning
+                        no limit; see :mod:`wires._timeout`.
+        :type timeout: ``float`` > 0 or ``None``
         """
         if min_wirings is not None and min_wirings <= 0:
             raise ValueError('min_wirings must be positive or None')
@@ -91,6 +130,10 @@ class Wires(object):
             raise ValueError('max_wirings must be positive or None')
         if min_wirings and max_wirings and min_wirings > max_wirings:
             raise ValueError('max_wirings must be >= min_wirings')
+        if exception_detail not in _failures.EXCEPTION_DETAILS:
+            raise ValueError('invalid exception_detail: %r' % (exception_detail,))
+        if timeout is not None and timeout <= 0:
+            raise ValueError('timeout must be positive or None')
 
         self._settings = {
             # Default wiring limits.
@@ -100,6 +143,8 @@ class Wires(object):
             # Default call-time coupling behaviour.
             'returns': returns,
             'ignore_exceptions': ignore_exceptions,
+            'exception_detail': exception_detail,
+            'timeout': timeout,
         }
 
         # Tracks known Callable instances:
@@ -110,6 +155,10 @@ class Wires(object):
         # Call time override settings.
         self._calltime_settings = {}
 
+        # Attached WiresHook objects, called around each wiring call; kept as
+        # a tuple such that dispatching WiresCallables can iterate it safely.
+        self._hooks = ()
+
 
     def __repr__(self):
         """
@@ -124,7 +173,17 @@ class Wires(object):
     def __getattr__(self, name):
         """
         Attribute based access to :class:`WiresCallable <wires._callable.WiresCallable>`\\s.
+
+        :raises AttributeError: If ``name`` starts and ends with double
+                                underscores.
         """
+        if name[:2] == '__' and name[-2:] == '__':
+            # Python protocol lookups, like copy's and pickle's, come here.
+            raise AttributeError(name)
+        if name in _STATE_ATTRIBUTES:
+            # Only looked up here before `__init__` or `__setstate__` run.
+            raise AttributeError(name)
+
         try:
             the_callable = self._callables[name]
         except KeyError:
@@ -186,7 +245,111 @@ class Wires(object):
         return iter(self._callables.values())
 
 
-    def __call__(self, returns=None, ignore_exceptions=None):
+    def _restore_callable(self, name, callable_settings, wirings):
+
+        # Creates the `name` callable with the given per-callable settings and
+        # wirings, a list as held by a `WiresCallable`, of the same type and
+        # in call order, bypassing validation: used when restoring a known
+        # good state.
+
+        wires_callable = self[name]
+        wires_callable._callable_settings.update(callable_settings)
+        wires_callable._wirings = wirings
+        return wires_callable
+
+
+    def _named_wirings(self, wirings):
+
+        # Returns `wirings` with our own callables, wired to ours, as
+        # `_CallableName`s: unpickling and copying our state refers to the
+        # new object's callables, and doesn't look them up before it exists.
+
+        if not any(self._is_own_callable(wiring[0]) for wiring in wirings):
+            return wirings
+        return type(wirings)(
+            _with_function(wiring, _CallableName(wiring[0]._name))
+            if self._is_own_callable(wiring[0]) else wiring
+            for wiring in wirings
+        )
+
+
+    def _is_own_callable(self, function):
+
+        return isinstance(function, _callable.WiresCallable) and function._wires is self
+
+
+    def _resolved_wirings(self, wirings):
+
+        # Undoes `_named_wirings`, with our callables, in a new list.
+
+        return type(wirings)(
+            _with_function(wiring, self[wiring[0].name])
+            if type(wiring[0]) is _CallableName else wiring
+            for wiring in wirings
+        )
+
+
+    def __getstate__(self):
+
+        return {
+            'settings': self._settings,
+            'callables': [
+                (c._name, c._callable_settings, self._named_wirings(c._current_wirings()))
+                for c in self._callables.values()
+            ],
+            'attributes': dict(
+                (k, v) for k, v in self.__dict__.items()
+                if not k.startswith('_') and k not in self._callables
+            ),
+        }
+
+
+    def __setstate__(self, state):
+
+        self._settings = dict(state['settings'])
+        self._callables = {}
+        self._calltime_settings = {}
+        self._hooks = ()
+        for name, callable_settings, wirings in state['callables']:
+            self._restore_callable(
+                name, callable_settings, self._resolved_wirings(wirings),
+            )
+        self.__dict__.update(state['attributes'])
+
+
+    def __copy__(self):
+        """
+        Returns a new object with the same settings, callables and wirings;
+        wiring tuples are shared, other than those wired to this object's
+        callables, which are wired to the new object's.
+        """
+        result = self.__class__.__new__(self.__class__)
+        result.__setstate__(self.__getstate__())
+        return result
+
+
+    def __deepcopy__(self, memo):
+        """
+        Returns a new object with the same settings, callables and wirings;
+        wire-time arguments are deep copied, and wirings to this object's
+        callables are wired to the new object's.
+        """
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+
+        state = self.__getstate__()
+        state['callables'] = [
+            (name, callable_settings,
+             type(wirings)(_deepcopy_wiring(w, memo) for w in wirings))
+            for name, callable_settings, wirings in state['callables']
+        ]
+        state['attributes'] = copy.deepcopy(state['attributes'], memo)
+        result.__setstate__(state)
+        return result
+
+
+    def __call__(self, returns=None, ignore_exceptions=None,
+                 exception_detail=None, timeout=None):
         """
         Call-time settings override.
 
@@ -200,6 +363,14 @@ class Wires(object):
                                   after the first exception.
         :type ignore_exceptions: ``bool``
 
+        :param exception_detail: What call results hold for wiring raised
+                                 exceptions; see :mod:`wires._failures`.
+        :type exception_detail: ``str``
+
+        :param timeout: Seconds the call has to complete; see
+                        :mod:`wires._timeout`.
+        :type timeout: ``float`` > 0
+
         Usage example:
 
         >>> w = Wires(returns=False)
@@ -214,8 +385,77 @@ class Wires(object):
             self._calltime_settings['returns'] = returns
         if ignore_exceptions is not None:
             self._calltime_settings['ignore_exceptions'] = ignore_exceptions
+        if exception_detail is not None:
+            if exception_detail not in _failures.EXCEPTION_DETAILS:
+                raise ValueError('invalid exception_detail: %r' % (exception_detail,))
+            self._calltime_settings['exception_detail'] = exception_detail
+        if timeout is not None:
+            if timeout <= 0:
+                raise ValueError('timeout must be positive or None')
+            self._calltime_settings['timeout'] = timeout
 
         return self
 
 
+
+# Instance attributes set by `__init__` and `__setstate__`.
+_STATE_ATTRIBUTES = frozenset((
+    '_settings', '_callables', '_calltime_settings', '_hooks',
+))
+
+
+
+class _CallableName(object):
+
+    # Stands for a `Wires` object's callable, wired to one of its callables,
+    # in its pickled and copied state.
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+
+        self.name = name
+
+
+    def __reduce__(self):
+
+        return (self.__class__, (self.name,))
+
+
+
+def _with_function(wiring, function):
+
+    # Returns `wiring` with `function` as its wired function, keeping any
+    # wiring options.
+
+    new_wiring = (function,) + tuple(wiring[1:])
+    if type(wiring) is tuple:
+        return new_wiring
+    return _callable._Wiring(new_wiring, wiring.__dict__)
+
+
+
+def _deepcopy_wiring(wiring, memo):
+
+    # Wired functions are shared, like copy.deepcopy does. Wires never mutates
+    # wire-time arguments: the wiring tuple itself is shared if deep copying
+    # them changes nothing, like when there are none. Wiring option values are
+    # deep copied, through the same memo: wirings sharing a cache or breaker
+    # share its copy.
+
+    function, args, kwargs = wiring
+    new_args = copy.deepcopy(args, memo)
+    new_kwargs = copy.deepcopy(kwargs, memo) if kwargs else kwargs
+    if type(wiring) is tuple:
+        if new_args is args and new_kwargs is kwargs:
+            return wiring
+        return (function, new_args, new_kwargs)
+
+    options = {
+        name: copy.deepcopy(value, memo)
+        for name, value in wiring.__dict__.items()
+    }
+    return _callable._Wiring((function, new_args, new_kwargs), options)
+
+
 # ----------------------------------------------------------------------------
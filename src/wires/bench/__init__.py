@@ -0,0 +1,78 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires benchmarks.
+
+Covers :class:`Wires <wires._wires.Wires>` attribute access,
+:class:`WiresCallable <wires._callable.WiresCallable>` calls across fan-out
+sizes and call coupling settings, wire-time vs. call-time argument merging,
+wiring churn and memory usage.
+
+Run from the command line, optionally selecting benchmarks by name pattern,
+saving results as JSON:
+
+.. code-block:: console
+
+    $ python -m wires.bench run --output results.json 'call.*'
+
+Compare two result files, exiting with status 1 if any benchmark regressed
+significantly, or run the benchmarks in a stored baseline and compare against
+it:
+
+.. code-block:: console
+
+    $ python -m wires.bench compare base.json new.json
+    $ python -m wires.bench compare base.json
+
+Measure the overhead of :class:`Wires <wires._wires.Wires>` against a plain
+list of callbacks, :func:`functools.partial` fan-out and, if installed, other
+signal libraries, with identical scenarios; reports times relative to the
+plain list of callbacks:
+
+.. code-block:: console
+
+    $ python -m wires.bench styles --output styles.json
+
+Measure memory retained over simulated wire/call/unwire cycles, with call
+results discarded and kept, attributing growth to source lines:
+
+.. code-block:: console
+
+    $ python -m wires.bench memory
+
+Long running processes can use a :class:`MemoryMonitor
+<wires.bench._memory.MemoryMonitor>` to detect callables with monotonically
+growing wirings and exceptions retained through call results.
+
+Or programmatically:
+
+>>> from wires import bench
+>>> results = bench.run(['getattr.*'], repeat=3)
+>>> sorted(results['benchmarks'])
+['getattr.calltime-settings', 'getattr.create-delete', 'getattr.existing', 'getattr.getitem']
+"""
+
+from . _suite import Benchmark, SUITE
+from . _runner import run, select, dumps, save, load
+from . _compare import compare, format_comparisons, welch_t_test
+from . import _styles as styles
+from . _memory import (
+    MemoryMonitor, MemoryReport, callable_footprint, retained_exceptions,
+    simulate, wires_footprint, wiring_footprint,
+)
+
+
+__all__ = [
+    'Benchmark', 'SUITE', 'run', 'select', 'dumps', 'save', 'load',
+    'compare', 'format_comparisons', 'welch_t_test', 'styles',
+    'MemoryMonitor', 'MemoryReport', 'callable_footprint', 'retained_exceptions',
+    'simulate', 'wires_footprint', 'wiring_footprint',
+]
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,199 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires benchmarks command line interface.
+"""
+
+import argparse
+import sys
+
+from . import _compare, _memory, _runner, _styles
+
+
+
+def _cmd_run(args):
+
+    if args.list:
+        for benchmark in _runner.select(args.patterns):
+            sys.stdout.write('%s\n' % (benchmark.name,))
+        return 0
+
+    def progress(name):
+        sys.stderr.write('%s\n' % (name,))
+
+    results = _runner.run(
+        args.patterns,
+        repeat=args.repeat,
+        scale=args.scale,
+        progress=None if args.quiet else progress,
+    )
+
+    if args.output:
+        _runner.save(results, args.output)
+    else:
+        sys.stdout.write(_runner.dumps(results))
+    return 0
+
+
+
+def _cmd_compare(args):
+
+    base = _runner.load(args.base)
+
+    if args.new:
+        new = _runner.load(args.new)
+    else:
+        # No new results: run the baseline benchmarks, as they were run.
+        base_metadata = base['metadata']
+        new = _runner.run(
+            sorted(base['benchmarks']),
+            repeat=base_metadata['repeat'],
+            scale=base_metadata['scale'],
+        )
+        if args.output:
+            _runner.save(new, args.output)
+
+    comparisons = _compare.compare(
+        base, new, threshold=args.threshold, alpha=args.alpha,
+    )
+    sys.stdout.write(
+        '%s\n' % (_compare.format_comparisons(comparisons, args.changed_only),)
+    )
+
+    regressions = [c for c in comparisons if c.verdict == _compare.REGRESSION]
+    return 1 if regressions else 0
+
+
+
+def _cmd_styles(args):
+
+    def progress(name):
+        sys.stderr.write('%s\n' % (name,))
+
+    results = _runner.run(
+        args.patterns,
+        repeat=args.repeat,
+        scale=args.scale,
+        progress=None if args.quiet else progress,
+        suite=_styles.SUITE,
+    )
+    if args.output:
+        _runner.save(results, args.output)
+
+    sys.stdout.write('%s\n' % (_styles.format_overhead(results),))
+    for name in _styles.skipped():
+        sys.stdout.write('skipped %s: not installed\n' % (name,))
+    return 0
+
+
+
+def _cmd_memory(args):
+
+    for keep_results in (False, True):
+        result = _memory.simulate(
+            cycles=args.cycles,
+            fan_out=args.fan_out,
+            keep_results=keep_results,
+        )
+        sys.stdout.write('%s results: %.1f B retained per cycle\n' % (
+            'kept' if keep_results else 'discarded',
+            result['retained_per_cycle'],
+        ))
+        for location, size in result['top']:
+            sys.stdout.write('  %s: %d B\n' % (location, size))
+    return 0
+
+
+
+def _parser():
+
+    parser = argparse.ArgumentParser(
+        prog='python -m wires.bench',
+        description='Python Wires benchmarks.',
+    )
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+
+    run = commands.add_parser('run', help='run benchmarks')
+    run.add_argument('patterns', nargs='*', metavar='PATTERN',
+                     help='select benchmarks matching fnmatch style patterns')
+    run.add_argument('-o', '--output', metavar='FILE',
+                     help='save JSON results to FILE instead of printing them')
+    run.add_argument('-r', '--repeat', type=int, default=5,
+                     help='samples per benchmark (default: %(default)s)')
+    run.add_argument('-s', '--scale', type=float, default=1.0,
+                     help='operation count multiplier (default: %(default)s)')
+    run.add_argument('-l', '--list', action='store_true',
+                     help='list selected benchmark names and exit')
+    run.add_argument('-q', '--quiet', action='store_true',
+                     help='do not report progress')
+    run.set_defaults(handler=_cmd_run)
+
+    compare = commands.add_parser(
+        'compare',
+        help='compare results, exiting with 1 on significant regressions',
+    )
+    compare.add_argument('base', metavar='BASE',
+                         help='baseline JSON results file')
+    compare.add_argument('new', nargs='?', metavar='NEW',
+                         help='new JSON results file; if omitted, runs the '
+                              'baseline benchmarks')
+    compare.add_argument('-o', '--output', metavar='FILE',
+                         help='save new JSON results to FILE, when running')
+    compare.add_argument('-t', '--threshold', type=float, default=0.05,
+                         help='minimum relative mean change (default: %(default)s)')
+    compare.add_argument('-a', '--alpha', type=float, default=0.01,
+                         help='significance level (default: %(default)s)')
+    compare.add_argument('-c', '--changed-only', action='store_true',
+                         help='report regressions and improvements only')
+    compare.set_defaults(handler=_cmd_compare)
+
+    styles = commands.add_parser(
+        'styles',
+        help='compare Wires against other dispatch styles',
+    )
+    styles.add_argument('patterns', nargs='*', metavar='PATTERN',
+                        help='select benchmarks matching fnmatch style patterns')
+    styles.add_argument('-o', '--output', metavar='FILE',
+                        help='save JSON results to FILE')
+    styles.add_argument('-r', '--repeat', type=int, default=5,
+                        help='samples per benchmark (default: %(default)s)')
+    styles.add_argument('-s', '--scale', type=float, default=1.0,
+                        help='operation count multiplier (default: %(default)s)')
+    styles.add_argument('-q', '--quiet', action='store_true',
+                        help='do not report progress')
+    styles.set_defaults(handler=_cmd_styles)
+
+    memory = commands.add_parser(
+        'memory',
+        help='measure memory retained over wire/call/unwire cycles',
+    )
+    memory.add_argument('-c', '--cycles', type=int, default=1000,
+                        help='simulated cycles (default: %(default)s)')
+    memory.add_argument('-f', '--fan-out', type=int, default=10,
+                        help='wirings per cycle (default: %(default)s)')
+    memory.set_defaults(handler=_cmd_memory)
+
+    return parser
+
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    args = _parser().parse_args(argv)
+    return args.handler(args)
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,238 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires benchmark result comparison.
+
+Compares two benchmark runs, typically a stored baseline and a new run, per
+benchmark, using Welch's t-test on the collected samples: a benchmark is
+flagged as a regression or an improvement only if its mean changed by more
+than a relative ``threshold`` and that change is statistically significant,
+at a given ``alpha`` level.
+"""
+
+import math
+import statistics
+
+
+
+REGRESSION = 'regression'
+IMPROVEMENT = 'improvement'
+UNCHANGED = 'unchanged'
+MISSING = 'missing'
+ADDED = 'added'
+
+
+
+class Comparison(object):
+
+    """
+    The comparison of a single benchmark across two runs.
+    """
+
+    __slots__ = ('name', 'unit', 'base_mean', 'new_mean', 'p_value', 'verdict')
+
+    def __init__(self, name, unit, base_mean, new_mean, p_value, verdict):
+
+        self.name = name
+        self.unit = unit
+        self.base_mean = base_mean
+        self.new_mean = new_mean
+        self.p_value = p_value
+        self.verdict = verdict
+
+
+    def __repr__(self):
+
+        return '<%s %r %s>' % (self.__class__.__name__, self.name, self.verdict)
+
+
+    @property
+    def ratio(self):
+        """
+        New to base mean ratio or ``None``, if not available.
+        """
+        if self.base_mean is None or self.new_mean is None or not self.base_mean:
+            return None
+        return self.new_mean / self.base_mean
+
+
+
+def _incomplete_beta_fraction(a, b, x):
+
+    # Continued fraction for the regularized incomplete beta function, by the
+    # modified Lentz's method.
+
+    tiny = 1e-300
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 301):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+
+def _incomplete_beta(a, b, x):
+
+    # Regularized incomplete beta function I_x(a, b).
+
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+        a * math.log(x) + b * math.log(1.0 - x)
+    )
+    front = math.exp(log_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _incomplete_beta_fraction(a, b, x) / a
+    return 1.0 - front * _incomplete_beta_fraction(b, a, 1.0 - x) / b
+
+
+
+def welch_t_test(samples_a, samples_b):
+    """
+    Returns the two-sided p-value of Welch's t-test for the hypothesis that
+    ``samples_a`` and ``samples_b`` have equal means.
+    """
+    n_a = len(samples_a)
+    n_b = len(samples_b)
+    if n_a < 2 or n_b < 2:
+        raise ValueError('need at least two samples each')
+
+    mean_a = statistics.mean(samples_a)
+    mean_b = statistics.mean(samples_b)
+    se2_a = statistics.variance(samples_a) / n_a
+    se2_b = statistics.variance(samples_b) / n_b
+    se2 = se2_a + se2_b
+
+    if not se2:
+        # No variance at all: any difference is significant.
+        return 1.0 if mean_a == mean_b else 0.0
+
+    t = (mean_a - mean_b) / math.sqrt(se2)
+    dof = se2 ** 2 / (se2_a ** 2 / (n_a - 1) + se2_b ** 2 / (n_b - 1))
+    return _incomplete_beta(dof / 2.0, 0.5, dof / (dof + t * t))
+
+
+
+def compare(base, new, threshold=0.05, alpha=0.01):
+    """
+    Compares ``base`` and ``new`` benchmark results.
+
+    :param threshold: Minimum relative mean change for a benchmark to be
+                      considered a regression or an improvement.
+    :type threshold: ``float``
+
+    :param alpha: Significance level: maximum p-value for a change to be
+                  considered statistically significant.
+    :type alpha: ``float``
+
+    :returns: A list of :class:`Comparison` objects, sorted by name.
+    """
+    base_benchmarks = base['benchmarks']
+    new_benchmarks = new['benchmarks']
+
+    result = []
+    for name in sorted(set(base_benchmarks) | set(new_benchmarks)):
+        base_result = base_benchmarks.get(name)
+        new_result = new_benchmarks.get(name)
+
+        if base_result is None:
+            result.append(Comparison(
+                name, new_result['unit'], None, new_result['mean'], None, ADDED,
+            ))
+            continue
+        if new_result is None:
+            result.append(Comparison(
+                name, base_result['unit'], base_result['mean'], None, None, MISSING,
+            ))
+            continue
+
+        base_mean = base_result['mean']
+        new_mean = new_result['mean']
+        p_value = welch_t_test(base_result['samples'], new_result['samples'])
+
+        verdict = UNCHANGED
+        if p_value < alpha:
+            if new_mean > base_mean * (1 + threshold):
+                verdict = REGRESSION
+            elif new_mean < base_mean * (1 - threshold):
+                verdict = IMPROVEMENT
+
+        result.append(Comparison(
+            name, base_result['unit'], base_mean, new_mean, p_value, verdict,
+        ))
+
+    return result
+
+
+
+def _format_value(value, unit):
+
+    if value is None:
+        return '-'
+    if unit == 's':
+        for scale, suffix in ((1e-9, 'ns'), (1e-6, 'us'), (1e-3, 'ms')):
+            if value < scale * 1000:
+                return '%.2f %s' % (value / scale, suffix)
+        return '%.2f s' % (value,)
+    return '%.1f %s' % (value, unit)
+
+
+
+def format_comparisons(comparisons, changed_only=False):
+    """
+    Returns a plain text table of ``comparisons``, limited to those flagged as
+    regressions or improvements if ``changed_only`` is ``True``.
+    """
+    rows = [('benchmark', 'base', 'new', 'ratio', 'p-value', 'verdict')]
+    for comparison in comparisons:
+        if changed_only and comparison.verdict == UNCHANGED:
+            continue
+        ratio = comparison.ratio
+        rows.append((
+            comparison.name,
+            _format_value(comparison.base_mean, comparison.unit),
+            _format_value(comparison.new_mean, comparison.unit),
+            '-' if ratio is None else '%.3f' % (ratio,),
+            '-' if comparison.p_value is None else '%.4f' % (comparison.p_value,),
+            comparison.verdict,
+        ))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(cell.rjust(width) for cell, width in zip(row[1:-1], widths[1:-1]))
+        cells.append(row[-1])
+        lines.append('  '.join(cells))
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,353 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires memory diagnostics.
+
+Estimates the memory held by live :class:`Wires <wires._wires.Wires>` objects,
+their :class:`WiresCallable <wires._callable.WiresCallable>`\\s and wirings,
+detects callables whose wirings grow monotonically over time, and finds
+wiring raised exceptions retained through call results, along with the
+frames their tracebacks keep alive:
+
+>>> monitor = MemoryMonitor(w)
+>>> monitor.sample()                # Periodically, say, once a minute.
+>>> print(monitor.report())
+
+:func:`simulate` uses :mod:`tracemalloc` to measure the memory retained over
+simulated wire/unwire/call cycles, attributing growth to source lines.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+import types
+
+from .. import _failures, _wires
+
+
+
+def _deep_size(obj, seen):
+
+    # Size of `obj` and the containers/items it holds, not counting objects
+    # already in `seen`, nor functions, classes and modules, which are
+    # shared and owned elsewhere.
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (type, types.ModuleType, types.FunctionType,
+                        types.BuiltinFunctionType, types.MethodType)):
+        return 0
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_size(key, seen) + _deep_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _deep_size(item, seen)
+    return size
+
+
+
+def wiring_footprint(wiring):
+    """
+    Returns the estimated bytes held by ``wiring``, a
+    ``(<function>, <args>, <kwargs>)`` tuple, excluding ``<function>``.
+    """
+    seen = set([id(wiring[0])])
+    return _deep_size(wiring, seen)
+
+
+
+def callable_footprint(wires_callable):
+    """
+    Returns a ``(<callable bytes>, <wirings bytes>)`` tuple for
+    ``wires_callable``, a :class:`WiresCallable <wires._callable.WiresCallable>`,
+    where ``<callable bytes>`` excludes its wirings.
+    """
+    # The shared Wires settings and Wires object are not ours.
+    seen = set([id(wires_callable._wires), id(wires_callable._wires_settings)])
+    wirings = wires_callable._current_wirings()
+    seen.add(id(wirings))
+    callable_bytes = _deep_size(wires_callable, seen)
+    callable_bytes += _deep_size(wires_callable.__dict__, seen)
+    callable_bytes += sys.getsizeof(wirings)
+    wirings_bytes = sum(wiring_footprint(wiring) for wiring in wirings)
+    return callable_bytes, wirings_bytes
+
+
+
+def wires_footprint(wires):
+    """
+    Returns the estimated bytes held by ``wires``, a
+    :class:`Wires <wires._wires.Wires>`, and its
+    :class:`WiresCallable <wires._callable.WiresCallable>`\\s, as a dict
+    with ``'wires'``, ``'callables'`` and ``'wirings'`` keys, where each
+    value is a total, excluding the others.
+    """
+    seen = set(id(c) for c in wires._callables.values())
+    wires_bytes = _deep_size(wires, seen) + _deep_size(wires.__dict__, seen)
+
+    callables_bytes = 0
+    wirings_bytes = 0
+    for wires_callable in wires._callables.values():
+        callable_bytes, callable_wirings_bytes = callable_footprint(wires_callable)
+        callables_bytes += callable_bytes
+        wirings_bytes += callable_wirings_bytes
+
+    return {
+        'wires': wires_bytes,
+        'callables': callables_bytes,
+        'wirings': wirings_bytes,
+    }
+
+
+
+def _traceback_frame_count(exception):
+
+    count = 0
+    tb = exception.__traceback__
+    while tb is not None:
+        count += 1
+        tb = tb.tb_next
+    return count
+
+
+
+def _looks_like_call_result(obj):
+
+    # A list of (<exception, failure record or None>, <result>) tuples, with
+    # at least one exception: what returns=True WiresCallable calls return.
+
+    has_exception = False
+    for item in obj:
+        if type(item) is not tuple or len(item) != 2:
+            return False
+        if item[0] is None or isinstance(item[0], _failures.WiringFailure):
+            continue
+        if not isinstance(item[0], BaseException) or item[1] is not None:
+            return False
+        has_exception = True
+    return has_exception
+
+
+
+def retained_exceptions():
+    """
+    Returns a list of ``(<exception>, <frame count>)`` tuples for exceptions
+    with tracebacks held in live, call result looking, lists, where
+    ``<frame count>`` is the number of frames kept alive by the traceback.
+
+    This inspects all objects tracked by the garbage collector: it is slow.
+    """
+    result = []
+    seen = set()
+    for obj in gc.get_objects():
+        if type(obj) is not list or not obj or not _looks_like_call_result(obj):
+            continue
+        for exception, _ in obj:
+            if not isinstance(exception, BaseException) or id(exception) in seen:
+                continue
+            seen.add(id(exception))
+            frame_count = _traceback_frame_count(exception)
+            if frame_count:
+                result.append((exception, frame_count))
+    return result
+
+
+
+class MemoryReport(object):
+
+    """
+    A :class:`MemoryMonitor` report.
+    """
+
+    def __init__(self, footprint, callables, growing, exceptions):
+
+        # wires_footprint() result.
+        self.footprint = footprint
+
+        # Per callable name (<wiring count>, <callable bytes>, <wirings bytes>).
+        self.callables = callables
+
+        # Callable names with monotonically growing wiring counts.
+        self.growing = growing
+
+        # retained_exceptions() result, or None if not checked.
+        self.exceptions = exceptions
+
+
+    def __str__(self):
+
+        lines = ['wires: %(wires)d B, callables: %(callables)d B, wirings: %(wirings)d B' % self.footprint]
+        for name in sorted(self.callables, key=lambda n: -self.callables[n][2]):
+            count, callable_bytes, wirings_bytes = self.callables[name]
+            lines.append('  %s: %d wirings, %d B + %d B%s' % (
+                name, count, callable_bytes, wirings_bytes,
+                ' (GROWING)' if name in self.growing else '',
+            ))
+        if self.exceptions is not None:
+            frames = sum(frame_count for _, frame_count in self.exceptions)
+            lines.append('retained exceptions: %d, pinning %d frames' % (
+                len(self.exceptions), frames,
+            ))
+            for exception, frame_count in self.exceptions[:10]:
+                lines.append('  %r: %d frames' % (exception, frame_count))
+        return '\n'.join(lines)
+
+
+
+class MemoryMonitor(object):
+
+    """
+    Tracks a :class:`Wires <wires._wires.Wires>` object's wiring counts over
+    time, detecting callables whose wirings grow monotonically.
+    """
+
+    def __init__(self, wires, window=5):
+        """
+        :param wires: The object to monitor.
+        :type wires: :class:`Wires <wires._wires.Wires>`
+
+        :param window: How many of the most recent samples are checked for
+                       monotonic wiring count growth.
+        :type window: ``int`` >= 2
+        """
+        if window < 2:
+            raise ValueError('window must be >= 2')
+
+        self._wires = wires
+        self._window = window
+
+        # Most recent {<callable name>: <wiring count>} samples, oldest first.
+        self._samples = []
+
+
+    def sample(self):
+        """
+        Records the current wiring count of each callable.
+        """
+        self._samples.append(dict(
+            (c.__name__, len(c)) for c in self._wires._callables.values()
+        ))
+        del self._samples[:-self._window]
+
+
+    def growing(self):
+        """
+        Returns a sorted list of callable names whose wiring count strictly
+        increased across the last ``window`` samples.
+        """
+        if len(self._samples) < self._window:
+            return []
+
+        result = []
+        for name in self._samples[-1]:
+            counts = [sample.get(name, 0) for sample in self._samples]
+            if all(a < b for a, b in zip(counts, counts[1:])):
+                result.append(name)
+        return sorted(result)
+
+
+    def report(self, check_exceptions=True):
+        """
+        Returns a :class:`MemoryReport`; checking for retained exceptions,
+        which is slow, may be skipped.
+        """
+        callables = {}
+        for wires_callable in self._wires._callables.values():
+            callables[wires_callable.__name__] = (
+                (len(wires_callable),) + callable_footprint(wires_callable)
+            )
+        return MemoryReport(
+            wires_footprint(self._wires),
+            callables,
+            self.growing(),
+            retained_exceptions() if check_exceptions else None,
+        )
+
+
+
+def _no_op(*args, **kwargs):
+
+    return None
+
+
+
+def _raises(*args, **kwargs):
+
+    raise ValueError('simulated exception')
+
+
+
+def simulate(cycles=1000, fan_out=10, keep_results=False, top=10):
+    """
+    Measures memory retained over ``cycles`` wire/call/unwire cycles, each
+    wiring ``fan_out`` wirings, one of which raises, to a fresh callable in a
+    long lived :class:`Wires <wires._wires.Wires>` object, with ``returns``
+    and ``ignore_exceptions`` set.
+
+    :param keep_results: Keep each call's result alive, as a careless caller
+                         might, to expose the cost of retained exceptions.
+
+    :returns: A dict with ``'retained_per_cycle'``, in bytes, and ``'top'``,
+              a list of ``(<file:line>, <bytes>)`` tuples for the source lines
+              retaining the most memory.
+    """
+    w = _wires.Wires(returns=True, ignore_exceptions=True)
+    kept = []
+
+    def cycle(index):
+        this = w['callable-%d' % (index % 10,)]
+        for _ in range(fan_out - 1):
+            this.wire(_no_op, index)
+        this.wire(_raises)
+        result = this(index)
+        if keep_results:
+            kept.append(result)
+        for _ in range(fan_out - 1):
+            this.unwire(_no_op)
+        this.unwire(_raises)
+
+    # Warm up: lets caches and free lists settle.
+    for index in range(min(cycles, 100)):
+        cycle(index)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(5)
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        for index in range(cycles):
+            cycle(index)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), 'lineno',
+    )
+    retained = sum(stat.size_diff for stat in stats)
+    top_lines = [
+        ('%s:%d' % (os.path.basename(stat.traceback[0].filename), stat.traceback[0].lineno),
+         stat.size_diff)
+        for stat in stats[:top] if stat.size_diff > 0
+    ]
+    return {
+        'retained_per_cycle': retained / float(cycles),
+        'top': top_lines,
+    }
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,170 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires benchmark runner.
+"""
+
+import fnmatch
+import io
+import json
+import platform
+import statistics
+import timeit
+
+from .. import __version__
+from . import _suite
+
+
+
+# Bumped on incompatible changes to the result structure.
+RESULTS_FORMAT = 1
+
+
+
+def _summary(samples):
+
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+
+def _run_timing(benchmark, repeat, scale):
+
+    statement, number = benchmark.setup()
+    number = max(1, int(number * scale))
+    timer = timeit.Timer(statement)
+
+    # Warm up, then collect per operation timings; `timeit` disables garbage
+    # collection while timing, reducing sample noise.
+    timer.timeit(max(1, number // 10))
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    result = {'unit': benchmark.unit, 'number': number, 'samples': samples}
+    result.update(_summary(samples))
+    return result
+
+
+
+def _run_memory(benchmark, repeat):
+
+    measure = benchmark.setup()
+    samples = [measure() for _ in range(repeat)]
+
+    result = {'unit': benchmark.unit, 'number': 1, 'samples': samples}
+    result.update(_summary(samples))
+    return result
+
+
+
+def select(patterns=None, suite=None):
+    """
+    Returns the benchmarks in ``suite``, defaulting to the full suite, with
+    names matching any of the ``fnmatch`` style ``patterns``, if given.
+    """
+    suite = _suite.SUITE if suite is None else suite
+    if not patterns:
+        return list(suite)
+    return [
+        benchmark for benchmark in suite
+        if any(fnmatch.fnmatchcase(benchmark.name, p) for p in patterns)
+    ]
+
+
+
+def metadata(**extra):
+    """
+    Returns a dict describing the running environment, updated with ``extra``.
+    """
+    result = {
+        'wires_version': __version__,
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+    result.update(extra)
+    return result
+
+
+
+def run(patterns=None, repeat=5, scale=1.0, progress=None, suite=None):
+    """
+    Runs the selected benchmarks and returns a results dict.
+
+    :param patterns: ``fnmatch`` style patterns selecting benchmarks by name;
+                     all are selected if empty or ``None``.
+
+    :param repeat: Samples collected per benchmark.
+    :type repeat: ``int`` > 1
+
+    :param scale: Multiplier applied to each timing benchmark's per sample
+                  operation count; lower values run faster, but noisier.
+    :type scale: ``float``
+
+    :param progress: Called with each benchmark's name, before running it.
+    :type progress: ``callable`` or ``None``
+
+    :param suite: Benchmarks to select from, defaulting to the full suite.
+    """
+    if repeat < 2:
+        raise ValueError('repeat must be >= 2')
+
+    results = {}
+    for benchmark in select(patterns, suite):
+        if progress is not None:
+            progress(benchmark.name)
+        if benchmark.unit == 'B':
+            results[benchmark.name] = _run_memory(benchmark, repeat)
+        else:
+            results[benchmark.name] = _run_timing(benchmark, repeat, scale)
+
+    return {
+        'format': RESULTS_FORMAT,
+        'metadata': metadata(repeat=repeat, scale=scale),
+        'benchmarks': results,
+    }
+
+
+
+def dumps(results):
+    """
+    Returns ``results`` as a stable, diff friendly, JSON string.
+    """
+    return json.dumps(results, indent=2, sort_keys=True) + '\n'
+
+
+
+def save(results, path):
+    """
+    Saves ``results`` as JSON to the file at ``path``.
+    """
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps(results))
+
+
+
+def load(path):
+    """
+    Returns results loaded from the JSON file at ``path``.
+
+    :raises ValueError: If the file format is not supported.
+    """
+    with io.open(path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+
+    if results.get('format') != RESULTS_FORMAT:
+        raise ValueError('unsupported results format in %r' % (path,))
+
+    return results
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,330 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires comparative benchmarks.
+
+Measures :class:`Wires <wires._wires.Wires>` dispatch against equivalent
+dispatch styles, each implemented by an :class:`Adapter`, running identical
+scenarios:
+
+* ``notify``: calls each receiver with one positional and one named call-time
+  argument, discarding results.
+* ``collect``: like ``notify``, but collecting each receiver's result.
+* ``bound``: like ``notify``, with each receiver also getting one positional
+  wire-time argument.
+
+Each scenario runs with several fan-out sizes, each with as many distinct
+receivers. The plain list of callbacks is the baseline other styles are
+compared to. Adapters for third party signal libraries are skipped if they
+are not installed.
+"""
+
+import functools
+import importlib
+
+from .. import _wires
+from . import _suite
+
+
+
+SCENARIOS = ('notify', 'collect', 'bound')
+
+FAN_OUT_SIZES = (1, 10, 100)
+
+BASELINE = 'callback-list'
+
+
+
+def _make_receivers(count):
+
+    # Distinct receivers: some libraries dedupe identical ones.
+
+    def make_receiver(index):
+        def receiver(*args, **kwargs):
+            return index
+        return receiver
+
+    return [make_receiver(index) for index in range(count)]
+
+
+
+class Adapter(object):
+
+    """
+    A dispatch style: builds, per scenario, a no-argument emit callable,
+    dispatching to the given receivers.
+    """
+
+    # Unique name; also used in benchmark names.
+    name = None
+
+    # Importable module required by this style, if any.
+    requires = None
+
+    def available(self):
+        """
+        Whether this style can run.
+        """
+        if self.requires is None:
+            return True
+        try:
+            importlib.import_module(self.requires)
+        except ImportError:
+            return False
+        return True
+
+
+    def build(self, scenario, receivers):
+        """
+        Returns a no-argument callable dispatching ``scenario`` to ``receivers``.
+        """
+        raise NotImplementedError()
+
+
+
+class WiresAdapter(Adapter):
+
+    """
+    :class:`Wires <wires._wires.Wires>` dispatch.
+    """
+
+    name = 'wires'
+
+    def build(self, scenario, receivers):
+
+        w = _wires.Wires(returns=(scenario == 'collect'))
+        this = w.this
+        for receiver in receivers:
+            if scenario == 'bound':
+                this.wire(receiver, 'wire-time')
+            else:
+                this.wire(receiver)
+
+        def emit():
+            return this('call-time', value=42)
+
+        return emit
+
+
+
+class CallbackListAdapter(Adapter):
+
+    """
+    Hand written loop over a plain list of callbacks: the baseline.
+    """
+
+    name = BASELINE
+
+    def build(self, scenario, receivers):
+
+        callbacks = list(receivers)
+
+        if scenario == 'collect':
+            def emit():
+                return [callback('call-time', value=42) for callback in callbacks]
+        elif scenario == 'bound':
+            def emit():
+                for callback in callbacks:
+                    callback('wire-time', 'call-time', value=42)
+        else:
+            def emit():
+                for callback in callbacks:
+                    callback('call-time', value=42)
+
+        return emit
+
+
+
+class PartialAdapter(Adapter):
+
+    """
+    Hand written loop over :func:`functools.partial` objects, holding any
+    wire-time arguments.
+    """
+
+    name = 'partial-fan-out'
+
+    def build(self, scenario, receivers):
+
+        if scenario == 'bound':
+            partials = [functools.partial(r, 'wire-time') for r in receivers]
+        else:
+            partials = [functools.partial(r) for r in receivers]
+
+        if scenario == 'collect':
+            def emit():
+                return [p('call-time', value=42) for p in partials]
+        else:
+            def emit():
+                for p in partials:
+                    p('call-time', value=42)
+
+        return emit
+
+
+
+class BlinkerAdapter(Adapter):
+
+    """
+    `blinker <https://pypi.org/project/blinker/>`_ signals; wire-time
+    arguments held in :func:`functools.partial` objects. Receivers get the
+    sender as their first positional argument.
+    """
+
+    name = 'blinker'
+    requires = 'blinker'
+
+    def build(self, scenario, receivers):
+
+        import blinker
+
+        signal = blinker.Signal()
+        receivers = [
+            functools.partial(r, 'wire-time') if scenario == 'bound' else r
+            for r in receivers
+        ]
+        for receiver in receivers:
+            # Strong references: blinker holds weak ones, by default.
+            signal.connect(receiver, weak=False)
+
+        def emit():
+            return signal.send('call-time', value=42)
+
+        return emit
+
+
+
+class PyDispatcherAdapter(Adapter):
+
+    """
+    `PyDispatcher <https://pypi.org/project/PyDispatcher/>`_ signals;
+    wire-time arguments held in :func:`functools.partial` objects.
+    """
+
+    name = 'pydispatcher'
+    requires = 'pydispatch'
+
+    def build(self, scenario, receivers):
+
+        from pydispatch import dispatcher
+
+        signal = object()
+        receivers = [
+            functools.partial(r, 'wire-time') if scenario == 'bound' else r
+            for r in receivers
+        ]
+        for receiver in receivers:
+            dispatcher.connect(receiver, signal=signal, weak=False)
+
+        def emit():
+            return dispatcher.send(signal, None, 'call-time', value=42)
+
+        return emit
+
+
+
+ADAPTERS = (
+    CallbackListAdapter(),
+    PartialAdapter(),
+    WiresAdapter(),
+    BlinkerAdapter(),
+    PyDispatcherAdapter(),
+)
+
+
+
+def _make_setup(adapter, scenario, fan_out):
+
+    def setup():
+        emit = adapter.build(scenario, _make_receivers(fan_out))
+        return emit, max(10, 100000 // fan_out)
+
+    return setup
+
+
+
+def _build_suite():
+
+    suite = []
+    for scenario in SCENARIOS:
+        for fan_out in FAN_OUT_SIZES:
+            for adapter in ADAPTERS:
+                if not adapter.available():
+                    continue
+                name = 'styles.%s.fan-out-%d.%s' % (scenario, fan_out, adapter.name)
+                setup = _make_setup(adapter, scenario, fan_out)
+                suite.append(_suite.Benchmark(name, 's', setup))
+    return suite
+
+
+
+def skipped():
+    """
+    Returns the names of adapters skipped for not being available.
+    """
+    return [adapter.name for adapter in ADAPTERS if not adapter.available()]
+
+
+
+SUITE = _build_suite()
+
+
+
+def overhead(results):
+    """
+    Returns ``{(<scenario>, <fan-out>): {<adapter name>: <ratio>}}``, where
+    ``<ratio>`` is the adapter's mean time relative to the baseline's.
+    """
+    means = {}
+    for name, result in results['benchmarks'].items():
+        _, scenario, fan_out, adapter_name = name.split('.', 3)
+        fan_out = int(fan_out[len('fan-out-'):])
+        means.setdefault((scenario, fan_out), {})[adapter_name] = result['mean']
+
+    ratios = {}
+    for key, adapter_means in means.items():
+        baseline = adapter_means.get(BASELINE)
+        if not baseline:
+            continue
+        ratios[key] = dict(
+            (adapter_name, mean / baseline)
+            for adapter_name, mean in adapter_means.items()
+        )
+    return ratios
+
+
+
+def format_overhead(results):
+    """
+    Returns a plain text table of each adapter's time relative to the
+    baseline, per scenario and fan-out size.
+    """
+    ratios = overhead(results)
+    adapter_names = [a.name for a in ADAPTERS if any(a.name in r for r in ratios.values())]
+
+    rows = [('scenario', 'fan-out') + tuple(adapter_names)]
+    for scenario in SCENARIOS:
+        for fan_out in FAN_OUT_SIZES:
+            adapter_ratios = ratios.get((scenario, fan_out))
+            if adapter_ratios is None:
+                continue
+            rows.append((scenario, str(fan_out)) + tuple(
+                '-' if name not in adapter_ratios else '%.2fx' % (adapter_ratios[name],)
+                for name in adapter_names
+            ))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+        lines.append('  '.join(cells))
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------------
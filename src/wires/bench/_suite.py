@@ -0,0 +1,516 @@
+# ----------------------------------------------------------------------------
+# Python Wires
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Python Wires benchmark definitions.
+
+Each :class:`Benchmark` has a unique, dotted name, a unit and a ``setup``
+function. Timing benchmarks, with ``'s'`` units, have ``setup`` return a
+``(<statement>, <number>)`` tuple, where ``<statement>`` is a no-argument
+callable, timed ``<number>`` times in a row per sample. Memory benchmarks,
+with ``'B'`` units, have ``setup`` return a no-argument callable that
+measures and returns a per-item byte count.
+"""
+
+import itertools
+import tracemalloc
+
+from .. import _routing, _shm, _snapshot, _wires
+
+
+
+FAN_OUT_SIZES = (0, 1, 10, 1000)
+
+CALL_COUPLINGS = tuple(itertools.product((False, True), repeat=2))
+
+
+
+class Benchmark(object):
+
+    """
+    A named benchmark.
+    """
+
+    __slots__ = ('name', 'unit', 'setup')
+
+    def __init__(self, name, unit, setup):
+
+        self.name = name
+        self.unit = unit
+        self.setup = setup
+
+
+    def __repr__(self):
+
+        return '<%s %r>' % (self.__class__.__name__, self.name)
+
+
+
+def _no_op(*args, **kwargs):
+
+    # The cheapest possible wiring.
+
+    return None
+
+
+
+def _raises(*args, **kwargs):
+
+    raise ValueError('benchmark exception')
+
+
+
+# ----------------------------------------------------------------------------
+# Attribute access.
+
+def _setup_getattr_existing():
+
+    w = _wires.Wires()
+    w.this.wire(_no_op)
+
+    def statement():
+        return w.this
+
+    return statement, 100000
+
+
+
+def _setup_getitem_existing():
+
+    w = _wires.Wires()
+    w.this.wire(_no_op)
+
+    def statement():
+        return w['this']
+
+    return statement, 100000
+
+
+
+def _setup_getattr_calltime_settings():
+
+    w = _wires.Wires()
+    w.this.wire(_no_op)
+
+    def statement():
+        return w(returns=True).this
+
+    return statement, 100000
+
+
+
+def _setup_getattr_create_delete():
+
+    w = _wires.Wires()
+
+    def statement():
+        _ = w.this
+        del w.this
+
+    return statement, 50000
+
+
+
+# ----------------------------------------------------------------------------
+# Dispatch.
+
+def _make_call_setup(fan_out, returns, ignore_exceptions, failing):
+
+    def setup():
+        w = _wires.Wires(returns=returns, ignore_exceptions=ignore_exceptions)
+        for _ in range(fan_out):
+            w.this.wire(_no_op)
+        if failing:
+            w.this.wire(_raises)
+        this = w.this
+
+        if failing and returns and not ignore_exceptions:
+            def statement():
+                try:
+                    this()
+                except RuntimeError:
+                    pass
+        else:
+            statement = this
+
+        # Keep total work per sample roughly constant across fan-out sizes.
+        return statement, max(10, 100000 // max(1, fan_out + failing))
+
+    return setup
+
+
+
+def _make_lazy_setup(fan_out):
+
+    def setup():
+        w = _wires.Wires()
+        for _ in range(fan_out):
+            w.this.wire(_no_op)
+        call_lazy = w.this.call_lazy
+
+        def build_payload():
+            return {'payload': list(range(10))}
+
+        def statement():
+            call_lazy(build_payload)
+
+        return statement, max(10, 100000 // max(1, fan_out))
+
+    return setup
+
+
+
+def _make_disabled_setup(fan_out):
+
+    def setup():
+        w = _wires.Wires(enabled=False)
+        for _ in range(fan_out):
+            w.this.wire(_no_op)
+
+        def statement():
+            w.this(42)
+
+        return statement, 100000
+
+    return setup
+
+
+
+def _setup_call_keyed():
+
+    # 2000 subscribers, one per key: call_key reaches the one that cares.
+
+    w = _wires.Wires()
+    for index in range(2000):
+        w.this.with_options(key=index).wire(_no_op)
+    call_key = w.this.call_key
+
+    def statement():
+        call_key(1000, 42)
+
+    return statement, 100000
+
+
+
+def _setup_call_where_equals():
+
+    # 2000 subscribers, one per indexed predicate value.
+
+    w = _wires.Wires()
+    for index in range(2000):
+        w.this.with_options(where=_routing.Equals(index)).wire(_no_op)
+    this = w.this
+
+    def statement():
+        this(1000)
+
+    return statement, 100000
+
+
+
+# ----------------------------------------------------------------------------
+# Argument merging.
+
+def _make_args_setup(wire_time, call_time):
+
+    def setup():
+        w = _wires.Wires()
+        if wire_time:
+            w.this.wire(_no_op, 1, 2, a=1, b=2)
+        else:
+            w.this.wire(_no_op)
+        this = w.this
+
+        if call_time:
+            def statement():
+                this(3, 4, b=3, c=4)
+        else:
+            statement = this
+
+        return statement, 100000
+
+    return setup
+
+
+
+# ----------------------------------------------------------------------------
+# Wiring churn.
+
+def _make_churn_setup(existing):
+
+    def setup():
+        w = _wires.Wires()
+        for _ in range(existing):
+            w.this.wire(_raises)
+        this = w.this
+
+        def statement():
+            this.wire(_no_op)
+            this.unwire(_no_op)
+
+        return statement, max(10, 50000 // max(1, existing))
+
+    return setup
+
+
+
+def _make_bulk_setup(bulk):
+
+    # Wires then unwires 1000 wirings, in bulk or one by one.
+
+    wirings = [(_no_op, (index,)) for index in range(1000)]
+
+    def setup():
+        this = _wires.Wires().this
+        this.max_wirings = 10000
+        this.min_wirings = 1
+        this.wire(_no_op)
+
+        if bulk:
+            def statement():
+                this.wire_many(wirings)
+                this.unwire_many(wirings)
+        else:
+            def statement():
+                for function, args in wirings:
+                    this.wire(function, *args)
+                for function, args in wirings:
+                    this.unwire(function, *args)
+
+        return statement, 20
+
+    return setup
+
+
+
+def _setup_churn_priority():
+
+    # Wires 1000 wirings, with mixed priorities, one by one, then calls.
+
+    this = _wires.Wires().this
+    wirers = [this.with_options(priority=index % 7 - 3) for index in range(1000)]
+
+    def statement():
+        for wirer in wirers:
+            wirer.wire(_no_op)
+        this()
+        this.replace_wirings(())
+
+    return statement, 20
+
+
+
+# ----------------------------------------------------------------------------
+# Configuration snapshots.
+
+def _register(w, callables, fan_out):
+
+    # What application wiring code would do.
+
+    for index in range(callables):
+        this = w['callable-%d' % (index,)]
+        this.min_wirings = 1
+        for _ in range(fan_out):
+            this.wire(_no_op, index)
+
+
+
+def _setup_snapshot_replay():
+
+    def statement():
+        _register(_wires.Wires(), 100, 10)
+
+    return statement, 20
+
+
+
+def _setup_snapshot_restore():
+
+    w = _wires.Wires()
+    _register(w, 100, 10)
+    data = _snapshot.snapshot(w)
+
+    def statement():
+        _snapshot.restore(data)
+
+    return statement, 20
+
+
+
+# ----------------------------------------------------------------------------
+# Transports.
+
+def _setup_transport_shm():
+
+    # Sends and receives in the same process: measures serialization and
+    # ring buffer overhead, not cross process latency.
+
+    channel = _shm.SharedMemoryChannel()
+    source = _wires.Wires()
+    channel.forward(source.this)
+    target = _wires.Wires()
+    target.this.wire(_no_op)
+    this = source.this
+
+    def statement():
+        this(1, value=2)
+        channel.receive(target, timeout=0)
+
+    return statement, 20000
+
+
+
+# ----------------------------------------------------------------------------
+# Memory.
+
+def _measure_allocated(create, count):
+
+    # Returns bytes allocated by `create` calls, per call, excluding the
+    # memory needed to hold the created objects in a list.
+
+    holder = [None] * count
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for index in range(count):
+            holder[index] = create(index)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return (after - before) / float(count)
+
+
+
+def _setup_memory_wires():
+
+    def measure():
+        return _measure_allocated(lambda index: _wires.Wires(), 1000)
+
+    return measure
+
+
+
+def _setup_memory_callable():
+
+    def measure():
+        w = _wires.Wires()
+        names = ['c%d' % (i,) for i in range(1000)]
+        return _measure_allocated(lambda index: w[names[index]], len(names))
+
+    return measure
+
+
+
+def _setup_memory_wiring():
+
+    def measure():
+        w = _wires.Wires()
+        this = w.this
+        return _measure_allocated(lambda index: this.wire(_no_op), 1000)
+
+    return measure
+
+
+
+def _setup_memory_wiring_with_args():
+
+    def measure():
+        w = _wires.Wires()
+        this = w.this
+        return _measure_allocated(
+            lambda index: this.wire(_no_op, 1, 2, a=1, b=2),
+            1000,
+        )
+
+    return measure
+
+
+
+# ----------------------------------------------------------------------------
+# The suite.
+
+def _bool_name(name, value):
+
+    return '%s-%s' % (name, 'yes' if value else 'no')
+
+
+
+def _build_suite():
+
+    suite = [
+        Benchmark('getattr.existing', 's', _setup_getattr_existing),
+        Benchmark('getattr.getitem', 's', _setup_getitem_existing),
+        Benchmark('getattr.calltime-settings', 's', _setup_getattr_calltime_settings),
+        Benchmark('getattr.create-delete', 's', _setup_getattr_create_delete),
+    ]
+
+    for fan_out in FAN_OUT_SIZES:
+        for returns, ignore_exceptions in CALL_COUPLINGS:
+            for failing in (False, True):
+                name = 'call.fan-out-%d.%s.%s%s' % (
+                    fan_out,
+                    _bool_name('returns', returns),
+                    _bool_name('ignore-exceptions', ignore_exceptions),
+                    '.failing' if failing else '',
+                )
+                setup = _make_call_setup(fan_out, returns, ignore_exceptions, failing)
+                suite.append(Benchmark(name, 's', setup))
+
+    for fan_out in (0, 1, 10):
+        name = 'call.lazy.fan-out-%d' % (fan_out,)
+        suite.append(Benchmark(name, 's', _make_lazy_setup(fan_out)))
+
+    for fan_out in (0, 10):
+        name = 'call.disabled.fan-out-%d' % (fan_out,)
+        suite.append(Benchmark(name, 's', _make_disabled_setup(fan_out)))
+
+    suite.append(Benchmark('call.keyed.keys-2000', 's', _setup_call_keyed))
+    suite.append(Benchmark('call.where.equals-2000', 's', _setup_call_where_equals))
+
+    for wire_time, call_time in itertools.product((False, True), repeat=2):
+        name = 'args.%s.%s' % (
+            _bool_name('wire-time', wire_time),
+            _bool_name('call-time', call_time),
+        )
+        suite.append(Benchmark(name, 's', _make_args_setup(wire_time, call_time)))
+
+    for existing in (0, 100):
+        name = 'churn.wire-unwire.existing-%d' % (existing,)
+        suite.append(Benchmark(name, 's', _make_churn_setup(existing)))
+
+    for bulk in (False, True):
+        name = 'churn.%s-1000' % ('bulk' if bulk else 'one-by-one',)
+        suite.append(Benchmark(name, 's', _make_bulk_setup(bulk)))
+
+    suite.append(Benchmark('churn.priority-1000', 's', _setup_churn_priority))
+
+    suite.extend([
+        Benchmark('snapshot.replay', 's', _setup_snapshot_replay),
+        Benchmark('snapshot.restore', 's', _setup_snapshot_restore),
+    ])
+
+    if _shm.shared_memory is not None:
+        suite.append(Benchmark('transport.shm', 's', _setup_transport_shm))
+
+    suite.extend([
+        Benchmark('memory.wires', 'B', _setup_memory_wires),
+        Benchmark('memory.callable', 'B', _setup_memory_callable),
+        Benchmark('memory.wiring', 'B', _setup_memory_wiring),
+        Benchmark('memory.wiring-with-args', 'B', _setup_memory_wiring_with_args),
+    ])
+
+    return suite
+
+
+
+SUITE = _build_suite()
+
+
+# ----------------------------------------------------------------------------
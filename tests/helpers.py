@@ -10,7 +10,6 @@ Python Wires test helpers.
 """
 
 
-from __future__ import absolute_import
 
 
 
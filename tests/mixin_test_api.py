@@ -10,13 +10,12 @@ API test driver mixin.
 """
 
 
-from __future__ import absolute_import
+from . import helpers, mixin_test_callables
 
-from . import mixin_test_callables
 
 
-
-class TestWiresAPIMixin(mixin_test_callables.TestCallablesMixin):
+class TestWiresAPIMixin(mixin_test_callables.TestCallablesMixin,
+                        helpers.CallTrackerAssertMixin):
 
     """
     Drives Wires API tests.
@@ -454,4 +453,64 @@ class TestWiresAPIMixin(mixin_test_callables.TestCallablesMixin):
         self.w.this.set(min_wirings=None)
 
 
+    def test_is_wired(self):
+        """
+        Callables are wired if they have at least one wiring.
+        """
+        self.assertFalse(self.w.this.is_wired)
+
+        self.w.this.wire(self.returns_42)
+        self.assertTrue(self.w.this.is_wired)
+
+        self.w.this.unwire(self.returns_42)
+        self.assertFalse(self.w.this.is_wired)
+
+
+    def test_call_lazy_unwired_does_not_call_thunk(self):
+        """
+        Lazy calling an unwired callable does not call the thunk.
+        """
+        thunk = helpers.CallTracker(returns=42)
+
+        result = self.w(returns=True).this.call_lazy(thunk)
+
+        self.assertEqual(thunk.call_count, 0)
+        self.assertEqual(result, [])
+
+
+    def test_call_lazy_builds_payload_once(self):
+        """
+        Lazy calling a wired callable calls the thunk once, passing its
+        result to all wirings.
+        """
+        thunk = helpers.CallTracker(returns='payload')
+        self.w.this.wire(self.returns_42)
+        self.w.this.wire(self.returns_none, 'wire-time')
+        self.addCleanup(self.w.this.unwire, self.returns_42)
+        self.addCleanup(self.w.this.unwire, self.returns_none)
+        self.returns_42.reset()
+        self.returns_none.reset()
+
+        result = self.w(returns=True).this.call_lazy(thunk)
+
+        self.assertEqual(thunk.call_count, 1)
+        self.assertEqual(result, [(None, 42), (None, None)])
+        self.assert_called(self.returns_42, [(('payload',), {})])
+        self.assert_called(self.returns_none, [(('wire-time', 'payload'), {})])
+
+
+    def test_call_lazy_failing_thunk_resets_calltime_settings(self):
+        """
+        Thunk raised exceptions propagate, and call-time settings are reset.
+        """
+        thunk = helpers.CallTracker(raises=self.EXCEPTION)
+        self.w.this.wire(self.returns_42)
+        self.addCleanup(self.w.this.unwire, self.returns_42)
+
+        with self.assertRaises(ValueError):
+            self.w(returns=True).this.call_lazy(thunk)
+
+        self.assertIsNone(self.w.this())
+
+
 # ----------------------------------------------------------------------------
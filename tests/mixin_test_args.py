@@ -10,8 +10,6 @@ Argument passing test driver mixin.
 """
 
 
-from __future__ import absolute_import
-
 from . import helpers, mixin_test_callables
 
 
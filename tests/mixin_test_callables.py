@@ -10,8 +10,6 @@ Test callables mixin.
 """
 
 
-from __future__ import absolute_import
-
 from . import helpers
 
 
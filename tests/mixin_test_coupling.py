@@ -10,8 +10,6 @@ Caller/callee call-time coupling test driver mixin.
 """
 
 
-from __future__ import absolute_import
-
 from wires import Wires
 
 from . import mixin_test_callables
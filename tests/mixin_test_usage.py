@@ -10,8 +10,6 @@ Generic usage test driver mixin.
 """
 
 
-from __future__ import absolute_import
-
 from . import helpers
 
 
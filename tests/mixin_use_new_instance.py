@@ -10,8 +10,6 @@ Wires instance test mixin.
 """
 
 
-from __future__ import absolute_import
-
 from wires import Wires
 
 
@@ -10,8 +10,6 @@ Shared Wires instance test mixin.
 """
 
 
-from __future__ import absolute_import
-
 from wires import w
 
 
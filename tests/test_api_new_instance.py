@@ -10,8 +10,6 @@ Wires instance API tests.
 """
 
 
-from __future__ import absolute_import
-
 import unittest
 
 from . import mixin_test_api, mixin_use_new_instance
@@ -9,8 +9,6 @@
 Shared Wires instance API tests.
 """
 
-from __future__ import absolute_import
-
 import unittest
 
 from . import mixin_test_api, mixin_use_shared_instance
@@ -10,8 +10,6 @@ Wires instance argument passing tests.
 """
 
 
-from __future__ import absolute_import
-
 import unittest
 
 from . import mixin_use_new_instance, mixin_test_args
@@ -0,0 +1,400 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Benchmark suite tests.
+"""
+
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from wires import bench
+from wires.bench import __main__ as bench_main
+
+
+
+class TestBenchSuite(unittest.TestCase):
+
+    """
+    Benchmark suite tests.
+    """
+
+    def test_names_are_unique(self):
+        """
+        Benchmark names are unique.
+        """
+        names = [benchmark.name for benchmark in bench.SUITE]
+        self.assertEqual(len(names), len(set(names)))
+
+
+    def test_suite_coverage(self):
+        """
+        The suite covers every fan-out size and call coupling combination.
+        """
+        names = set(benchmark.name for benchmark in bench.SUITE)
+        for fan_out in (0, 1, 10, 1000):
+            for returns in ('yes', 'no'):
+                for ignore_exceptions in ('yes', 'no'):
+                    name = 'call.fan-out-%d.returns-%s.ignore-exceptions-%s' % (
+                        fan_out, returns, ignore_exceptions,
+                    )
+                    self.assertIn(name, names)
+                    self.assertIn(name + '.failing', names)
+
+
+    def test_select_patterns(self):
+        """
+        Benchmarks are selected by fnmatch style patterns.
+        """
+        selected = bench.select(['getattr.*', 'memory.callable'])
+        names = [benchmark.name for benchmark in selected]
+        self.assertIn('getattr.existing', names)
+        self.assertIn('memory.callable', names)
+        self.assertNotIn('memory.wiring', names)
+
+
+    def test_run_results(self):
+        """
+        Running produces per benchmark samples and summaries.
+        """
+        results = bench.run(['getattr.existing', 'memory.wiring'], repeat=2, scale=0.01)
+
+        self.assertEqual(results['format'], 1)
+        self.assertEqual(results['metadata']['repeat'], 2)
+        self.assertEqual(set(results['benchmarks']), {'getattr.existing', 'memory.wiring'})
+        for name, unit in (('getattr.existing', 's'), ('memory.wiring', 'B')):
+            result = results['benchmarks'][name]
+            self.assertEqual(result['unit'], unit)
+            self.assertEqual(len(result['samples']), 2)
+            self.assertLessEqual(result['min'], result['median'])
+
+
+    def test_failing_calls_run(self):
+        """
+        Failing wiring benchmarks don't fail, regardless of call coupling.
+        """
+        results = bench.run(['call.fan-out-1.*.failing'], repeat=2, scale=0.001)
+        self.assertEqual(len(results['benchmarks']), 4)
+
+
+    def test_run_requires_two_samples(self):
+        """
+        Running with less than two samples raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            bench.run(repeat=1)
+
+
+
+class TestBenchResultFiles(unittest.TestCase):
+
+    """
+    Benchmark results JSON tests.
+    """
+
+    def setUp(self):
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+
+    def test_dumps_is_stable(self):
+        """
+        JSON output has sorted keys.
+        """
+        text = bench.dumps({'b': 1, 'a': {'d': 2, 'c': 3}})
+        self.assertEqual(text, bench.dumps(json.loads(text)))
+        self.assertLess(text.index('"a"'), text.index('"b"'))
+
+
+    def test_save_load_round_trip(self):
+        """
+        Saved results load back unchanged.
+        """
+        results = bench.run(['getattr.existing'], repeat=2, scale=0.01)
+        path = os.path.join(self.tmp_dir, 'results.json')
+
+        bench.save(results, path)
+
+        self.assertEqual(bench.load(path), results)
+
+
+    def test_load_unknown_format_raises_value_error(self):
+        """
+        Loading results in an unknown format raises ValueError.
+        """
+        path = os.path.join(self.tmp_dir, 'results.json')
+        with io.open(path, 'w') as f:
+            f.write(u'{"format": 0}')
+
+        with self.assertRaises(ValueError):
+            bench.load(path)
+
+
+
+def _results(**name_samples):
+
+    # Build results dicts from `name=<samples>` arguments.
+
+    benchmarks = {}
+    for name, samples in name_samples.items():
+        benchmarks[name] = {
+            'unit': 's',
+            'number': 1,
+            'samples': samples,
+            'mean': sum(samples) / len(samples),
+        }
+    return {'format': 1, 'metadata': {'repeat': 2, 'scale': 0.01}, 'benchmarks': benchmarks}
+
+
+
+class TestBenchCompare(unittest.TestCase):
+
+    """
+    Benchmark result comparison tests.
+    """
+
+    def test_welch_t_test(self):
+        """
+        Clearly different samples have low p-values, identical ones don't.
+        """
+        a = [1.0, 1.1, 0.9, 1.05, 0.97]
+        b = [1.2, 1.25, 1.18, 1.3, 1.22]
+
+        self.assertLess(bench.welch_t_test(a, b), 0.01)
+        self.assertGreater(bench.welch_t_test(a, list(a)), 0.99)
+
+
+    def test_welch_t_test_matches_reference(self):
+        """
+        p-values match those from numerically integrating the t distribution.
+        """
+        # t = -sqrt(3), with ~4.41 degrees of freedom.
+        p_value = bench.welch_t_test([1, 2, 3, 4], [2, 4, 6, 8])
+        self.assertAlmostEqual(p_value, 0.151581, places=6)
+
+
+    def test_welch_t_test_no_variance(self):
+        """
+        Constant samples differ significantly only if their means differ.
+        """
+        self.assertEqual(bench.welch_t_test([1, 1], [1, 1]), 1.0)
+        self.assertEqual(bench.welch_t_test([1, 1], [2, 2]), 0.0)
+
+
+    def test_compare_verdicts(self):
+        """
+        Significant changes above the threshold are flagged.
+        """
+        base = _results(
+            slower=[1.0, 1.01, 0.99, 1.0],
+            faster=[1.0, 1.01, 0.99, 1.0],
+            noisy=[1.0, 2.0, 0.5, 1.5],
+            tiny_change=[1.0, 1.001, 0.999, 1.0],
+            gone=[1.0, 1.0],
+        )
+        new = _results(
+            slower=[1.5, 1.51, 1.49, 1.5],
+            faster=[0.5, 0.51, 0.49, 0.5],
+            noisy=[1.2, 2.1, 0.6, 1.7],
+            tiny_change=[1.01, 1.011, 1.009, 1.01],
+            added=[1.0, 1.0],
+        )
+
+        verdicts = dict((c.name, c.verdict) for c in bench.compare(base, new))
+
+        self.assertEqual(verdicts, {
+            'added': 'added',
+            'faster': 'improvement',
+            'gone': 'missing',
+            'noisy': 'unchanged',
+            'slower': 'regression',
+            'tiny_change': 'unchanged',
+        })
+
+
+    def test_format_comparisons(self):
+        """
+        Formatted comparisons include one line per benchmark, plus a header.
+        """
+        base = _results(same=[1.0, 1.0], slower=[1.0, 1.01])
+        new = _results(same=[1.0, 1.0], slower=[2.0, 2.01])
+        comparisons = bench.compare(base, new)
+
+        self.assertEqual(len(bench.format_comparisons(comparisons).splitlines()), 3)
+        changed = bench.format_comparisons(comparisons, changed_only=True)
+        self.assertEqual(len(changed.splitlines()), 2)
+        self.assertIn('regression', changed)
+
+
+
+class TestBenchStyles(unittest.TestCase):
+
+    """
+    Comparative benchmark tests.
+    """
+
+    def test_builtin_styles_cover_all_scenarios(self):
+        """
+        Standard library styles run every scenario and fan-out size.
+        """
+        names = set(benchmark.name for benchmark in bench.styles.SUITE)
+        for scenario in bench.styles.SCENARIOS:
+            for fan_out in bench.styles.FAN_OUT_SIZES:
+                for style in ('wires', 'callback-list', 'partial-fan-out'):
+                    name = 'styles.%s.fan-out-%d.%s' % (scenario, fan_out, style)
+                    self.assertIn(name, names)
+
+
+    def test_styles_make_identical_calls(self):
+        """
+        Standard library styles call receivers with identical arguments.
+        """
+        adapters = [
+            adapter for adapter in bench.styles.ADAPTERS
+            if adapter.name in ('wires', 'callback-list', 'partial-fan-out')
+        ]
+        for scenario in bench.styles.SCENARIOS:
+            per_adapter_calls = []
+            for adapter in adapters:
+                calls = []
+                def receiver(*args, **kwargs):
+                    calls.append((args, kwargs))
+                    return len(calls)
+                emit = adapter.build(scenario, [receiver, receiver])
+                result = emit()
+                if scenario == 'collect':
+                    result = [r[1] if isinstance(r, tuple) else r for r in result]
+                    self.assertEqual(result, [1, 2], adapter.name)
+                per_adapter_calls.append(calls)
+            for calls in per_adapter_calls[1:]:
+                self.assertEqual(calls, per_adapter_calls[0], scenario)
+
+
+    def test_overhead_relative_to_baseline(self):
+        """
+        Overhead ratios are relative to the plain callback list.
+        """
+        results = _results(**{
+            'styles.notify.fan-out-1.callback-list': [1.0, 1.0],
+            'styles.notify.fan-out-1.wires': [3.0, 3.0],
+        })
+
+        ratios = bench.styles.overhead(results)
+
+        self.assertEqual(ratios, {('notify', 1): {'callback-list': 1.0, 'wires': 3.0}})
+        table = bench.styles.format_overhead(results)
+        self.assertIn('3.00x', table)
+
+
+
+@contextlib.contextmanager
+def _captured_stdout():
+
+    saved_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        yield sys.stdout
+    finally:
+        sys.stdout = saved_stdout
+
+
+
+class TestBenchCommandLine(unittest.TestCase):
+
+    """
+    Benchmark command line tests.
+    """
+
+    def test_run_list(self):
+        """
+        Listing outputs selected benchmark names.
+        """
+        with _captured_stdout() as output:
+            exit_code = bench_main.main(['run', '--list', 'memory.*'])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output.getvalue().split(), [
+            'memory.wires', 'memory.callable', 'memory.wiring',
+            'memory.wiring-with-args',
+        ])
+
+
+    def test_run_outputs_json(self):
+        """
+        Running outputs JSON results.
+        """
+        with _captured_stdout() as output:
+            exit_code = bench_main.main(
+                ['run', '--quiet', '--repeat', '2', '--scale', '0.01', 'getattr.existing'],
+            )
+
+        self.assertEqual(exit_code, 0)
+        results = json.loads(output.getvalue())
+        self.assertEqual(list(results['benchmarks']), ['getattr.existing'])
+
+
+    def test_styles_outputs_table(self):
+        """
+        Running comparative benchmarks outputs an overhead table.
+        """
+        with _captured_stdout() as output:
+            exit_code = bench_main.main([
+                'styles', '--quiet', '--repeat', '2', '--scale', '0.001',
+                'styles.notify.fan-out-1.*',
+            ])
+
+        self.assertEqual(exit_code, 0)
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('scenario'))
+        self.assertTrue(lines[1].startswith('notify'))
+
+
+    def test_compare_exit_codes(self):
+        """
+        Comparing exits with 1 on regressions, 0 otherwise.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        base_path = os.path.join(tmp_dir, 'base.json')
+        new_path = os.path.join(tmp_dir, 'new.json')
+        bench.save(_results(this=[1.0, 1.01, 0.99]), base_path)
+        bench.save(_results(this=[2.0, 2.01, 1.99]), new_path)
+
+        with _captured_stdout() as output:
+            self.assertEqual(bench_main.main(['compare', base_path, new_path]), 1)
+            self.assertEqual(bench_main.main(['compare', new_path, base_path]), 0)
+
+        self.assertIn('regression', output.getvalue())
+        self.assertIn('improvement', output.getvalue())
+
+
+    def test_compare_runs_baseline_benchmarks(self):
+        """
+        Comparing against a baseline only runs its benchmarks.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        base_path = os.path.join(tmp_dir, 'base.json')
+        new_path = os.path.join(tmp_dir, 'new.json')
+        bench.save(bench.run(['getattr.getitem'], repeat=2, scale=0.01), base_path)
+
+        with _captured_stdout():
+            bench_main.main(['compare', base_path, '--output', new_path])
+
+        new = bench.load(new_path)
+        self.assertEqual(list(new['benchmarks']), ['getattr.getitem'])
+
+
+# ----------------------------------------------------------------------------
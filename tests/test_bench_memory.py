@@ -0,0 +1,156 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Memory diagnostics tests.
+"""
+
+
+import unittest
+
+from wires import Wires
+from wires import bench
+
+from . import mixin_test_callables
+
+
+
+def _raises_value_error():
+
+    raise ValueError('retained')
+
+
+
+class TestFootprint(mixin_test_callables.TestCallablesMixin,
+                    unittest.TestCase):
+
+    """
+    Memory footprint estimation tests.
+    """
+
+    def test_wirings_add_to_footprint(self):
+        """
+        Wirings, in particular those with wire-time args, add to the footprint.
+        """
+        w = Wires()
+        w.this.wire(self.returns_42)
+        callable_bytes, plain_bytes = bench.callable_footprint(w.this)
+        w.this.wire(self.returns_42, 'some', 'args', more='args')
+        _, more_bytes = bench.callable_footprint(w.this)
+
+        self.assertGreater(callable_bytes, 0)
+        self.assertGreater(plain_bytes, 0)
+        self.assertGreater(more_bytes - plain_bytes, plain_bytes)
+
+
+    def test_wires_footprint_totals(self):
+        """
+        Wires footprints total their callables and wirings.
+        """
+        w = Wires()
+        w.this.wire(self.returns_42)
+        w.that.wire(self.returns_42)
+
+        footprint = bench.wires_footprint(w)
+
+        self.assertEqual(
+            footprint['callables'],
+            sum(bench.callable_footprint(c)[0] for c in w),
+        )
+        self.assertEqual(
+            footprint['wirings'],
+            sum(bench.callable_footprint(c)[1] for c in w),
+        )
+        self.assertGreater(footprint['wires'], 0)
+
+
+
+class TestMemoryMonitor(mixin_test_callables.TestCallablesMixin,
+                        unittest.TestCase):
+
+    """
+    MemoryMonitor tests.
+    """
+
+    def test_growing_callables_detected(self):
+        """
+        Callables with wiring counts growing across the window are flagged.
+        """
+        w = Wires()
+        monitor = bench.MemoryMonitor(w, window=3)
+
+        for _ in range(3):
+            w.growing.wire(self.returns_42)
+            w.steady.wire(self.returns_42)
+            monitor.sample()
+            w.steady.unwire(self.returns_42)
+
+        self.assertEqual(monitor.growing(), ['growing'])
+
+
+    def test_not_enough_samples(self):
+        """
+        Nothing is flagged with less than `window` samples.
+        """
+        w = Wires()
+        monitor = bench.MemoryMonitor(w, window=3)
+        w.this.wire(self.returns_42)
+        monitor.sample()
+        w.this.wire(self.returns_42)
+        monitor.sample()
+
+        self.assertEqual(monitor.growing(), [])
+
+
+    def test_small_window_raises_value_error(self):
+        """
+        Windows smaller than 2 raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            bench.MemoryMonitor(Wires(), window=1)
+
+
+    def test_report_includes_retained_exceptions(self):
+        """
+        Exceptions held in call results are reported.
+        """
+        w = Wires(returns=True)
+        w.this.wire(_raises_value_error)
+        monitor = bench.MemoryMonitor(w)
+
+        result = w.this()
+        report = monitor.report()
+
+        retained = [e for e, _ in report.exceptions]
+        self.assertIn(result[0][0], retained)
+        self.assertIn('retained exceptions', str(report))
+        self.assertIn('this', report.callables)
+
+        del result
+        self.assertIsNone(monitor.report(check_exceptions=False).exceptions)
+
+
+
+class TestSimulate(unittest.TestCase):
+
+    """
+    Simulated wire/call/unwire cycle tests.
+    """
+
+    def test_kept_results_retain_memory(self):
+        """
+        Keeping call results, with exceptions, retains memory.
+        """
+        discarded = bench.simulate(cycles=200, fan_out=3)
+        kept = bench.simulate(cycles=200, fan_out=3, keep_results=True)
+
+        self.assertLess(discarded['retained_per_cycle'], 100)
+        self.assertGreater(kept['retained_per_cycle'], 500)
+        self.assertTrue(kept['top'])
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,243 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring circuit breaker tests.
+"""
+
+
+import copy
+import pickle
+import unittest
+
+from unittest import mock
+
+from wires import Wires, WiresHook, CircuitBreaker, CircuitOpen, WiringFailure
+from wires import _breaker
+
+
+
+class _Downstream(object):
+
+    # Fails while `down`, counting calls.
+
+    def __init__(self):
+
+        self.down = True
+        self.calls = 0
+
+
+    def __call__(self, *args):
+
+        self.calls += 1
+        if self.down:
+            raise IOError('down')
+        return 'up'
+
+
+
+class _UnhashableDownstream(_Downstream):
+
+    # Compared by value: unhashable.
+
+    def __eq__(self, other):
+
+        return isinstance(other, _UnhashableDownstream)
+
+
+
+def _echo(value):
+
+    return value
+
+
+
+class _CountingHook(WiresHook):
+
+    def __init__(self):
+
+        self.called = 0
+
+
+    def before(self, wires_callable, function):
+
+        self.called += 1
+
+
+
+class _BreakerTestCase(unittest.TestCase):
+
+    def setUp(self):
+
+        self.now = 1000.0
+        patcher = mock.patch.object(_breaker, '_clock', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.w = Wires(returns=True, ignore_exceptions=True)
+        self.downstream = _Downstream()
+        self.breaker = CircuitBreaker(failures=3, window=10, cooldown=30)
+        self.w.orders.with_options(breaker=self.breaker).wire(self.downstream)
+        self.w.orders.wire(_echo)
+
+
+    def call(self, count=1):
+
+        for _ in range(count):
+            results = self.w.orders('order')
+        return results
+
+
+
+class TestCircuitBreaker(_BreakerTestCase):
+
+    """
+    with_options(breaker=...) tests.
+    """
+
+    def test_opens_after_consecutive_failures(self):
+
+        self.call(3)
+        self.assertEqual(self.breaker.state(self.downstream), 'open')
+        [(skipped, _), other] = self.call()
+        self.assertIsInstance(skipped, CircuitOpen)
+        self.assertIs(skipped.args[0], self.downstream)
+        self.assertEqual(other, (None, 'order'))
+        self.assertEqual(self.downstream.calls, 3)
+        self.assertEqual(
+            (self.breaker.calls, self.breaker.failures, self.breaker.skips, self.breaker.trips),
+            (3, 3, 1, 1),
+        )
+
+
+    def test_success_resets_count(self):
+
+        self.call(2)
+        self.downstream.down = False
+        self.call()
+        self.downstream.down = True
+        self.call(2)
+        self.assertEqual(self.breaker.state(self.downstream), 'closed')
+
+
+    def test_window(self):
+
+        self.call(2)
+        self.now += 11
+        self.call(2)
+        self.assertEqual(self.breaker.state(self.downstream), 'closed')
+        self.call()
+        self.assertEqual(self.breaker.state(self.downstream), 'open')
+
+
+    def test_half_open_probe_fails(self):
+
+        self.call(3)
+        self.now += 30
+        self.assertEqual(self.breaker.state(self.downstream), 'half-open')
+        [(failure, _), _] = self.call()
+        self.assertIsInstance(failure, IOError)
+        self.assertEqual(self.breaker.state(self.downstream), 'open')
+        self.assertIsInstance(self.call()[0][0], CircuitOpen)
+        self.assertEqual((self.downstream.calls, self.breaker.trips), (4, 2))
+
+
+    def test_half_open_probe_succeeds(self):
+
+        self.call(3)
+        self.now += 30
+        self.downstream.down = False
+        self.assertEqual(self.call()[0], (None, 'up'))
+        self.assertEqual(self.breaker.state(self.downstream), 'closed')
+
+
+    def test_stuck_probe_superseded(self):
+
+        self.call(3)
+        self.now += 30
+        self.assertTrue(self.breaker.allow(self.downstream))
+        self.assertFalse(self.breaker.allow(self.downstream))
+        self.now += 30
+        self.assertTrue(self.breaker.allow(self.downstream))
+
+
+    def test_skip_stops_when_not_ignoring_exceptions(self):
+
+        self.call(3)
+        with self.assertRaises(RuntimeError) as context:
+            self.w(ignore_exceptions=False).orders('order')
+        [(skipped, _)] = context.exception.args
+        self.assertIsInstance(skipped, CircuitOpen)
+
+
+    def test_skip_exception_detail(self):
+
+        self.call(3)
+        [(failure, _), _] = self.w(exception_detail='summary').orders('order')
+        self.assertIsInstance(failure, WiringFailure)
+        self.assertIs(failure.type, CircuitOpen)
+        self.assertEqual(len(failure.summary), 0)
+
+
+    def test_hooks_not_called_on_skips(self):
+
+        self.call(3)
+        hook = _CountingHook()
+        hook.attach(self.w)
+        self.call()
+        self.assertEqual(hook.called, 1)
+
+
+    def test_shared_breaker_per_function(self):
+
+        self.w.orders.with_options(breaker=self.breaker).wire(_echo)
+        self.call(3)
+        self.assertEqual(self.breaker.state(_echo), 'closed')
+        self.assertEqual(self.call()[2], (None, 'order'))
+
+
+    def test_unhashable_functions(self):
+
+        first = _UnhashableDownstream()
+        second = _UnhashableDownstream()
+        self.w.orders.with_options(breaker=self.breaker).wire(first)
+        self.w.orders.with_options(breaker=self.breaker).wire(second)
+        second.down = False
+        self.call(3)
+        self.assertEqual(self.breaker.state(first), 'open')
+        self.assertEqual(self.breaker.state(second), 'closed')
+        [_, _, (skipped, _), result] = self.call()
+        self.assertIsInstance(skipped, CircuitOpen)
+        self.assertEqual(result, (None, 'up'))
+
+
+    def test_reset_repr_invalid(self):
+
+        self.call(3)
+        self.assertEqual(repr(self.breaker), '<CircuitBreaker calls=3 failures=3 skips=0 trips=1>')
+        self.breaker.reset()
+        self.assertEqual(self.breaker.state(self.downstream), 'closed')
+        for kwargs in ({'failures': 0}, {'window': 0}, {'cooldown': -1}):
+            with self.assertRaises(ValueError):
+                CircuitBreaker(**kwargs)
+        with self.assertRaises(TypeError):
+            self.w.orders.with_options(breaker=object())
+
+
+    def test_copies_get_closed_breakers(self):
+
+        w = Wires(returns=True)
+        w.this.with_options(breaker=True).wire(_echo)
+        breaker = w.this.wirings[0].breaker
+        breaker.failed(_echo)
+        for copied in (copy.deepcopy(w), pickle.loads(pickle.dumps(w))):
+            copied_breaker = copied.this.wirings[0].breaker
+            self.assertIsNot(copied_breaker, breaker)
+            self.assertEqual(copied_breaker.failures, 0)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,286 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Socket bridge tests, against local loopback peers.
+"""
+
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from wires import Wires, SocketBridge, BridgeServer
+
+
+
+class _JSONSerializer(object):
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data):
+        return [(n, tuple(a), k) for n, a, k in json.loads(data.decode('utf-8'))]
+
+
+
+class _BridgeTestMixin(object):
+
+    """
+    Per test mixin contract: self.address() returns a server address.
+    """
+
+    serializer = None
+
+    def setUp(self):
+
+        self.calls = []
+        self.received = threading.Condition()
+        self.remote = Wires()
+        self.remote.this.wire(self.record)
+        self.server = BridgeServer(self.remote, self.address(), serializer=self.serializer)
+        self.server.start()
+        self.bridges = []
+
+
+    def tearDown(self):
+
+        for bridge in self.bridges:
+            bridge.close()
+        self.server.close()
+
+
+    def record(self, *args, **kwargs):
+
+        with self.received:
+            self.calls.append((args, kwargs))
+            self.received.notify_all()
+
+
+    def wait_calls(self, count, timeout=5):
+
+        with self.received:
+            self.received.wait_for(lambda: len(self.calls) >= count, timeout)
+        return self.calls
+
+
+    def bridge(self, **kwargs):
+
+        kwargs.setdefault('serializer', self.serializer)
+        bridge = SocketBridge(self.server.address, **kwargs)
+        self.bridges.append(bridge)
+        return bridge
+
+
+    def test_forward_with_background_flush(self):
+
+        bridge = self.bridge(flush_interval=0.001)
+        local = Wires()
+        bridge.forward(local.this)
+        local.this(1, a=2)
+        local.this(3)
+        self.assertEqual(self.wait_calls(2), [((1,), {'a': 2}), ((3,), {})])
+
+
+    def test_explicit_flush(self):
+
+        bridge = self.bridge(flush_interval=None)
+        local = Wires()
+        bridge.forward(local.this)
+        local.this(1)
+        time.sleep(0.05)
+        self.assertEqual(self.calls, [])
+        bridge.flush()
+        self.assertEqual(self.wait_calls(1), [((1,), {})])
+
+
+    def test_max_batch_sends(self):
+
+        bridge = self.bridge(flush_interval=None, max_batch=3)
+        local = Wires()
+        bridge.forward(local.this)
+        local.this(1)
+        local.this(2)
+        time.sleep(0.05)
+        self.assertEqual(self.calls, [])
+        local.this(3)
+        self.assertEqual(self.wait_calls(3), [((1,), {}), ((2,), {}), ((3,), {})])
+
+
+    def test_close_flushes(self):
+
+        bridge = self.bridge(flush_interval=None)
+        bridge.send('this', (1,), {})
+        bridge.close()
+        self.assertEqual(self.wait_calls(1), [((1,), {})])
+        with self.assertRaises(RuntimeError):
+            bridge.send('this', (2,), {})
+
+
+    def test_connection_reused(self):
+
+        bridge = self.bridge(flush_interval=None, pool_size=2)
+        for index in range(10):
+            bridge.send('this', (index,), {})
+            bridge.flush()
+        self.wait_calls(10)
+        self.assertEqual(bridge._connection_count, 1)
+        self.assertEqual([args for args, _ in self.calls], [(i,) for i in range(10)])
+
+
+    def test_pooled_concurrent_senders(self):
+
+        bridge = self.bridge(flush_interval=None, max_batch=5, pool_size=3)
+
+        def sender(base):
+            for index in range(50):
+                bridge.send('this', (base, index), {})
+
+        threads = [threading.Thread(target=sender, args=(b,)) for b in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        bridge.flush()
+        calls = self.wait_calls(200)
+        self.assertEqual(len(calls), 200)
+        self.assertLessEqual(bridge._connection_count, 3)
+        for base in range(4):
+            # Per sender order is kept within each connection's batches.
+            self.assertEqual(
+                sorted(args[1] for args, _ in calls if args[0] == base),
+                list(range(50)),
+            )
+
+
+    def test_single_connection_keeps_order(self):
+
+        bridge = self.bridge(flush_interval=0.001, max_batch=2)
+        acquire = bridge._acquire
+        flusher_took = threading.Event()
+
+        def slow_flusher_acquire():
+            # Widen the gap between the flusher taking a batch and sending it.
+            if threading.current_thread().name == 'wires-bridge-flusher':
+                flusher_took.set()
+                time.sleep(0.05)
+            return acquire()
+
+        bridge._acquire = slow_flusher_acquire
+        bridge.send('this', (1,), {})
+        self.assertTrue(flusher_took.wait(5))
+        bridge.send('this', (2,), {})
+        bridge.send('this', (3,), {})
+        calls = self.wait_calls(3)
+        self.assertEqual([args for args, _ in calls], [(1,), (2,), (3,)])
+
+
+    def test_server_dispatch_errors_counted(self):
+
+        self.remote.failing.min_wirings = 1
+        bridge = self.bridge(flush_interval=None)
+        bridge.send('failing', (), {})
+        bridge.send('this', (1,), {})
+        bridge.flush()
+        self.wait_calls(1)
+        self.assertEqual(self.server.errors, 1)
+
+
+
+class TestTCPBridge(_BridgeTestMixin, unittest.TestCase):
+
+    def address(self):
+
+        return ('127.0.0.1', 0)
+
+
+    def test_unreachable_raises(self):
+
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            address = s.getsockname()
+        bridge = SocketBridge(address, flush_interval=None)
+        bridge.send('this', (), {})
+        with self.assertRaises(OSError):
+            bridge.flush()
+        self.assertEqual(bridge._connection_count, 0)
+        bridge.close()
+
+
+    def test_background_failure_dropped(self):
+
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            address = s.getsockname()
+        bridge = SocketBridge(address, flush_interval=0.001)
+        bridge.send('this', (), {})
+        bridge.send('this', (), {})
+        deadline = time.time() + 5
+        while bridge.dropped < 2 and time.time() < deadline:
+            time.sleep(0.001)
+        bridge.close()
+        self.assertEqual(bridge.dropped, 2)
+        self.assertIsInstance(bridge.last_error, OSError)
+
+
+    def test_reconnects_after_server_restart(self):
+
+        bridge = self.bridge(flush_interval=None)
+        bridge.send('this', (1,), {})
+        bridge.flush()
+        self.wait_calls(1)
+
+        address = self.server.address
+        self.server.close()
+        self.server = BridgeServer(self.remote, address)
+        self.server.start()
+        # The first send on a stale connection may seemingly succeed: the
+        # peer reset is only noticed on a later one.
+        for index in range(2, 5):
+            try:
+                bridge.send('this', (index,), {})
+                bridge.flush()
+            except OSError:
+                pass
+            time.sleep(0.02)
+        self.assertIn(((4,), {}), self.wait_calls(2))
+
+
+
+class TestTCPBridgeSerializer(TestTCPBridge):
+
+    serializer = _JSONSerializer()
+
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'requires Unix sockets')
+class TestUnixBridge(_BridgeTestMixin, unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        super(TestUnixBridge, self).setUp()
+
+
+    def tearDown(self):
+
+        super(TestUnixBridge, self).tearDown()
+        self.assertFalse(os.path.exists(self.address()))
+        shutil.rmtree(self.directory)
+
+
+    def address(self):
+
+        return os.path.join(self.directory, 'bridge.sock')
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,183 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Bulk wiring and unwiring tests.
+"""
+
+
+import unittest
+
+from wires import Wires
+from wires._importpath import ImportPath
+
+
+
+class _Unhashable(object):
+
+    __hash__ = None
+
+    def __call__(self):
+        pass
+
+
+
+class TestWireMany(unittest.TestCase):
+
+    """
+    wire_many tests.
+    """
+
+    def test_wire_many_forms(self):
+
+        w = Wires(returns=True)
+        w.this.wire_many([
+            len,
+            (len,),
+            (len, ['a']),
+            [len, (), {'b': 1}],
+            'os.path:join',
+        ])
+        self.assertEqual(w.this.wirings, [
+            (len, (), {}),
+            (len, (), {}),
+            (len, ('a',), {}),
+            (len, (), {'b': 1}),
+            (ImportPath('os.path:join'), (), {}),
+        ])
+
+
+    def test_wire_many_appends_in_order(self):
+
+        w = Wires(returns=True)
+        w.this.wire(lambda: 0)
+        w.this.wire_many((lambda i=i: i) for i in range(1, 4))
+        self.assertEqual([r for _, r in w.this()], [0, 1, 2, 3])
+
+
+    def test_wire_many_copies_kwargs(self):
+
+        w = Wires()
+        kwargs = {'a': 1}
+        w.this.wire_many([(len, (), kwargs)])
+        kwargs['a'] = 2
+        self.assertEqual(w.this.wirings, [(len, (), {'a': 1})])
+
+
+    def test_wire_many_not_callable_adds_none(self):
+
+        w = Wires()
+        with self.assertRaises(TypeError):
+            w.this.wire_many([len, 42])
+        self.assertEqual(w.this.wirings, [])
+
+
+    def test_wire_many_max_wirings_adds_none(self):
+
+        w = Wires()
+        w.this.max_wirings = 2
+        w.this.wire(len)
+        with self.assertRaises(RuntimeError):
+            w.this.wire_many([len, len])
+        self.assertEqual(len(w.this), 1)
+        w.this.wire_many([len])
+        self.assertEqual(len(w.this), 2)
+
+
+    def test_wire_many_empty(self):
+
+        w = Wires()
+        w.this.wire_many([])
+        self.assertEqual(w.this.wirings, [])
+
+
+
+class TestUnwireMany(unittest.TestCase):
+
+    """
+    unwire_many tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires()
+        self.w.this.wire_many([
+            (len, (1,)),
+            (len, (2,)),
+            (abs, (1,)),
+            (len, (1,)),
+        ])
+
+
+    def test_unwire_many_any_args(self):
+
+        self.w.this.unwire_many([len, len])
+        self.assertEqual(self.w.this.wirings, [(abs, (1,), {}), (len, (1,), {})])
+
+
+    def test_unwire_many_with_args(self):
+
+        self.w.this.unwire_many([(len, (1,)), (len, (1,)), (abs, (1,))])
+        self.assertEqual(self.w.this.wirings, [(len, (2,), {})])
+
+
+    def test_unwire_many_matches_unwire(self):
+
+        removals = [(len, (2,)), len, abs]
+        expected = Wires()
+        expected.this.wire_many(self.w.this.wirings)
+        for function, *args in [(len, 2), (len,), (abs,)]:
+            expected.this.unwire(function, *args)
+        self.w.this.unwire_many(removals)
+        self.assertEqual(self.w.this.wirings, expected.this.wirings)
+
+
+    def test_unwire_many_not_wired_removes_none(self):
+
+        with self.assertRaises(ValueError):
+            self.w.this.unwire_many([len, max])
+        with self.assertRaises(ValueError):
+            self.w.this.unwire_many([(len, (3,))])
+        with self.assertRaises(ValueError):
+            self.w.this.unwire_many([abs, abs])
+        self.assertEqual(len(self.w.this), 4)
+
+
+    def test_unwire_many_min_wirings_removes_none(self):
+
+        self.w.this.min_wirings = 2
+        with self.assertRaises(RuntimeError):
+            self.w.this.unwire_many([len, len, len])
+        self.assertEqual(len(self.w.this), 4)
+        self.w.this.unwire_many([len, len])
+        self.assertEqual(len(self.w.this), 2)
+
+
+    def test_unwire_many_unhashable(self):
+
+        unhashable = _Unhashable()
+        self.w.this.wire(unhashable)
+        self.w.this.unwire_many([unhashable, (len, (2,))])
+        self.assertEqual(len(self.w.this), 3)
+        with self.assertRaises(ValueError):
+            self.w.this.unwire_many([unhashable])
+
+
+    def test_unwire_many_import_path(self):
+
+        self.w.that.wire_many(['os.path:join', 'os.path:join'])
+        self.w.that.unwire_many(['os.path:join'])
+        self.assertEqual(self.w.that.wirings, [(ImportPath('os.path:join'), (), {})])
+
+
+    def test_unwire_many_empty(self):
+
+        self.w.that.min_wirings = 1
+        self.w.that.unwire_many([])
+
+
+# ----------------------------------------------------------------------------
@@ -10,8 +10,6 @@ Wires instance caller/callee custom coupling tests.
 """
 
 
-from __future__ import absolute_import
-
 import sys
 import unittest
 
@@ -0,0 +1,233 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Disabled Wires tests.
+"""
+
+
+import importlib
+import os
+import unittest
+
+from wires import Wires
+from wires import _disabled, _shared
+
+
+
+class TestDisabledWires(unittest.TestCase):
+
+    """
+    Wires(enabled=False) tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(enabled=False)
+        self.calls = []
+
+
+    def record(self, *args, **kwargs):
+
+        self.calls.append((args, kwargs))
+        return 42
+
+
+    def test_enabled_wires_are_plain_wires(self):
+
+        self.assertIs(type(Wires()), Wires)
+        self.assertIs(type(Wires(enabled=True)), Wires)
+
+
+    def test_disabled_wires_type(self):
+
+        self.assertIsInstance(self.w, Wires)
+        self.assertIsInstance(self.w, _disabled.DisabledWires)
+
+
+    def test_positional_enabled_argument(self):
+
+        w = Wires(None, None, False, True, 'full', False)
+        self.assertIsInstance(w, _disabled.DisabledWires)
+
+
+    def test_repr_round_trips(self):
+
+        w = eval(repr(self.w), {'Wires': Wires})
+        self.assertIsInstance(w, _disabled.DisabledWires)
+        self.assertIn('enabled=False', repr(self.w))
+
+
+    def test_callable_cached_as_instance_attribute(self):
+
+        this = self.w.this
+        self.assertIs(self.w.__dict__['this'], this)
+        self.assertIs(self.w.this, this)
+        self.assertIs(self.w['this'], this)
+
+
+    def test_wirings_recorded_not_called(self):
+
+        self.w.this.wire(self.record, 1, a=2)
+        result = self.w.this(3)
+        self.assertIsNone(result)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.w.this.wirings, [(self.record, (1,), {'a': 2})])
+        self.assertEqual(len(self.w.this), 1)
+
+
+    def test_unwire(self):
+
+        self.w.this.wire(self.record)
+        self.w.this.unwire(self.record)
+        self.assertEqual(self.w.this.wirings, [])
+
+
+    def test_is_wired_is_false(self):
+
+        self.w.this.wire(self.record)
+        self.assertFalse(self.w.this.is_wired)
+
+
+    def test_call_lazy_does_not_call_thunk(self):
+
+        self.w.this.wire(self.record)
+        self.assertIsNone(self.w.this.call_lazy(self.record))
+        self.assertEqual(self.calls, [])
+
+
+    def test_returns_wires_setting(self):
+
+        w = Wires(returns=True, enabled=False)
+        w.this.wire(self.record)
+        self.assertEqual(w.this(), [])
+        self.assertEqual(w.this.call_lazy(self.record), [])
+
+
+    def test_returns_callable_setting(self):
+
+        self.w.this.wire(self.record)
+        self.w.this.returns = True
+        self.assertEqual(self.w.this(), [])
+        del self.w.this.returns
+        self.assertIsNone(self.w.this())
+
+
+    def test_returns_callable_set(self):
+
+        self.w.this.set(returns=True)
+        self.assertEqual(self.w.this(), [])
+        self.w.this.set(returns=False)
+        self.assertIsNone(self.w.this())
+
+
+    def test_calltime_returns(self):
+
+        self.w.this.wire(self.record)
+        for wires in (self.w(returns=True), self.w(returns=True, ignore_exceptions=False)):
+            self.assertEqual(wires.this(), [])
+            self.assertEqual(wires['this'].call_key('key'), [])
+            self.assertEqual(wires.this.call_lazy(self.record), [])
+            self.assertEqual(wires.this.wirings, [(self.record, (), {})])
+        self.assertIsNone(self.w.this())
+        self.assertEqual(self.calls, [])
+
+
+    def test_calltime_settings_ignored(self):
+
+        self.w.this.wire(self.record)
+        self.assertIsNone(self.w(ignore_exceptions=False).this())
+        self.assertEqual(self.w._calltime_settings, {})
+
+
+    def test_min_wirings_not_enforced_on_call(self):
+
+        w = Wires(min_wirings=1, enabled=False)
+        self.assertIsNone(w.this())
+
+
+    def test_max_wirings_enforced_on_wire(self):
+
+        w = Wires(max_wirings=1, enabled=False)
+        w.this.wire(self.record)
+        with self.assertRaises(RuntimeError):
+            w.this.wire(self.record)
+
+
+    def test_delete_callable(self):
+
+        this = self.w.this
+        del self.w.this
+        self.assertNotIn('this', self.w.__dict__)
+        self.assertEqual(len(self.w), 0)
+        self.assertIsNot(self.w.this, this)
+
+
+    def test_delete_other_attribute(self):
+
+        self.w.other = 42
+        del self.w.other
+        with self.assertRaises(AttributeError):
+            del self.w.other
+
+
+    def test_dir_has_no_duplicates(self):
+
+        _ = self.w.this
+        _ = self.w.that
+        result = dir(self.w)
+        self.assertEqual(result.count('this'), 1)
+        self.assertEqual(result.count('that'), 1)
+
+
+    def test_iteration(self):
+
+        this = self.w.this
+        self.assertEqual(list(self.w), [this])
+
+
+
+class TestSharedInstanceEnvironment(unittest.TestCase):
+
+    """
+    WIRES_DISABLED environment variable tests.
+    """
+
+    def tearDown(self):
+
+        os.environ.pop('WIRES_DISABLED', None)
+        importlib.reload(_shared)
+
+
+    def _reloaded_shared_instance(self, value):
+
+        if value is None:
+            os.environ.pop('WIRES_DISABLED', None)
+        else:
+            os.environ['WIRES_DISABLED'] = value
+        return importlib.reload(_shared).w
+
+
+    def test_unset_enabled(self):
+
+        w = self._reloaded_shared_instance(None)
+        self.assertIs(type(w), Wires)
+
+
+    def test_zero_enabled(self):
+
+        w = self._reloaded_shared_instance('0')
+        self.assertIs(type(w), Wires)
+
+
+    def test_set_disabled(self):
+
+        w = self._reloaded_shared_instance('1')
+        self.assertIsInstance(w, _disabled.DisabledWires)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,186 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring failure record tests.
+"""
+
+
+import gc
+import unittest
+import weakref
+
+from wires import Wires, WiringFailure
+
+
+
+class _Payload(object):
+
+    """
+    Weak referenceable object, local to failing wirings.
+    """
+
+
+
+class TestExceptionDetail(unittest.TestCase):
+
+    """
+    exception_detail setting tests.
+    """
+
+    def setUp(self):
+
+        # Weak reference to the last failing wiring's local payload.
+        self.payload_ref = None
+
+
+    def fails(self, *args, **kwargs):
+        """
+        Raises ValueError, with a local variable referencing a payload.
+        """
+        payload = _Payload()
+        self.payload_ref = weakref.ref(payload)
+        raise ValueError('failed with %r' % (args,))
+
+
+    def chained_fails(self):
+        """
+        Raises RuntimeError, chained from a ValueError.
+        """
+        try:
+            self.fails()
+        except ValueError as e:
+            raise RuntimeError('chained') from e
+
+
+    def assert_payload_released(self):
+        """
+        Asserts the failing wiring's frame locals are no longer alive.
+        """
+        gc.collect()
+        self.assertIsNone(self.payload_ref())
+
+
+    def test_default_is_full(self):
+        """
+        By default results hold live exceptions, with their tracebacks.
+        """
+        w = Wires(returns=True)
+        w.this.wire(self.fails, 42)
+
+        [(exception, result)] = w.this()
+
+        self.assertEqual(w.this.exception_detail, 'full')
+        self.assertIsInstance(exception, ValueError)
+        self.assertIsNotNone(exception.__traceback__)
+        self.assertIsNone(result)
+        self.assertIsNotNone(self.payload_ref())
+
+
+    def test_no_traceback(self):
+        """
+        With 'no_traceback', exceptions have no tracebacks nor pin frames.
+        """
+        w = Wires(returns=True, exception_detail='no_traceback')
+        w.this.wire(self.chained_fails)
+
+        [(exception, _)] = w.this()
+
+        self.assertIsInstance(exception, RuntimeError)
+        self.assertIsNone(exception.__traceback__)
+        self.assertIsNone(exception.__cause__.__traceback__)
+        self.assert_payload_released()
+
+
+    def test_compact(self):
+        """
+        With 'compact', results hold type and message only.
+        """
+        w = Wires(returns=True, exception_detail='compact')
+        w.this.wire(self.fails, 42)
+
+        [(failure, _)] = w.this()
+
+        self.assertIsInstance(failure, WiringFailure)
+        self.assertIs(failure.type, ValueError)
+        self.assertEqual(failure.message, 'failed with (42,)')
+        self.assertIsNone(failure.summary)
+        self.assertEqual(failure.format_traceback(), '')
+        self.assertEqual(repr(failure), '<WiringFailure ValueError: failed with (42,)>')
+        self.assert_payload_released()
+
+
+    def test_summary(self):
+        """
+        With 'summary', results hold a frame free, formattable, traceback.
+        """
+        w = Wires(returns=True, exception_detail='summary')
+        w.this.wire(self.fails)
+
+        [(failure, _)] = w.this()
+
+        self.assertIs(failure.type, ValueError)
+        self.assert_payload_released()
+
+        formatted = failure.format_traceback()
+        lines = formatted.splitlines()
+        self.assertEqual(lines[0], 'Traceback (most recent call last):')
+        self.assertIn('in fails', formatted)
+        self.assertIn("raise ValueError('failed with %r' % (args,))", formatted)
+        self.assertEqual(lines[-1], 'ValueError: failed with ()')
+
+
+    def test_records_in_raised_runtime_error(self):
+        """
+        RuntimeError arguments hold records, too.
+        """
+        w = Wires(returns=True, ignore_exceptions=False, exception_detail='compact')
+        w.this.wire(self.fails)
+
+        with self.assertRaises(RuntimeError) as cm:
+            w.this()
+
+        [(failure, _)] = cm.exception.args
+        self.assertIsInstance(failure, WiringFailure)
+
+
+    def test_per_callable_and_call_time(self):
+        """
+        exception_detail can be set per callable and overridden at call time.
+        """
+        w = Wires(returns=True)
+        w.this.wire(self.fails)
+        w.this.exception_detail = 'compact'
+
+        [(failure, _)] = w.this()
+        self.assertIsInstance(failure, WiringFailure)
+
+        [(exception, _)] = w(exception_detail='full').this()
+        self.assertIsInstance(exception, ValueError)
+
+        del w.this.exception_detail
+        self.assertEqual(w.this.exception_detail, 'full')
+
+        w.this.set(exception_detail='compact')
+        self.assertEqual(w.this.exception_detail, 'compact')
+
+
+    def test_invalid_values_raise_value_error(self):
+        """
+        Invalid exception_detail values raise ValueError at all levels.
+        """
+        with self.assertRaises(ValueError):
+            Wires(exception_detail='nope')
+
+        w = Wires()
+        with self.assertRaises(ValueError):
+            w.this.exception_detail = 'nope'
+        with self.assertRaises(ValueError):
+            w(exception_detail='nope')
+
+
+# ----------------------------------------------------------------------------
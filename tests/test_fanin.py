@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Worker to parent fan-in tests.
+"""
+
+
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+import unittest
+
+from wires import Wires, FanIn
+from wires import _fanin
+
+
+
+def _work(item):
+
+    # Pool task: reports progress, then a result, through the proxy Wires.
+
+    w = FanIn.worker_wires()
+    for step in range(10):
+        w.progress(item, step)
+    w.done(item, pid=os.getpid())
+    return item
+
+
+
+_marker = None
+
+def _set_marker(value):
+
+    global _marker
+    _marker = value
+
+
+
+def _read_marker(_):
+
+    FanIn.worker_wires().marker(_marker)
+
+
+
+class TestFanIn(unittest.TestCase):
+
+    """
+    FanIn tests.
+    """
+
+    def setUp(self):
+
+        self.context = multiprocessing.get_context('spawn')
+        self.progress = []
+        self.done = []
+        self.w = Wires()
+        self.w.progress.wire(lambda item, step: self.progress.append((item, step)))
+        self.w.done.wire(lambda item, pid: self.done.append((item, pid)))
+
+
+    def test_worker_wires_outside_worker_raises(self):
+
+        with self.assertRaises(RuntimeError):
+            FanIn.worker_wires()
+
+
+    def test_invalid_max_batch(self):
+
+        with self.assertRaises(ValueError):
+            FanIn(self.w, max_batch=0)
+
+
+    def test_multiprocessing_pool(self):
+
+        fan_in = FanIn(self.w, max_batch=7, context=self.context)
+        pool = self.context.Pool(2, initializer=fan_in.initializer, initargs=fan_in.initargs)
+        try:
+            self.assertEqual(pool.map(_work, range(20)), list(range(20)))
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+        fan_in.close()
+
+        self.assertEqual(sorted(self.progress), [(i, s) for i in range(20) for s in range(10)])
+        for item in range(20):
+            # Per item order, from a single worker, is kept.
+            steps = [s for i, s in self.progress if i == item]
+            self.assertEqual(steps, list(range(10)))
+        self.assertEqual(sorted(item for item, _ in self.done), list(range(20)))
+        self.assertNotIn(os.getpid(), [pid for _, pid in self.done])
+        self.assertEqual(fan_in.errors, 0)
+
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires ProcessPoolExecutor initializer support')
+    def test_process_pool_executor(self):
+
+        fan_in = FanIn(self.w, context=self.context)
+        with concurrent.futures.ProcessPoolExecutor(
+            2, mp_context=self.context,
+            initializer=fan_in.initializer, initargs=fan_in.initargs,
+        ) as executor:
+            self.assertEqual(list(executor.map(_work, range(5))), list(range(5)))
+        fan_in.close()
+
+        self.assertEqual(len(self.progress), 50)
+        self.assertEqual(sorted(item for item, _ in self.done), list(range(5)))
+
+
+    def test_chained_initializer(self):
+
+        markers = []
+        self.w.marker.wire(markers.append)
+        fan_in = FanIn(self.w, context=self.context,
+                       initializer=_set_marker, initargs=('set',))
+        pool = self.context.Pool(1, initializer=fan_in.initializer, initargs=fan_in.initargs)
+        try:
+            pool.map(_read_marker, range(2))
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+        fan_in.close()
+        self.assertEqual(markers, ['set', 'set'])
+
+
+    def test_dispatch_errors_counted(self):
+
+        self.w.failing.min_wirings = 1
+        fan_in = FanIn(self.w, context=self.context)
+        sender = _fanin._Sender(fan_in.initargs[0], 10, 60)
+        sender.send('failing', (), {})
+        sender.send('progress', (1, 2), {})
+        sender.flush()
+        fan_in.close()
+        self.assertEqual(self.progress, [(1, 2)])
+        self.assertEqual(fan_in.errors, 1)
+
+
+# ----------------------------------------------------------------------------
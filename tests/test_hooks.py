@@ -0,0 +1,320 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring hooks and profiler tests.
+"""
+
+
+import time
+import unittest
+
+from wires import Wires, WiresHook, WiresProfiler
+
+from . import mixin_test_callables
+
+
+
+class RecordingHook(WiresHook):
+
+    """
+    Records hook calls as (<event>, <callable name>, <function>, <extra>).
+    """
+
+    def __init__(self):
+
+        self.events = []
+
+
+    def before(self, wires_callable, function):
+
+        self.events.append(('before', wires_callable.__name__, function, None))
+
+
+    def after(self, wires_callable, function, result):
+
+        self.events.append(('after', wires_callable.__name__, function, result))
+
+
+    def exception(self, wires_callable, function, exception):
+
+        self.events.append(('exception', wires_callable.__name__, function, exception))
+
+
+
+class TestWiresHook(mixin_test_callables.TestCallablesMixin,
+                    unittest.TestCase):
+
+    """
+    WiresHook tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.hook = RecordingHook()
+
+
+    def test_attached_hook_sees_before_and_after(self):
+        """
+        Attached hooks are called before and after each wiring call.
+        """
+        self.w.this.wire(self.returns_42)
+        self.hook.attach(self.w)
+
+        self.w.this()
+
+        self.assertEqual(self.hook.events, [
+            ('before', 'this', self.returns_42, None),
+            ('after', 'this', self.returns_42, 42),
+        ])
+
+
+    def test_attached_hook_sees_exceptions(self):
+        """
+        Attached hooks are called with wiring raised exceptions.
+        """
+        self.w.this.wire(self.raises_exception)
+        self.hook.attach(self.w)
+
+        result = self.w.this()
+
+        self.assertEqual(result, [(self.EXCEPTION, None)])
+        self.assertEqual(self.hook.events, [
+            ('before', 'this', self.raises_exception, None),
+            ('exception', 'this', self.raises_exception, self.EXCEPTION),
+        ])
+
+
+    def test_uninterested_hook_skips_wiring_calls(self):
+        """
+        Hooks not interested in a call only see it entered.
+        """
+        calls = []
+
+        class SelectiveHook(RecordingHook):
+            def enter(self, wires_callable, args, kwargs):
+                calls.append(('enter', wires_callable.__name__, args, kwargs))
+                return args == (1,)
+            def leave(self, wires_callable):
+                calls.append(('leave', wires_callable.__name__))
+
+        hook = SelectiveHook()
+        hook.attach(self.w)
+        self.w.this.wire(self.returns_42)
+
+        self.w.this(0)
+        self.assertEqual(calls, [('enter', 'this', (0,), {})])
+        self.assertEqual(hook.events, [])
+
+        self.w.this(1)
+        self.assertEqual(calls[1:], [('enter', 'this', (1,), {}), ('leave', 'this')])
+        self.assertEqual(len(hook.events), 2)
+
+
+    def test_entered_hooks_leave_when_later_enter_raises(self):
+        """
+        Hooks entered before one whose enter raises are left.
+        """
+        calls = []
+
+        class LeavingHook(RecordingHook):
+            def leave(self, wires_callable):
+                calls.append(('leave', wires_callable.__name__))
+
+        class FailingHook(RecordingHook):
+            def enter(self, wires_callable, args, kwargs):
+                raise ValueError('enter')
+
+        LeavingHook().attach(self.w)
+        FailingHook().attach(self.w)
+        self.w.this.wire(self.returns_42)
+
+        with self.assertRaises(ValueError):
+            self.w.this()
+        self.assertEqual(calls, [('leave', 'this')])
+
+
+    def test_detached_hook_is_not_called(self):
+        """
+        Detached hooks are no longer called.
+        """
+        self.w.this.wire(self.returns_42)
+        self.hook.attach(self.w)
+        self.hook.detach(self.w)
+
+        self.w.this()
+
+        self.assertEqual(self.hook.events, [])
+
+
+    def test_double_attach_raises_value_error(self):
+        """
+        Attaching an attached hook raises ValueError.
+        """
+        self.hook.attach(self.w)
+
+        with self.assertRaises(ValueError):
+            self.hook.attach(self.w)
+
+
+    def test_detach_non_attached_raises_value_error(self):
+        """
+        Detaching a non-attached hook raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.hook.detach(self.w)
+
+
+
+class TestWiresProfiler(unittest.TestCase):
+
+    """
+    WiresProfiler tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires()
+        self.slow = []
+        self.profiler = WiresProfiler(
+            budget=0.01,
+            on_slow=lambda *args: self.slow.append(args),
+        )
+        self.profiler.attach(self.w)
+
+
+    @staticmethod
+    def fast():
+        """
+        Returns right away.
+        """
+
+
+    @staticmethod
+    def slow_sleeper():
+        """
+        Takes longer than the test budget.
+        """
+        time.sleep(0.02)
+
+
+    def test_stats_per_callable_and_function(self):
+        """
+        Calls are accounted for per (<callable name>, <function>).
+        """
+        self.w.this.wire(self.fast)
+        self.w.that.wire(self.fast)
+
+        self.w.this()
+        self.w.this()
+        self.w.that()
+
+        stats = self.profiler.stats
+        self.assertEqual(set(stats), {('this', self.fast), ('that', self.fast)})
+        self.assertEqual(stats[('this', self.fast)].calls, 2)
+        self.assertEqual(stats[('that', self.fast)].calls, 1)
+
+
+    def test_slow_wirings_flagged(self):
+        """
+        Wiring calls exceeding the budget are flagged.
+        """
+        self.w.this.wire(self.fast)
+        self.w.this.wire(self.slow_sleeper)
+
+        self.w.this()
+
+        slow_wirings = self.profiler.slow_wirings
+        self.assertEqual(len(slow_wirings), 1)
+        name, function, wall_time = slow_wirings[0]
+        self.assertEqual(name, 'this')
+        self.assertEqual(function, self.slow_sleeper)
+        self.assertGreaterEqual(wall_time, 0.01)
+        self.assertEqual(self.slow, slow_wirings)
+        self.assertEqual(self.profiler.stats[('this', self.slow_sleeper)].over_budget, 1)
+
+
+    def test_failures_counted(self):
+        """
+        Wirings raising exceptions have their failures accounted for.
+        """
+        def fails():
+            raise ValueError()
+
+        self.w.this.wire(fails)
+        self.w.this()
+
+        stats = self.profiler.stats[('this', fails)]
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.failures, 1)
+
+
+    def test_nested_calls_are_inclusive(self):
+        """
+        Outer wirings are attributed the time of nested wirings.
+        """
+        self.w.inner.wire(self.slow_sleeper)
+        self.w.outer.wire(self.w.inner)
+
+        self.w.outer()
+
+        stats = self.profiler.stats
+        outer_time = stats[('outer', self.w.inner)].wall_time
+        inner_time = stats[('inner', self.slow_sleeper)].wall_time
+        self.assertGreaterEqual(outer_time, inner_time)
+
+
+    def test_unhashable_functions_keyed_by_id(self):
+        """
+        Unhashable wired functions are accounted for by id; results unchanged.
+        """
+        class Unhashable(object):
+            def __eq__(self, other):
+                return self is other
+            def __call__(self):
+                return 'result'
+
+        function = Unhashable()
+        self.w.this.wire(function)
+
+        self.assertEqual(self.w(returns=True).this(), [(None, 'result')])
+        self.assertEqual(self.profiler.stats[('this', id(function))].calls, 1)
+        self.assertEqual(self.profiler.errors, 0)
+
+
+    def test_accounting_errors_counted(self):
+        """
+        Accounting raised exceptions are counted, not raised.
+        """
+        def on_slow(*args):
+            raise RuntimeError()
+
+        profiler = WiresProfiler(budget=0.01, on_slow=on_slow)
+        profiler.attach(self.w)
+        self.w.this.wire(self.slow_sleeper)
+
+        self.assertEqual(self.w(returns=True).this(), [(None, None)])
+        self.assertEqual(profiler.errors, 1)
+
+
+    def test_report_and_reset(self):
+        """
+        Reports include callable names; resetting discards statistics.
+        """
+        self.w.this.wire(self.fast)
+        self.w.this()
+
+        report = self.profiler.report()
+        self.assertIn('this', report.splitlines()[1])
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.stats, {})
+        self.assertEqual(self.profiler.slow_wirings, [])
+
+
+# ----------------------------------------------------------------------------
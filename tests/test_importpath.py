@@ -0,0 +1,256 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Import path wiring tests.
+"""
+
+
+import collections
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from wires import Wires, wire_table
+from wires._importpath import ImportPath
+
+
+
+_SUBSCRIBER_SOURCE = '''
+calls = []
+
+def record(*args, **kwargs):
+    calls.append((args, kwargs))
+    return 'recorded'
+
+class Nested(object):
+    @staticmethod
+    def record(*args, **kwargs):
+        return 'nested'
+
+not_callable = 42
+'''
+
+
+
+class _SubscriberModuleMixin(object):
+
+    """
+    Creates an importable, not yet imported, `wires_test_subscriber` module.
+    """
+
+    module_name = 'wires_test_subscriber'
+
+    def setUp(self):
+
+        self.module_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.module_dir, self.module_name + '.py'), 'w') as f:
+            f.write(_SUBSCRIBER_SOURCE)
+        sys.path.insert(0, self.module_dir)
+        sys.modules.pop(self.module_name, None)
+
+
+    def tearDown(self):
+
+        sys.path.remove(self.module_dir)
+        sys.modules.pop(self.module_name, None)
+        shutil.rmtree(self.module_dir)
+
+
+
+class TestImportPath(_SubscriberModuleMixin, unittest.TestCase):
+
+    """
+    ImportPath tests.
+    """
+
+    def test_invalid_paths(self):
+
+        for path in ('', 'module', ':attr', 'module:', 'module:a..b', 'module:a.'):
+            with self.assertRaises(ValueError):
+                ImportPath(path)
+
+
+    def test_not_resolved_on_creation(self):
+
+        ip = ImportPath('wires_test_subscriber:record')
+        self.assertFalse(ip.resolved)
+        self.assertNotIn(self.module_name, sys.modules)
+
+
+    def test_resolve(self):
+
+        ip = ImportPath('wires_test_subscriber:record')
+        target = ip.resolve()
+        self.assertTrue(ip.resolved)
+        self.assertIs(target, sys.modules[self.module_name].record)
+
+
+    def test_resolve_nested_attribute(self):
+
+        ip = ImportPath('wires_test_subscriber:Nested.record')
+        self.assertEqual(ip(), 'nested')
+
+
+    def test_resolve_not_callable(self):
+
+        ip = ImportPath('wires_test_subscriber:not_callable')
+        with self.assertRaises(TypeError):
+            ip.resolve()
+        self.assertFalse(ip.resolved)
+
+
+    def test_resolve_missing_attribute(self):
+
+        ip = ImportPath('wires_test_subscriber:missing')
+        with self.assertRaises(AttributeError):
+            ip.resolve()
+
+
+    def test_resolve_missing_module(self):
+
+        ip = ImportPath('wires_test_no_such_module:missing')
+        with self.assertRaises(ImportError):
+            ip.resolve()
+
+
+    def test_resolution_cached(self):
+
+        ip = ImportPath('wires_test_subscriber:record')
+        target = ip.resolve()
+        del sys.modules[self.module_name]
+        self.assertIs(ip.resolve(), target)
+        self.assertNotIn(self.module_name, sys.modules)
+
+
+    def test_equality_and_hash(self):
+
+        a = ImportPath('wires_test_subscriber:record')
+        b = ImportPath('wires_test_subscriber:record')
+        c = ImportPath('wires_test_subscriber:Nested.record')
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(a, 'wires_test_subscriber:record')
+
+
+
+class TestImportPathWiring(_SubscriberModuleMixin, unittest.TestCase):
+
+    """
+    Wiring import path strings.
+    """
+
+    def setUp(self):
+
+        super(TestImportPathWiring, self).setUp()
+        self.w = Wires(returns=True)
+
+
+    def test_wire_does_not_import(self):
+
+        self.w.this.wire('wires_test_subscriber:record')
+        self.assertNotIn(self.module_name, sys.modules)
+        [(function, args, kwargs)] = self.w.this.wirings
+        self.assertEqual(function, ImportPath('wires_test_subscriber:record'))
+
+
+    def test_call_imports_and_passes_arguments(self):
+
+        self.w.this.wire('wires_test_subscriber:record', 1, a=2)
+        result = self.w.this(3, b=4)
+        self.assertEqual(result, [(None, 'recorded')])
+        module = sys.modules[self.module_name]
+        self.assertEqual(module.calls, [((1, 3), {'a': 2, 'b': 4})])
+
+
+    def test_invalid_path_raises_on_wire(self):
+
+        with self.assertRaises(ValueError):
+            self.w.this.wire('not an import path')
+        self.assertEqual(self.w.this.wirings, [])
+
+
+    def test_resolution_failure_is_wiring_exception(self):
+
+        self.w.this.wire('wires_test_subscriber:missing')
+        [(exception, result)] = self.w.this()
+        self.assertIsInstance(exception, AttributeError)
+        self.assertIsNone(result)
+
+
+    def test_unwire_by_path(self):
+
+        self.w.this.wire('wires_test_subscriber:record')
+        self.w.this.wire('wires_test_subscriber:Nested.record')
+        self.w.this.unwire('wires_test_subscriber:record')
+        self.assertEqual(
+            self.w.this.wirings,
+            [(ImportPath('wires_test_subscriber:Nested.record'), (), {})],
+        )
+
+
+    def test_unwire_by_path_with_args(self):
+
+        self.w.this.wire('wires_test_subscriber:record', 1)
+        self.w.this.wire('wires_test_subscriber:record', 2)
+        self.w.this.unwire('wires_test_subscriber:record', 2)
+        self.assertEqual(
+            self.w.this.wirings,
+            [(ImportPath('wires_test_subscriber:record'), (1,), {})],
+        )
+
+
+    def test_unwire_by_unknown_path(self):
+
+        self.w.this.wire('wires_test_subscriber:record')
+        with self.assertRaises(ValueError):
+            self.w.this.unwire('wires_test_subscriber:other')
+
+
+
+class TestWireTable(_SubscriberModuleMixin, unittest.TestCase):
+
+    """
+    wire_table tests.
+    """
+
+    def test_wire_table(self):
+
+        w = Wires(returns=True)
+        wire_table(w, {
+            'this': [
+                'wires_test_subscriber:record',
+                ('wires_test_subscriber:record', [1]),
+                ['wires_test_subscriber:record', (), {'a': 2}],
+            ],
+            'that': [len],
+        })
+        self.assertNotIn(self.module_name, sys.modules)
+        self.assertEqual(w.this.wirings, [
+            (ImportPath('wires_test_subscriber:record'), (), {}),
+            (ImportPath('wires_test_subscriber:record'), (1,), {}),
+            (ImportPath('wires_test_subscriber:record'), (), {'a': 2}),
+        ])
+        self.assertEqual(w.that('abc'), [(None, 3)])
+
+
+    def test_wire_table_failure_keeps_preceding_callable_wirings(self):
+
+        w = Wires(max_wirings=1)
+        with self.assertRaises(RuntimeError):
+            wire_table(w, collections.OrderedDict([
+                ('this', [len]),
+                ('that', [len, len]),
+            ]))
+        self.assertEqual(w.this.wirings, [(len, (), {})])
+        self.assertEqual(w.that.wirings, [])
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,204 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring result memoization tests.
+"""
+
+
+import copy
+import pickle
+import time
+import unittest
+
+from wires import Wires, WiresHook, MemoCache, snapshot, restore
+
+
+
+class _Lookup(object):
+
+    # Counts calls; results depend only on arguments.
+
+    def __init__(self):
+
+        self.calls = 0
+
+
+    def __call__(self, *args, **kwargs):
+
+        self.calls += 1
+        if args and args[-1] == 'fail':
+            raise ValueError('fail')
+        return (args, sorted(kwargs.items()))
+
+
+
+def _lookup(value):
+
+    return value * 2
+
+
+
+class _CountingHook(WiresHook):
+
+    def __init__(self):
+
+        self.called = 0
+
+
+    def before(self, wires_callable, wired_callable):
+
+        self.called += 1
+
+
+
+class TestMemoCache(unittest.TestCase):
+
+    """
+    MemoCache tests.
+    """
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            MemoCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            MemoCache(ttl=0)
+
+
+    def test_lru_eviction(self):
+
+        cache = MemoCache(maxsize=2)
+        lookup = _Lookup()
+        for value in (1, 2, 1, 3, 1, 2):
+            cache.call(lambda f, a, k: f(*a, **k), lookup, [value], {})
+        # 1, 2: misses; 1: hit; 3: miss, evicts 2; 1: hit; 2: miss.
+        self.assertEqual((cache.hits, cache.misses, lookup.calls), (2, 4, 4))
+        self.assertEqual(len(cache), 2)
+
+
+    def test_ttl(self):
+
+        cache = MemoCache(ttl=0.05)
+        lookup = _Lookup()
+        call = lambda f, a, k: f(*a, **k)
+        cache.call(call, lookup, [1], {})
+        cache.call(call, lookup, [1], {})
+        time.sleep(0.06)
+        cache.call(call, lookup, [1], {})
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+
+    def test_clear_repr_pickle(self):
+
+        cache = MemoCache(maxsize=10, ttl=5)
+        cache.call(lambda f, a, k: f(*a, **k), _lookup, [1], {})
+        self.assertEqual(repr(cache), '<MemoCache maxsize=10 ttl=5 hits=0 misses=1>')
+        copied = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(len(copied), 0)
+        self.assertEqual(repr(copied), '<MemoCache maxsize=10 ttl=5 hits=0 misses=0>')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 1)
+
+
+
+class TestMemoize(unittest.TestCase):
+
+    """
+    with_options(memoize=...) tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True, ignore_exceptions=True)
+        self.lookup = _Lookup()
+        self.cache = MemoCache()
+        self.w.query.with_options(memoize=self.cache).wire(self.lookup, 'wire-time')
+
+
+    def test_cached_by_combined_arguments(self):
+
+        first = self.w.query(1, a=2)
+        self.assertEqual(self.w.query(1, a=2), first)
+        self.w.query(2, a=2)
+        self.w.query(1, a=3)
+        self.assertEqual(self.lookup.calls, 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+
+    def test_exceptions_not_cached(self):
+
+        self.w.query('fail')
+        result = self.w.query('fail')
+        self.assertIsInstance(result[0][0], ValueError)
+        self.assertEqual(self.lookup.calls, 2)
+
+
+    def test_unhashable_arguments_not_cached(self):
+
+        self.w.query([1])
+        self.w.query([1])
+        self.assertEqual(self.lookup.calls, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+
+    def test_shared_cache_keyed_by_function(self):
+
+        other = _Lookup()
+        self.w.query.with_options(memoize=self.cache).wire(other, 'wire-time')
+        self.w.query(1)
+        self.w.query(1)
+        self.assertEqual((self.lookup.calls, other.calls), (1, 1))
+        self.assertEqual(self.cache.misses, 2)
+
+
+    def test_memoize_true_and_plain_wirings(self):
+
+        plain = _Lookup()
+        self.w.query.wire(plain)
+        self.w.query.with_options(memoize=True).wire(_lookup)
+        self.assertEqual(self.w.query(3)[2], (None, 6))
+        self.w.query(3)
+        self.assertEqual(plain.calls, 2)
+        self.assertIsInstance(self.w.query.wirings[2].memoize, MemoCache)
+
+
+    def test_memoize_invalid(self):
+
+        with self.assertRaises(TypeError):
+            self.w.query.with_options(memoize={})
+
+
+    def test_hooks_not_called_on_hits(self):
+
+        hook = _CountingHook()
+        hook.attach(self.w)
+        self.w.query(1)
+        self.w.query(1)
+        self.assertEqual(hook.called, 1)
+
+
+    def test_copies_get_empty_caches(self):
+
+        self.w.query(1)
+        for w in (copy.deepcopy(self.w), pickle.loads(pickle.dumps(self.w))):
+            cache = w.query.wirings[0].memoize
+            self.assertIsNot(cache, self.cache)
+            self.assertEqual(len(cache), 0)
+
+
+    def test_snapshot(self):
+
+        w = Wires(returns=True)
+        w.double.with_options(memoize=MemoCache(maxsize=5)).wire(_lookup)
+        restored = restore(snapshot(w))
+        self.assertEqual(restored.double(2), [(None, 4)])
+        self.assertEqual(restored.double.wirings[0].memoize.misses, 1)
+
+
+# ----------------------------------------------------------------------------
@@ -10,8 +10,6 @@ Wires instance min/max wirings tests.
 """
 
 
-from __future__ import absolute_import
-
 import unittest
 
 from wires import Wires
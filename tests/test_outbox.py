@@ -0,0 +1,234 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Durable outbox tests.
+"""
+
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import mock
+
+from wires import Wires, Outbox
+
+
+
+class TestOutbox(unittest.TestCase):
+
+    """
+    Outbox tests.
+    """
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'calls.outbox')
+        self.w = Wires()
+        self.calls = []
+        self.w.this.wire(lambda *args, **kwargs: self.calls.append((args, kwargs)))
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+    def wait_for(self, condition, timeout=5):
+
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail('timed out')
+            time.sleep(0.005)
+
+
+    def test_forward_dispatches_in_background(self):
+
+        source = Wires()
+        outbox = Outbox(self.path, self.w)
+        outbox.forward(source.this)
+        source.this(1)
+        source.this(2, key='value')
+        self.wait_for(lambda: len(self.calls) == 2)
+        outbox.close()
+        self.assertEqual(self.calls, [((1,), {}), ((2,), {'key': 'value'})])
+        self.assertEqual(outbox.pending, [])
+
+
+    def test_forward_to_other_name(self):
+
+        source = Wires()
+        outbox = Outbox(self.path, self.w, background=False)
+        outbox.forward(source.that, name='this')
+        source.that(1)
+        self.assertEqual(outbox.dispatch(), 1)
+        outbox.close()
+        self.assertEqual(self.calls, [((1,), {})])
+
+
+    def test_pending_calls_survive_restart(self):
+
+        outbox = Outbox(self.path, self.w, background=False)
+        outbox.send('this', (1,), {})
+        outbox.send('this', (2,), {})
+        outbox.send('this', (3,), {})
+        self.assertEqual(outbox.dispatch(max_calls=1), 1)
+        outbox.close()
+        self.assertEqual(self.calls, [((1,), {})])
+
+        outbox = Outbox(self.path, self.w, background=False)
+        self.assertEqual(outbox.pending, [('this', (2,), {}), ('this', (3,), {})])
+        self.assertEqual(outbox.dispatch(), 2)
+        outbox.send('this', (4,), {})
+        outbox.dispatch()
+        outbox.close()
+        self.assertEqual([args for args, _ in self.calls], [(1,), (2,), (3,), (4,)])
+        self.assertEqual(Outbox(self.path, self.w, background=False).pending, [])
+
+
+    def test_committed_calls_survive_crash(self):
+
+        # Not closing: waited for sends are already on disk.
+        outbox = Outbox(self.path, self.w, background=False)
+        outbox.send('this', (1,), {})
+        with open(self.path, 'ab') as f:
+            # A torn record, as if crashing mid write.
+            f.write(b'\x40\x00\x00\x00\x00\x00')
+
+        recovered = Outbox(self.path, self.w, background=False)
+        self.assertEqual(recovered.pending, [('this', (1,), {})])
+        recovered.send('this', (2,), {})
+        recovered.dispatch()
+        recovered.close()
+        self.assertEqual(Outbox(self.path, self.w, background=False).pending, [])
+        self.assertEqual([args for args, _ in self.calls], [(1,), (2,)])
+
+
+    def test_dispatch_failure_keeps_call_pending(self):
+
+        self.w.failing.min_wirings = 1
+        outbox = Outbox(self.path, self.w, background=False)
+        outbox.send('failing', (), {})
+        with self.assertRaises(Exception):
+            outbox.dispatch()
+        self.assertEqual(outbox.pending, [('failing', (), {})])
+        outbox.close()
+        self.assertEqual(len(Outbox(self.path, self.w, background=False).pending), 1)
+
+
+    def test_background_dispatch_failure_retried(self):
+
+        self.w.failing.min_wirings = 1
+        outbox = Outbox(self.path, self.w, retry_interval=0.01)
+        outbox.send('failing', (), {})
+        self.wait_for(lambda: outbox.errors >= 2)
+        self.w.failing.wire(lambda: None)
+        self.wait_for(lambda: not outbox.pending)
+        outbox.close()
+        self.assertIsNotNone(outbox.last_error)
+
+
+    def test_group_commit(self):
+
+        outbox = Outbox(self.path, self.w, background=False)
+        with mock.patch('wires._outbox.os.fsync', wraps=os.fsync) as fsync:
+            for index in range(500):
+                outbox.send('this', (index,), {}, wait=False)
+            outbox.send('this', (500,), {})
+            self.assertLess(fsync.call_count, 100)
+        self.assertEqual(len(outbox.pending), 501)
+        outbox.close()
+
+
+    def test_concurrent_senders(self):
+
+        outbox = Outbox(self.path, self.w, commit_interval=0.001)
+
+        def sender(base):
+            for index in range(50):
+                outbox.send('this', (base, index), {})
+
+        with mock.patch('wires._outbox.os.fsync', wraps=os.fsync) as fsync:
+            threads = [threading.Thread(target=sender, args=(b,)) for b in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertLess(fsync.call_count, 400)
+        self.wait_for(lambda: len(self.calls) == 400)
+        outbox.close()
+        self.assertEqual(
+            sorted(args for args, _ in self.calls),
+            sorted((b, i) for b in range(8) for i in range(50)),
+        )
+
+
+    def test_compact(self):
+
+        outbox = Outbox(self.path, self.w, background=False)
+        for index in range(100):
+            outbox.send('this', (index,), {}, wait=False)
+        outbox.send('this', (100,), {})
+        outbox.dispatch(max_calls=99)
+        size = os.path.getsize(self.path)
+        outbox.compact()
+        self.assertLess(os.path.getsize(self.path), size)
+        outbox.send('this', (101,), {})
+        outbox.close()
+        self.assertEqual(
+            Outbox(self.path, self.w, background=False).pending,
+            [('this', (99,), {}), ('this', (100,), {}), ('this', (101,), {})],
+        )
+
+
+    def test_compact_right_after_commit(self):
+
+        outbox = Outbox(self.path, self.w, background=False)
+        fsync = os.fsync
+        synced = threading.Event()
+        racing = threading.Event()
+
+        def committer_fsync(fd):
+            fsync(fd)
+            if threading.current_thread().name == 'wires-outbox-committer':
+                synced.set()
+                racing.wait(5)
+
+        with mock.patch('os.fsync', committer_fsync):
+            outbox.send('this', (1,), {}, wait=False)
+            self.assertTrue(synced.wait(5))
+            # Compact as soon as the committer lets go of the file.
+            with outbox._cond:
+                racing.set()
+                released = outbox._io_lock.acquire(timeout=0.2)
+                if released:
+                    outbox._io_lock.release()
+                    outbox.compact()
+            if not released:
+                outbox.compact()
+        outbox.close()
+        self.assertEqual(
+            Outbox(self.path, self.w, background=False).pending,
+            [('this', (1,), {})],
+        )
+
+
+    def test_send_after_close_raises(self):
+
+        outbox = Outbox(self.path, self.w)
+        outbox.close()
+        with self.assertRaises(RuntimeError):
+            outbox.send('this', (), {})
+
+
+# ----------------------------------------------------------------------------
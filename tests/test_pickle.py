@@ -0,0 +1,291 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Pickling and copying tests.
+"""
+
+
+import copy
+import pickle
+import threading
+import unittest
+
+from wires import Wires, WiresHook
+from wires import _disabled
+from wires._importpath import ImportPath
+
+
+
+def receiver(*args, **kwargs):
+
+    return (args, kwargs)
+
+
+
+class _Base(object):
+
+    def setUp(self):
+
+        self.w = Wires(max_wirings=5, returns=True)
+        self.w.this.wire(receiver)
+        self.w.this.wire(receiver, [1, 2], a={'b': 3})
+        self.w.this.min_wirings = 1
+        self.w.that.wire(len)
+        _ = self.w.empty
+
+
+    def assert_equivalent(self, w):
+
+        self.assertIsNot(w, self.w)
+        self.assertIs(type(w), type(self.w))
+        self.assertEqual(w._settings, self.w._settings)
+        self.assertEqual(sorted(c.__name__ for c in w), ['empty', 'that', 'this'])
+        for name in ('empty', 'that', 'this'):
+            self.assertIsNot(w[name], self.w[name])
+            self.assertIs(w[name]._wires, w)
+            self.assertEqual(w[name].wirings, self.w[name].wirings)
+            self.assertEqual(w[name]._callable_settings, self.w[name]._callable_settings)
+        self.assertEqual(w.this('x'), self.w.this('x'))
+
+
+    def assert_independent(self, w):
+
+        w.this.unwire(receiver)
+        w.this.max_wirings = 4
+        self.assertEqual(len(self.w.this), 2)
+        self.assertEqual(self.w.this.max_wirings, 5)
+
+
+
+class TestProtocolLookups(unittest.TestCase):
+
+    """
+    Dunder attribute lookups do not create callables.
+    """
+
+    def test_dunder_getattr_raises(self):
+
+        for w in (Wires(), Wires(enabled=False)):
+            for name in ('__getnewargs_ex__', '__getinitargs__', '__whatever__'):
+                with self.assertRaises(AttributeError):
+                    getattr(w, name)
+            self.assertEqual(len(w), 0)
+
+
+    def test_leading_underscores_still_callables(self):
+
+        w = Wires()
+        self.assertIn(w['__private'], w)
+        self.assertIn(w['_private_'], w)
+
+
+
+class TestPickle(_Base, unittest.TestCase):
+
+    """
+    Pickling tests.
+    """
+
+    def test_pickle_wires(self):
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            w = pickle.loads(pickle.dumps(self.w, protocol))
+            self.assert_equivalent(w)
+            self.assert_independent(w)
+
+
+    def test_pickle_disabled_wires(self):
+
+        self.w = Wires(returns=True, enabled=False)
+        self.w.this.wire(receiver)
+        self.w.that.returns = False
+        w = pickle.loads(pickle.dumps(self.w))
+        self.assertIsInstance(w, _disabled.DisabledWires)
+        self.assertEqual(w.this.wirings, [(receiver, (), {})])
+        self.assertEqual(w.this(), [])
+        self.assertIsNone(w.that())
+
+
+    def test_pickle_callable(self):
+
+        this = pickle.loads(pickle.dumps(self.w.this))
+        self.assertIsNot(this, self.w.this)
+        self.assertEqual(this.wirings, self.w.this.wirings)
+        self.assertIs(this._wires.this, this)
+
+
+    def test_pickle_callable_wired_to_callable(self):
+
+        for self.w in (Wires(returns=True), Wires(returns=True, enabled=False)):
+            self.w.outer.wire(self.w.inner)
+            self.w.outer.with_options(priority=1).wire(self.w.inner, 'first')
+            self.w.inner.wire(receiver)
+            w = pickle.loads(pickle.dumps(self.w))
+            self.assertEqual([f for f, _, _ in w.outer.wirings], [w.inner, w.inner])
+            self.assertEqual(w.outer.wirings[0].priority, 1)
+            self.assertEqual(w.outer(), self.w.outer())
+
+
+    def test_pickle_callables_share_wires(self):
+
+        this, that = pickle.loads(pickle.dumps((self.w.this, self.w.that)))
+        self.assertIs(this._wires, that._wires)
+
+
+    def test_pickle_wires_attributes(self):
+
+        self.w.some_attribute = 42
+        w = pickle.loads(pickle.dumps(self.w))
+        self.assertEqual(w.some_attribute, 42)
+        self.assertNotIn('some_attribute', [c.__name__ for c in w])
+
+
+    def test_pickle_import_path_unresolved(self):
+
+        self.w.other.wire('%s:receiver' % (__name__,))
+        self.w.other()
+        w = pickle.loads(pickle.dumps(self.w))
+        [(function, _, _)] = w.other.wirings
+        self.assertEqual(function, ImportPath('%s:receiver' % (__name__,)))
+        self.assertFalse(function.resolved)
+
+
+    def test_hooks_and_calltime_settings_not_pickled(self):
+
+        WiresHook().attach(self.w)
+        self.w(returns=False)
+        w = pickle.loads(pickle.dumps(self.w))
+        self.assertEqual(w._hooks, ())
+        self.assertEqual(w._calltime_settings, {})
+
+
+
+class TestCopy(_Base, unittest.TestCase):
+
+    """
+    Copying tests.
+    """
+
+    def test_copy(self):
+
+        w = copy.copy(self.w)
+        self.assert_equivalent(w)
+        self.assert_independent(w)
+
+
+    def test_copy_shares_wiring_tuples(self):
+
+        w = copy.copy(self.w)
+        for original, copied in zip(self.w.this._wirings, w.this._wirings):
+            self.assertIs(copied, original)
+
+
+    def test_copy_callable_wired_to_callable(self):
+
+        self.w.outer.wire(self.w.this)
+        w = copy.copy(self.w)
+        self.assertIs(w.outer.wirings[0][0], w.this)
+
+
+    def test_copy_callable_is_self(self):
+
+        self.assertIs(copy.copy(self.w.this), self.w.this)
+
+
+    def test_copy_does_not_copy_hooks(self):
+
+        WiresHook().attach(self.w)
+        self.assertEqual(copy.copy(self.w)._hooks, ())
+
+
+    def test_copy_disabled(self):
+
+        self.w = Wires(returns=True, enabled=False)
+        self.w.this.wire(receiver)
+        w = copy.copy(self.w)
+        self.assertIsInstance(w, _disabled.DisabledWires)
+        self.assertEqual(w.this(), [])
+        self.assertIs(w.__dict__['this'], w._callables['this'])
+
+
+
+class TestDeepCopy(_Base, unittest.TestCase):
+
+    """
+    Deep copying tests.
+    """
+
+    def test_deepcopy(self):
+
+        w = copy.deepcopy(self.w)
+        self.assert_equivalent(w)
+        self.assert_independent(w)
+
+
+    def test_deepcopy_copies_wire_time_arguments(self):
+
+        w = copy.deepcopy(self.w)
+        _, args, kwargs = w.this._wirings[1]
+        _, original_args, original_kwargs = self.w.this._wirings[1]
+        self.assertIsNot(args[0], original_args[0])
+        self.assertIsNot(kwargs['a'], original_kwargs['a'])
+
+
+    def test_deepcopy_shares_argumentless_wirings(self):
+
+        w = copy.deepcopy(self.w)
+        self.assertIs(w.this._wirings[0], self.w.this._wirings[0])
+        self.assertIs(w.that._wirings[0], self.w.that._wirings[0])
+        self.assertIsNot(w.this._wirings[1], self.w.this._wirings[1])
+
+
+    def test_deepcopy_callable(self):
+
+        this = copy.deepcopy(self.w.this)
+        self.assertIsNot(this, self.w.this)
+        self.assertIs(this._wires.this, this)
+
+
+    def test_deepcopy_callable_wired_to_callable(self):
+
+        self.w.outer.wire(self.w.this, 'x')
+        self.w.outer.with_options(priority=1).wire(self.w.that, 'y')
+        self.w.outer.wire(receiver)
+        w = copy.deepcopy(self.w)
+        self.assertEqual(
+            [f for f, _, _ in w.outer.wirings],
+            [w.that, w.this, receiver],
+        )
+        self.assertEqual(w.outer(), self.w.outer())
+
+
+    def test_deepcopy_shares_functions_wired_with_options(self):
+
+        class Locked(object):
+            def __init__(self):
+                self.lock = threading.Lock()
+            def method(self, *args):
+                return args
+
+        locked = Locked()
+        self.w.locked.with_options(priority=1).wire(locked.method, [1])
+        w = copy.deepcopy(self.w)
+        [(function, args, _)] = w.locked.wirings
+        self.assertIs(function.__self__, locked)
+        self.assertIsNot(args[0], self.w.locked.wirings[0][1][0])
+        self.assertEqual(w.locked._wirings[0].priority, 1)
+        self.assertEqual(w.locked(), [(None, ([1],))])
+
+
+    def test_deepcopy_memo_shared(self):
+
+        w, this = copy.deepcopy((self.w, self.w.this))
+        self.assertIs(w.this, this)
+
+
+# ----------------------------------------------------------------------------
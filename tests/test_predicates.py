@@ -0,0 +1,200 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Predicate filtered wiring tests.
+"""
+
+
+import collections
+import copy
+import pickle
+import unittest
+
+from wires import Wires, Equals, snapshot, restore
+
+
+
+_Order = collections.namedtuple('_Order', 'currency amount')
+
+
+
+def _echo(*args, **kwargs):
+
+    return args
+
+
+
+def _is_large(order, **kwargs):
+
+    return order.amount > 100
+
+
+
+class _CountingPredicate(object):
+
+    # Unhashable predicate counting its calls.
+
+    __hash__ = None
+
+    def __init__(self, result):
+
+        self.result = result
+        self.calls = 0
+
+
+    def __call__(self, *args, **kwargs):
+
+        self.calls += 1
+        return self.result
+
+
+
+class TestEquals(unittest.TestCase):
+
+    """
+    Equals predicate tests.
+    """
+
+    def test_positional(self):
+
+        self.assertTrue(Equals(1)(1, 2))
+        self.assertFalse(Equals(1)(2, 1))
+        self.assertTrue(Equals(2, argument=1)(1, 2))
+
+
+    def test_named_and_attribute(self):
+
+        order = _Order('EUR', 10)
+        self.assertTrue(Equals('EUR', attribute='currency')(order))
+        self.assertTrue(Equals('EUR', argument='order', attribute='currency')(order=order))
+        self.assertFalse(Equals('USD', attribute='currency')(order))
+
+
+    def test_missing_is_false(self):
+
+        self.assertFalse(Equals(1)())
+        self.assertFalse(Equals(1, argument='x')(1))
+        self.assertFalse(Equals(1, attribute='nope')(1))
+
+
+    def test_equality_hash_repr_pickle(self):
+
+        self.assertEqual(Equals(1, 'x', 'y'), Equals(1, 'x', 'y'))
+        self.assertNotEqual(Equals(1, 'x', 'y'), Equals(1, 'x'))
+        self.assertEqual(hash(Equals(1)), hash(Equals(1)))
+        self.assertEqual(repr(Equals(1)), 'Equals(1, argument=0, attribute=None)')
+        self.assertEqual(pickle.loads(pickle.dumps(Equals(1, 'x', 'y'))), Equals(1, 'x', 'y'))
+
+
+
+class TestWhere(unittest.TestCase):
+
+    """
+    with_options(where=...) tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.w.orders.wire(_echo, 'all')
+        for currency in ('EUR', 'USD'):
+            self.w.orders.with_options(
+                where=Equals(currency, attribute='currency'),
+            ).wire(_echo, currency)
+        self.w.orders.with_options(where=_is_large).wire(_echo, 'large')
+
+
+    def called(self, results):
+
+        return [result[0] for _, result in results]
+
+
+    def test_where(self):
+
+        self.assertEqual(self.called(self.w.orders(_Order('EUR', 10))), ['all', 'EUR'])
+        self.assertEqual(self.called(self.w.orders(_Order('USD', 200))), ['all', 'USD', 'large'])
+        self.assertEqual(self.called(self.w.orders(_Order('JPY', 200))), ['all', 'large'])
+
+
+    def test_where_keeps_wiring_order(self):
+
+        self.w.orders.with_options(where=Equals('EUR', attribute='currency')).wire(_echo, 'EUR-2')
+        self.assertEqual(
+            self.called(self.w.orders(_Order('EUR', 200))),
+            ['all', 'EUR', 'large', 'EUR-2'],
+        )
+
+
+    def test_missing_argument_passes_no_equals(self):
+
+        self.w.orders.unwire(_echo, 'large')
+        self.assertEqual(self.called(self.w.orders()), ['all'])
+        self.assertEqual(self.called(self.w.orders(42)), ['all'])
+        self.assertEqual(self.called(self.w.orders([])), ['all'])
+
+
+    def test_shared_predicate_evaluated_once(self):
+
+        w = Wires(returns=True)
+        predicate = _CountingPredicate(True)
+        for index in range(5):
+            w.this.with_options(where=predicate).wire(_echo, index)
+        self.assertEqual(self.called(w.this()), [0, 1, 2, 3, 4])
+        self.assertEqual(predicate.calls, 1)
+        predicate.result = False
+        self.assertEqual(w.this(), [])
+        self.assertEqual(predicate.calls, 2)
+
+
+    def test_unhashable_equals_value(self):
+
+        w = Wires(returns=True)
+        w.this.with_options(where=Equals([1])).wire(_echo, 'list')
+        self.assertEqual(self.called(w.this([1])), ['list'])
+        self.assertEqual(w.this([2]), [])
+
+
+    def test_predicate_exception_propagates(self):
+
+        with self.assertRaises(AttributeError):
+            self.w.orders(42)
+
+
+    def test_where_not_callable(self):
+
+        with self.assertRaises(TypeError):
+            self.w.orders.with_options(where=42)
+
+
+    def test_where_and_key(self):
+
+        w = Wires(returns=True)
+        w.this.with_options(key='a', where=Equals(1)).wire(_echo, 'a1')
+        w.this.with_options(key='a').wire(_echo, 'a')
+        w.this.with_options(key='b', where=Equals(1)).wire(_echo, 'b1')
+        self.assertEqual(self.called(w.this.call_key('a', 1)), ['a1', 'a'])
+        self.assertEqual(self.called(w.this.call_key('a', 2)), ['a'])
+        self.assertEqual(self.called(w.this(1)), ['a1', 'a', 'b1'])
+
+
+    def test_plain_again_after_unwiring(self):
+
+        self.w.orders.unwire_many([_echo, _echo, _echo])
+        self.assertIsNot(type(self.w.orders._wirings), list)
+        self.w.orders.unwire(_echo, 'large')
+        self.assertIs(type(self.w.orders._wirings), list)
+
+
+    def test_where_survives_copy_pickle_and_snapshot(self):
+
+        for w in (copy.copy(self.w), copy.deepcopy(self.w),
+                  pickle.loads(pickle.dumps(self.w)), restore(snapshot(self.w))):
+            self.assertEqual(self.called(w.orders(_Order('EUR', 200))), ['all', 'EUR', 'large'])
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,178 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring priority tests.
+"""
+
+
+import pickle
+import random
+import threading
+import unittest
+
+from wires import Wires, snapshot, restore
+from wires import _callable
+
+
+
+def _echo(value):
+
+    return value
+
+
+
+class TestPriority(unittest.TestCase):
+
+    """
+    with_options(priority=...) tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+
+
+    def called(self, w=None):
+
+        return [result for _, result in (w or self.w).this()]
+
+
+    def wire(self, priority, value):
+
+        if priority is None:
+            self.w.this.wire(_echo, value)
+        else:
+            self.w.this.with_options(priority=priority).wire(_echo, value)
+
+
+    def test_higher_priority_first(self):
+
+        self.wire(None, 'notify')
+        self.wire(10, 'invalidate')
+        self.wire(-5, 'audit')
+        self.wire(0, 'notify-2')
+        self.assertEqual(self.called(), ['invalidate', 'notify', 'notify-2', 'audit'])
+        self.assertEqual(
+            [args[0] for _, args, _ in self.w.this.wirings],
+            ['invalidate', 'notify', 'notify-2', 'audit'],
+        )
+
+
+    def test_stable_within_priority(self):
+
+        expected = []
+        for priority in range(3):
+            for index in range(3):
+                expected.append((priority, index))
+        shuffled = list(expected)
+        random.Random(42).shuffle(shuffled)
+        for priority, index in sorted(shuffled, key=lambda p: p[1]):
+            self.wire(priority, (priority, index))
+        self.assertEqual(
+            self.called(),
+            sorted(expected, key=lambda p: -p[0]),
+        )
+
+
+    def test_plain_wire_after_negative_priority(self):
+
+        self.wire(-1, 'last')
+        self.wire(None, 'plain')
+        self.wire(None, 'plain-2')
+        self.wire(-1, 'last-2')
+        self.assertEqual(self.called(), ['plain', 'plain-2', 'last', 'last-2'])
+
+
+    def test_wire_many_replace_and_unwire_keep_order(self):
+
+        self.w.this.with_options(priority=1).wire_many([(_echo, ['a']), (_echo, ['b'])])
+        self.w.this.wire_many([(_echo, ['c'])])
+        self.w.this.replace_wirings(list(reversed(self.w.this.wirings)))
+        self.assertEqual(self.called(), ['b', 'a', 'c'])
+        self.w.this.unwire(_echo, 'b')
+        self.assertEqual(self.called(), ['a', 'c'])
+
+
+    def test_priority_with_key_and_where(self):
+
+        self.w.this.with_options(key='k').wire(_echo, 'keyed')
+        self.w.this.with_options(where=lambda: True, priority=2).wire(_echo, 'where')
+        self.w.this.with_options(key='k', priority=1).wire(_echo, 'keyed-1')
+        self.w.this.with_options(key='j', priority=3).wire(_echo, 'other')
+        self.assertEqual(
+            [r for _, r in self.w.this.call_key('k')],
+            ['where', 'keyed-1', 'keyed'],
+        )
+
+
+    def test_priority_survives_pickle_and_snapshot(self):
+
+        self.w.this.wire(_echo, 'plain')
+        self.w.this.with_options(priority=1).wire(_echo, 'first')
+        for w in (pickle.loads(pickle.dumps(self.w)), restore(snapshot(self.w))):
+            self.assertEqual(self.called(w), ['first', 'plain'])
+
+
+    def test_list_built_once_when_called(self):
+
+        self.wire(None, 'plain')
+        for index in range(3):
+            self.wire(-index, index)
+        self.assertIs(type(self.w.this._wirings), _callable._PendingWirings)
+        self.assertEqual(len(self.w.this), 4)
+        self.assertEqual(self.called(), ['plain', 0, 1, 2])
+        wirings = self.w.this._wirings
+        self.assertIs(type(wirings), _callable._OptionedWirings)
+        self.assertEqual(self.called(), ['plain', 0, 1, 2])
+        self.assertIs(self.w.this._wirings, wirings)
+
+
+    def test_wired_during_call_not_called(self):
+
+        def wire_more(value):
+            self.wire(1, 'added')
+            return value
+
+        self.w.this.with_options(priority=2).wire(wire_more, 'wiring')
+        self.assertEqual(self.called(), ['wiring'])
+        self.assertEqual(self.called(), ['wiring', 'added'])
+
+
+    def test_concurrent_calls_lose_no_wirings(self):
+
+        def wirer():
+            for index in range(1000):
+                self.wire(index % 3 - 1, index)
+
+        thread = threading.Thread(target=wirer)
+        thread.start()
+        while thread.is_alive():
+            self.w.this()
+        thread.join()
+        self.assertEqual(sorted(self.called()), list(range(1000)))
+
+
+    def test_pending_wirings_build(self):
+
+        wirings = _callable._OptionedWirings(
+            _callable._Wiring((_echo, (p,), {}), {'priority': p}) for p in (2, 0, -1)
+        )
+        pending = _callable._PendingWirings(wirings)
+        pending.extend([
+            _callable._Wiring((_echo, (p,), {}), {'priority': p}) for p in (-1, 3, 0)
+        ])
+        pending.extend([(_echo, ('plain',), {})])
+        built = pending.build()
+        self.assertIs(type(built), _callable._OptionedWirings)
+        self.assertEqual([args[0] for _, args, _ in built], [3, 2, 0, 0, 'plain', -1, -1])
+        self.assertEqual(len(pending), 7)
+        self.assertEqual(len(wirings), 3)
+        self.assertIs(type(_callable._PendingWirings([(_echo, (), {})]).build()), list)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,238 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Recorder and Replayer tests.
+"""
+
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from wires import Wires, Recorder, Replayer
+
+
+
+class TestRecorder(unittest.TestCase):
+
+    """
+    Recording and replaying tests.
+    """
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.w = Wires()
+        self.calls = []
+        self.w.this.wire(self.calls.append)
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+    def segments(self):
+
+        return sorted(os.listdir(self.directory))
+
+
+    def test_record_and_read(self):
+
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        before = time.time()
+        self.w.this(1)
+        self.w.that(2, key='value')
+        recorder.close()
+
+        records = list(Replayer(self.directory).records())
+        self.assertEqual([r[1:] for r in records], [
+            ('this', (1,), {}),
+            ('that', (2,), {'key': 'value'}),
+        ])
+        self.assertLessEqual(before, records[0][0])
+        self.assertLessEqual(records[0][0], records[1][0])
+        self.assertEqual(recorder.recorded, 2)
+        # Wirings are still called.
+        self.assertEqual(self.calls, [1])
+
+
+    def test_close_truncates(self):
+
+        recorder = Recorder(self.directory, segment_size=4096)
+        recorder.attach(self.w)
+        self.w.this(1)
+        recorder.close()
+        [segment] = self.segments()
+        self.assertLess(os.path.getsize(os.path.join(self.directory, segment)), 4096)
+
+
+    def test_read_while_recording(self):
+
+        recorder = Recorder(self.directory, segment_size=4096)
+        recorder.attach(self.w)
+        self.w.this(1)
+        recorder.flush()
+        self.assertEqual([r[1:] for r in Replayer(self.directory).records()], [
+            ('this', (1,), {}),
+        ])
+        recorder.close()
+
+
+    def test_segment_rotation(self):
+
+        recorder = Recorder(self.directory, segment_size=256)
+        recorder.attach(self.w)
+        for index in range(100):
+            self.w.this(index)
+        recorder.close()
+        self.assertGreater(len(self.segments()), 1)
+        self.assertEqual(
+            [r[2] for r in Replayer(self.directory).records()],
+            [(index,) for index in range(100)],
+        )
+
+
+    def test_large_record_own_segment(self):
+
+        recorder = Recorder(self.directory, segment_size=256)
+        recorder.attach(self.w)
+        self.w.this('x' * 1000)
+        self.w.this(1)
+        recorder.close()
+        self.assertEqual(
+            [r[2] for r in Replayer(self.directory).records()],
+            [('x' * 1000,), (1,)],
+        )
+
+
+    def test_continues_after_existing_segments(self):
+
+        for index in range(2):
+            recorder = Recorder(self.directory)
+            recorder.attach(self.w)
+            self.w.this(index)
+            recorder.detach(self.w)
+            recorder.close()
+        self.assertEqual(self.segments(), ['wires-000000.wlog', 'wires-000001.wlog'])
+        self.assertEqual(
+            [r[2] for r in Replayer(self.directory).records()],
+            [(0,), (1,)],
+        )
+
+
+    def test_unpicklable_arguments_counted(self):
+
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        self.w.this(threading.Lock())
+        self.w.this(1)
+        recorder.close()
+        self.assertEqual(recorder.errors, 1)
+        self.assertEqual(recorder.recorded, 1)
+        self.assertEqual(len(self.calls), 2)
+
+
+    def test_nested_calls_not_recorded(self):
+
+        self.w.outer.wire(self.w.this)
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        self.w.outer(1)
+        self.w.this(2)
+        recorder.detach(self.w)
+        recorder.close()
+        records = [r[1:] for r in Replayer(self.directory).records()]
+        self.assertEqual(records, [('outer', (1,), {}), ('this', (2,), {})])
+
+        del self.calls[:]
+        Replayer(self.directory).replay(self.w, speed=None)
+        self.assertEqual(self.calls, [1, 2])
+
+
+    def test_call_key_recorded_without_key(self):
+
+        self.w.this.with_options(key='other').wire(self.calls.append)
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        self.w.this.call_key('key', 1)
+        recorder.detach(self.w)
+        recorder.close()
+        records = [r[1:] for r in Replayer(self.directory).records()]
+        self.assertEqual(records, [('this', (1,), {})])
+
+        del self.calls[:]
+        Replayer(self.directory).replay(self.w, speed=None)
+        self.assertEqual(self.calls, [1, 1])
+
+
+    def test_concurrent_recording(self):
+
+        recorder = Recorder(self.directory, segment_size=1024)
+        recorder.attach(self.w)
+
+        def caller(base):
+            for index in range(200):
+                self.w.this((base, index))
+
+        threads = [threading.Thread(target=caller, args=(b,)) for b in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorder.close()
+        records = [r[2][0] for r in Replayer(self.directory).records()]
+        self.assertEqual(sorted(records), sorted((b, i) for b in range(4) for i in range(200)))
+
+
+    def test_replay_max_speed(self):
+
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        self.w.this(1)
+        self.w.this(2)
+        recorder.detach(self.w)
+        recorder.close()
+
+        target = Wires()
+        replayed = []
+        target.this.wire(replayed.append)
+        self.assertEqual(Replayer(self.directory).replay(target, speed=None), 2)
+        self.assertEqual(replayed, [1, 2])
+
+
+    def test_replay_recorded_pace(self):
+
+        recorder = Recorder(self.directory)
+        recorder.attach(self.w)
+        self.w.this(1)
+        time.sleep(0.1)
+        self.w.this(2)
+        recorder.close()
+
+        target = Wires()
+        target.this.wire(lambda value: None)
+        replayer = Replayer(self.directory)
+        start = time.monotonic()
+        replayer.replay(target, speed=1.0)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        start = time.monotonic()
+        replayer.replay(target, speed=10.0)
+        self.assertLess(time.monotonic() - start, 0.09)
+
+
+    def test_replay_empty_directory(self):
+
+        self.assertEqual(Replayer(self.directory).replay(Wires()), 0)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Keyed routing tests.
+"""
+
+
+import copy
+import pickle
+import unittest
+
+from wires import Wires, WiresHook, snapshot, restore
+from wires import _forward
+
+
+
+def _echo(*args, **kwargs):
+
+    return (args, kwargs)
+
+
+
+class TestKeyedRouting(unittest.TestCase):
+
+    """
+    with_options(key=...) and call_key tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.w.prices.wire(_echo, 'all-1')
+        self.w.prices.with_options(key='EUR').wire(_echo, 'eur')
+        self.w.prices.with_options(key='USD').wire_many([(_echo, ['usd'])])
+        self.w.prices.wire(_echo, 'all-2')
+
+
+    def called(self, results):
+
+        return [result[0][0] for _, result in results]
+
+
+    def test_call_key_routes(self):
+
+        self.assertEqual(self.called(self.w.prices.call_key('EUR', 1)), ['all-1', 'eur', 'all-2'])
+        self.assertEqual(self.called(self.w.prices.call_key('USD', 1)), ['all-1', 'usd', 'all-2'])
+
+
+    def test_call_key_unknown_key_calls_keyless(self):
+
+        self.assertEqual(self.called(self.w.prices.call_key('JPY')), ['all-1', 'all-2'])
+
+
+    def test_call_key_arguments(self):
+
+        self.assertEqual(
+            self.w.prices.call_key('EUR', 1, a=2)[1],
+            (None, (('eur', 1), {'a': 2})),
+        )
+
+
+    def test_plain_call_calls_all(self):
+
+        self.assertEqual(self.called(self.w.prices()), ['all-1', 'eur', 'usd', 'all-2'])
+
+
+    def test_wirings_keep_keys(self):
+
+        wirings = self.w.prices.wirings
+        self.assertEqual(wirings[1], (_echo, ('eur',), {}))
+        self.assertEqual([wirings[1].key, wirings[2].key], ['EUR', 'USD'])
+
+
+    def test_routes_follow_wiring_changes(self):
+
+        self.w.prices.call_key('EUR')
+        self.w.prices.with_options(key='EUR').wire(_echo, 'eur-2')
+        self.assertEqual(self.called(self.w.prices.call_key('EUR')), ['all-1', 'eur', 'all-2', 'eur-2'])
+        self.w.prices.unwire(_echo, 'eur')
+        self.assertEqual(self.called(self.w.prices.call_key('EUR')), ['all-1', 'all-2', 'eur-2'])
+        self.w.prices.replace_wirings([])
+        self.assertEqual(self.w.prices.call_key('EUR'), [])
+
+
+    def test_keyed_wiring_kept_by_bulk_and_transaction(self):
+
+        with self.w.prices.transaction() as staged:
+            staged.unwire(_echo, 'all-1')
+        self.w.prices.replace_wirings(self.w.prices.wirings)
+        self.assertEqual(self.called(self.w.prices.call_key('USD')), ['usd', 'all-2'])
+
+
+    def test_call_key_settings_and_min_wirings(self):
+
+        self.assertIsNone(self.w(returns=False).prices.call_key('EUR'))
+        self.w.other.min_wirings = 1
+        with self.assertRaises(ValueError):
+            self.w.other.call_key('EUR')
+
+
+    def test_call_key_unhashable_raises(self):
+
+        with self.assertRaises(TypeError):
+            self.w.prices.call_key([])
+
+
+    def test_unhashable_key_option_raises(self):
+
+        with self.assertRaises(TypeError):
+            self.w.prices.with_options(key=[])
+
+
+    def test_keys_survive_copy_pickle_and_snapshot(self):
+
+        for w in (copy.copy(self.w), copy.deepcopy(self.w),
+                  pickle.loads(pickle.dumps(self.w)), restore(snapshot(self.w))):
+            self.assertEqual(self.called(w.prices.call_key('EUR')), ['all-1', 'eur', 'all-2'])
+
+
+    def test_disabled(self):
+
+        w = Wires(enabled=False, returns=True)
+        w.prices.with_options(key='EUR').wire(_echo)
+        self.assertEqual(w.prices.call_key('EUR'), [])
+
+
+    def test_key_not_passed_to_hooks_nor_forwarded(self):
+
+        entered = []
+        hook = WiresHook()
+        hook.enter = lambda wires_callable, args, kwargs: entered.append(args)
+        hook.attach(self.w)
+        sent = []
+        _forward.forward(self.w.prices, lambda *call: sent.append(call))
+        self.w.prices.call_key('EUR', 1)
+        self.assertEqual(entered, [(1,)])
+        self.assertEqual(sent, [('prices', (1,), {})])
+
+
+    def test_with_options_repr(self):
+
+        self.assertEqual(
+            repr(self.w.prices.with_options(key='EUR')),
+            "<WiringOptions 'prices' {'key': 'EUR'}>",
+        )
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,271 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Shared memory channel tests.
+"""
+
+
+import json
+import multiprocessing
+import sys
+import threading
+import unittest
+
+from unittest import mock
+
+from wires import Wires, SharedMemoryChannel
+from wires import _shm
+
+
+
+class _JSONSerializer(object):
+
+    """
+    Picklable, non-default, serializer.
+    """
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data):
+        name, args, kwargs = json.loads(data.decode('utf-8'))
+        return name, tuple(args), kwargs
+
+
+
+def _consumer(channel, results, count):
+
+    # Child process: receives `count` calls, putting each into `results`.
+
+    w = Wires()
+    w.this.wire(lambda *args, **kwargs: results.put((args, kwargs)))
+    received = 0
+    while received < count:
+        received += channel.receive(w, timeout=5)
+    channel.close()
+
+
+
+_requires_shared_memory = unittest.skipUnless(
+    _shm.shared_memory is not None, 'requires multiprocessing.shared_memory',
+)
+
+
+
+@_requires_shared_memory
+class TestSharedMemoryChannel(unittest.TestCase):
+
+    """
+    In process tests.
+    """
+
+    def setUp(self):
+
+        self.channel = SharedMemoryChannel(capacity=256)
+        self.calls = []
+        self.w = Wires()
+        self.w.this.wire(self.record)
+
+
+    def tearDown(self):
+
+        self.channel.close()
+
+
+    def record(self, *args, **kwargs):
+
+        self.calls.append((args, kwargs))
+
+
+    def test_small_capacity_raises(self):
+
+        with self.assertRaises(ValueError):
+            SharedMemoryChannel(capacity=32)
+
+
+    def test_put_get(self):
+
+        self.channel.put(b'one')
+        self.channel.put(b'')
+        self.channel.put(b'three')
+        self.assertEqual(self.channel.get(0), b'one')
+        self.assertEqual(self.channel.get(0), b'')
+        self.assertEqual(self.channel.get(0), b'three')
+        self.assertIsNone(self.channel.get(0))
+
+
+    def test_get_timeout(self):
+
+        self.assertIsNone(self.channel.get(0.01))
+
+
+    def test_wrap_around(self):
+
+        for index in range(100):
+            data = bytes(bytearray([index]) * (index % 50))
+            self.channel.put(data)
+            self.assertEqual(self.channel.get(0), data)
+
+
+    def test_too_large(self):
+
+        with self.assertRaises(ValueError):
+            self.channel.put(b'x' * 253)
+
+
+    def test_full_timeout(self):
+
+        self.channel.put(b'x' * 200)
+        with self.assertRaises(TimeoutError):
+            self.channel.put(b'x' * 100, timeout=0.01)
+
+
+    def test_concurrent_senders(self):
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        def send(sender):
+            for index in range(2000):
+                self.channel.put(b'%d:%04d' % (sender, index), timeout=5)
+
+        senders = [threading.Thread(target=send, args=(s,)) for s in range(4)]
+        for sender in senders:
+            sender.start()
+        received = []
+        while len(received) < 8000:
+            data = self.channel.get(5)
+            self.assertIsNotNone(data)
+            received.append(data)
+        for sender in senders:
+            sender.join()
+
+        for sender in range(4):
+            self.assertEqual(
+                [data for data in received if data.startswith(b'%d:' % (sender,))],
+                [b'%d:%04d' % (sender, index) for index in range(2000)],
+            )
+
+
+    def test_forward_and_receive(self):
+
+        source = Wires()
+        forwarder = self.channel.forward(source.this)
+        source.this(1, a=2)
+        source.this(3)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.channel.receive(self.w, timeout=0), 2)
+        self.assertEqual(self.calls, [((1,), {'a': 2}), ((3,), {})])
+        source.this.unwire(forwarder)
+        self.assertEqual(len(source.this), 0)
+
+
+    def test_forward_other_name(self):
+
+        source = Wires()
+        self.channel.forward(source.that, name='this')
+        source.that(1)
+        self.channel.receive(self.w, timeout=0)
+        self.assertEqual(self.calls, [((1,), {})])
+
+
+    def test_forward_full_is_wiring_exception(self):
+
+        source = Wires(returns=True)
+        self.channel.forward(source.this, timeout=0)
+        self.channel.put(b'x' * 200)
+        [(exception, _)] = source.this('y' * 100)
+        self.assertIsInstance(exception, TimeoutError)
+
+
+    def test_receive_max_messages(self):
+
+        for index in range(3):
+            self.channel.send('this', (index,), {})
+        self.assertEqual(self.channel.receive(self.w, max_messages=2), 2)
+        self.assertEqual(self.channel.receive(self.w, timeout=0), 1)
+        self.assertEqual(self.channel.receive(self.w, timeout=0), 0)
+
+
+    def test_serializer(self):
+
+        channel = SharedMemoryChannel(capacity=256, serializer=_JSONSerializer())
+        try:
+            channel.send('this', (1, 'two'), {'three': 3})
+            self.assertEqual(channel.get(0), b'["this", [1, "two"], {"three": 3}]')
+            channel.send('this', (1, 'two'), {'three': 3})
+            channel.receive(self.w, timeout=0)
+            self.assertEqual(self.calls, [((1, 'two'), {'three': 3})])
+        finally:
+            channel.close()
+
+
+    def test_reduce_attaches(self):
+
+        # Events can only be pickled when spawning processes: reconstruct
+        # without pickling.
+        factory, args = self.channel.__reduce__()
+        attached = factory(*args)
+        try:
+            self.assertEqual(attached.name, self.channel.name)
+            self.channel.send('this', (1,), {})
+            attached.receive(self.w, timeout=0)
+            self.assertEqual(self.calls, [((1,), {})])
+        finally:
+            attached.close()
+
+
+
+@_requires_shared_memory
+class TestSharedMemoryChannelProcesses(unittest.TestCase):
+
+    """
+    Cross process tests.
+    """
+
+    def test_deliver_to_child_process(self):
+
+        context = multiprocessing.get_context('spawn')
+        channel = SharedMemoryChannel(capacity=1024, event=context.Event())
+        results = context.Queue()
+        count = 200
+        process = context.Process(target=_consumer, args=(channel, results, count))
+        process.start()
+        try:
+            w = Wires(ignore_exceptions=False)
+            channel.forward(w.this)
+            for index in range(count):
+                w.this(index, value=index * 2)
+            received = [results.get(timeout=10) for _ in range(count)]
+            process.join(10)
+            self.assertEqual(process.exitcode, 0)
+            self.assertEqual(received, [
+                ((index,), {'value': index * 2}) for index in range(count)
+            ])
+        finally:
+            if process.is_alive():
+                process.terminate()
+            channel.close()
+
+
+
+class TestSharedMemoryUnavailable(unittest.TestCase):
+
+    """
+    Python < 3.8 behaviour.
+    """
+
+    def test_create_raises(self):
+
+        with mock.patch.object(_shm, 'shared_memory', None):
+            with self.assertRaises(RuntimeError):
+                SharedMemoryChannel()
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,173 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Configuration snapshot tests.
+"""
+
+
+import unittest
+
+from wires import Wires, snapshot, restore
+from wires import _disabled, _snapshot
+from wires._importpath import ImportPath
+
+
+
+def receiver(*args, **kwargs):
+
+    return (args, kwargs)
+
+
+
+class Receivers(object):
+
+    @staticmethod
+    def nested(*args, **kwargs):
+
+        return 'nested'
+
+
+
+class TestSnapshot(unittest.TestCase):
+
+    """
+    snapshot/restore tests.
+    """
+
+    def test_settings_restored(self):
+
+        w = Wires(min_wirings=1, max_wirings=5, returns=True,
+                  ignore_exceptions=False, exception_detail='compact')
+        restored = restore(snapshot(w))
+        self.assertIs(type(restored), Wires)
+        self.assertEqual(restored._settings, w._settings)
+
+
+    def test_callable_settings_restored(self):
+
+        w = Wires(max_wirings=3)
+        w.this.wire(receiver)
+        w.this.min_wirings = 1
+        w.this.max_wirings = 2
+        w.this.returns = True
+        _ = w.that
+        restored = restore(snapshot(w))
+        self.assertEqual(sorted(c.__name__ for c in restored), ['that', 'this'])
+        self.assertEqual(restored.this.min_wirings, 1)
+        self.assertEqual(restored.this.max_wirings, 2)
+        self.assertTrue(restored.this.returns)
+        self.assertEqual(restored.that.max_wirings, 3)
+        self.assertEqual(restored.that._callable_settings, {})
+
+
+    def test_wirings_restored_as_import_paths(self):
+
+        w = Wires(returns=True)
+        w.this.wire(receiver, 1, a=2)
+        w.this.wire(Receivers.nested)
+        w.this.wire(len)
+        w.this.wire('%s:receiver' % (__name__,), 3)
+        restored = restore(snapshot(w))
+        self.assertEqual(restored.this.wirings, [
+            (ImportPath('%s:receiver' % (__name__,)), (1,), {'a': 2}),
+            (ImportPath('%s:Receivers.nested' % (__name__,)), (), {}),
+            (ImportPath('builtins:len'), (), {}),
+            (ImportPath('%s:receiver' % (__name__,)), (3,), {}),
+        ])
+        self.assertFalse(any(f.resolved for f, _, _ in restored.this.wirings))
+        self.assertEqual(restored.this('x'), [
+            (None, ((1, 'x'), {'a': 2})),
+            (None, 'nested'),
+            (None, 1),
+            (None, ((3, 'x'), {})),
+        ])
+
+
+    def test_import_paths_shared(self):
+
+        w = Wires()
+        w.this.wire(receiver, 1)
+        w.that.wire(receiver, 2)
+        restored = restore(snapshot(w))
+        self.assertIs(restored.this.wirings[0][0], restored.that.wirings[0][0])
+
+
+    def test_wiring_options_and_order_restored(self):
+
+        w = Wires(returns=True)
+        w.this.wire(receiver, 'plain')
+        w.this.with_options(priority=1, key='k').wire(receiver, 'first')
+        w.this.with_options(priority=-1).wire(Receivers.nested)
+        restored = restore(snapshot(w))
+        wirings = restored.this.wirings
+        self.assertEqual([wiring[1] for wiring in wirings], [('first',), ('plain',), ()])
+        self.assertEqual((wirings[0].priority, wirings[0].key), (1, 'k'))
+        self.assertIs(wirings[0][0], wirings[1][0])
+        self.assertEqual(restored.this.call_key('k'), [
+            (None, (('first',), {})),
+            (None, (('plain',), {})),
+            (None, 'nested'),
+        ])
+        restored.this.wire(receiver, 'last')
+        self.assertEqual(restored.this()[2], (None, (('last',), {})))
+
+
+    def test_restore_resolved(self):
+
+        w = Wires()
+        w.this.wire(receiver, 1)
+        restored = restore(snapshot(w), resolve=True)
+        self.assertEqual(restored.this.wirings, [(receiver, (1,), {})])
+
+
+    def test_restored_wirings_independent(self):
+
+        w = Wires()
+        w.this.wire(receiver)
+        restored = restore(snapshot(w))
+        restored.this.wire(receiver)
+        self.assertEqual(len(w.this), 1)
+        self.assertEqual(len(restored.this), 2)
+
+
+    def test_disabled_restored(self):
+
+        w = Wires(returns=True, enabled=False)
+        w.this.wire(receiver)
+        w.that.returns = False
+        restored = restore(snapshot(w))
+        self.assertIsInstance(restored, _disabled.DisabledWires)
+        self.assertEqual(restored.this(), [])
+        self.assertIsNone(restored.that())
+
+
+    def test_not_importable_functions(self):
+
+        def local_function():
+            pass
+
+        for function in (local_function, lambda: None, Receivers().nested.__call__):
+            w = Wires()
+            w.this.wire(function)
+            with self.assertRaises(ValueError):
+                snapshot(w)
+
+
+    def test_unsupported_format(self):
+
+        data = snapshot(Wires())
+        original_format = _snapshot.FORMAT
+        _snapshot.FORMAT = original_format + 1
+        try:
+            with self.assertRaises(ValueError):
+                restore(data)
+        finally:
+            _snapshot.FORMAT = original_format
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,292 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Wiring and call timeout tests.
+"""
+
+
+import functools
+import pickle
+import threading
+import time
+import unittest
+from unittest import mock
+
+from wires import Wires, WiringTimeout, WiringFailure, CircuitBreaker, MemoCache
+from wires import WiresTracer
+from wires import _timeout
+
+
+
+def _echo(value):
+
+    return value
+
+
+
+def _fail(value):
+
+    raise ValueError(value)
+
+
+
+class _Hung(object):
+
+    # Blocks until released, then returns.
+
+    def __init__(self):
+
+        self.release = threading.Event()
+        self.returned = threading.Event()
+        self.calls = 0
+
+
+    def __call__(self, value):
+
+        self.calls += 1
+        self.release.wait(5)
+        self.returned.set()
+        return 'late'
+
+
+
+class TestWiringTimeout(unittest.TestCase):
+
+    """
+    with_options(timeout=...) tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.hung = _Hung()
+        self.addCleanup(self.hung.release.set)
+
+
+    def test_in_time(self):
+
+        self.w.this.with_options(timeout=5).wire(_echo)
+        self.w.this.with_options(timeout=5).wire(_fail)
+        [result, (exception, _)] = self.w.this('value')
+        self.assertEqual(result, (None, 'value'))
+        self.assertIsInstance(exception, ValueError)
+
+
+    def test_timed_out(self):
+
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        self.w.this.wire(_echo)
+        [(exception, _), result] = self.w.this('value')
+        self.assertIsInstance(exception, WiringTimeout)
+        self.assertIs(exception.args[0], self.hung)
+        self.assertEqual(result, (None, 'value'))
+
+
+    def test_late_result_discarded(self):
+
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        [(exception, _)] = self.w.this('value')
+        self.hung.release.set()
+        self.assertTrue(self.hung.returned.wait(5))
+        self.assertIsInstance(exception, WiringTimeout)
+
+
+    def test_stops_when_not_ignoring_exceptions(self):
+
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        self.w.this.wire(_echo)
+        with self.assertRaises(RuntimeError) as context:
+            self.w(ignore_exceptions=False).this('value')
+        [(exception, _)] = context.exception.args
+        self.assertIsInstance(exception, WiringTimeout)
+
+
+    def test_exception_detail(self):
+
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        [(failure, _)] = self.w(exception_detail='compact').this('value')
+        self.assertIsInstance(failure, WiringFailure)
+        self.assertIs(failure.type, WiringTimeout)
+
+
+    def test_timeouts_trip_breakers(self):
+
+        breaker = CircuitBreaker(failures=1)
+        self.w.this.with_options(timeout=0.05, breaker=breaker).wire(self.hung)
+        self.w.this('value')
+        self.assertEqual(breaker.state(self.hung), 'open')
+
+
+    def test_timeouts_not_memoized(self):
+
+        cache = MemoCache()
+        self.w.this.with_options(timeout=0.05, memoize=cache).wire(self.hung)
+        self.w.this('value')
+        self.assertEqual((len(cache), cache.misses), (0, 1))
+
+
+    def test_hooks_called_on_calling_thread(self):
+
+        tracer = WiresTracer()
+        tracer.attach(self.w)
+        self.w.this.with_options(timeout=5).wire(_echo)
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        [result, (exception, _)] = self.w.this('value')
+        self.assertEqual(result, (None, 'value'))
+        self.assertIsInstance(exception, WiringTimeout)
+        [root] = tracer.spans
+        [echo_span, hung_span] = root.children
+        self.assertEqual((echo_span.function, echo_span.exception), (_echo, None))
+        self.assertIs(hung_span.function, self.hung)
+        self.assertIs(hung_span.exception, exception)
+
+
+    def test_overdue_wiring_not_called_again(self):
+
+        self.w.this.with_options(timeout=0.005).wire(self.hung)
+        workers = _timeout._workers._count
+        for _ in range(300):
+            [(exception, _)] = self.w.this('value')
+            self.assertIsInstance(exception, WiringTimeout)
+        self.assertEqual(self.hung.calls, 1)
+        self.assertLessEqual(_timeout._workers._count, workers + 1)
+
+        self.hung.release.set()
+        deadline = time.time() + 5
+        while id(self.hung) in _timeout._overdue and time.time() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(self.w.this('value'), [(None, 'late')])
+        self.assertEqual(self.hung.calls, 2)
+
+
+    def test_waiting_for_worker_times_out_without_call(self):
+
+        calls = []
+        self.w.this.with_options(timeout=0.05).wire(self.hung)
+        self.w.this.with_options(timeout=0.05).wire(calls.append)
+        with mock.patch.object(_timeout, '_workers', _timeout._Workers(0.05, 1)) as workers:
+            [(hung_exception, _), (exception, _)] = self.w.this('value')
+            self.assertIsInstance(hung_exception, WiringTimeout)
+            self.assertIsInstance(exception, WiringTimeout)
+            self.assertEqual(workers._count, 1)
+            self.hung.release.set()
+            keys = [id(function) for function, _, _ in self.w.this.wirings]
+            deadline = time.time() + 5
+            while any(k in _timeout._overdue for k in keys) and time.time() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(calls, [])
+            self.w.this('value')
+            self.assertEqual(calls, ['value'])
+
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            self.w.this.with_options(timeout=0)
+
+
+    def test_survives_pickle(self):
+
+        self.w.this.with_options(timeout=0.05).wire(_echo)
+        w = pickle.loads(pickle.dumps(self.w))
+        self.assertEqual(w.this.wirings[0].timeout, 0.05)
+
+
+
+class TestWorkers(unittest.TestCase):
+
+    """
+    Worker thread pool tests.
+    """
+
+    def test_max_workers(self):
+
+        workers = _timeout._Workers(0.05, 2)
+        release = threading.Event()
+        done = []
+
+        def task(index):
+            release.wait(5)
+            done.append(index)
+
+        for index in range(5):
+            workers.submit(functools.partial(task, index))
+        self.assertEqual(workers._count, 2)
+        release.set()
+        deadline = time.time() + 5
+        while workers._count and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sorted(done), list(range(5)))
+        self.assertEqual((workers._count, workers._idle), (0, 0))
+
+
+
+class TestCallTimeout(unittest.TestCase):
+
+    """
+    timeout setting tests.
+    """
+
+    def setUp(self):
+
+        self.hung = _Hung()
+        self.addCleanup(self.hung.release.set)
+
+
+    def test_call_time(self):
+
+        w = Wires(returns=True)
+        w.this.wire(_echo)
+        w.this.wire(self.hung)
+        w.this.wire(_echo)
+        start = time.time()
+        [first, (exception, _), (not_called, _)] = w(timeout=0.1).this('value')
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(first, (None, 'value'))
+        self.assertIsInstance(exception, WiringTimeout)
+        self.assertIsInstance(not_called, WiringTimeout)
+        self.assertIsNone(w.this.timeout)
+
+
+    def test_wiring_timeout_shorter_than_call_timeout(self):
+
+        w = Wires(returns=True, timeout=5)
+        w.this.with_options(timeout=0.05).wire(self.hung)
+        w.this.wire(_echo)
+        start = time.time()
+        [(exception, _), result] = w.this('value')
+        self.assertLess(time.time() - start, 2)
+        self.assertIsInstance(exception, WiringTimeout)
+        self.assertEqual(result, (None, 'value'))
+
+
+    def test_settings(self):
+
+        w = Wires(timeout=1)
+        self.assertEqual(w.this.timeout, 1)
+        w.this.timeout = 2
+        self.assertEqual(w.this.timeout, 2)
+        w.this.set(timeout=None)
+        self.assertIsNone(w.this.timeout)
+        del w.this.timeout
+        self.assertEqual(w.this.timeout, 1)
+        self.assertIn('timeout=1', repr(w))
+
+
+    def test_invalid(self):
+
+        w = Wires()
+        with self.assertRaises(ValueError):
+            Wires(timeout=0)
+        with self.assertRaises(ValueError):
+            w(timeout=-1)
+        with self.assertRaises(ValueError):
+            w.this.timeout = 0
+
+
+# ----------------------------------------------------------------------------
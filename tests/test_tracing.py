@@ -0,0 +1,137 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Sampling tracer tests.
+"""
+
+
+import unittest
+
+from wires import Wires, WiresTracer
+
+from . import mixin_test_callables
+
+
+
+class TestWiresTracer(mixin_test_callables.TestCallablesMixin,
+                      unittest.TestCase):
+
+    """
+    WiresTracer tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires()
+
+
+    def test_traces_all_calls_by_default(self):
+        """
+        Without sampling settings, every call is traced.
+        """
+        tracer = WiresTracer()
+        tracer.attach(self.w)
+        self.w.this.wire(self.returns_42)
+
+        for _ in range(5):
+            self.w.this()
+
+        self.assertEqual(len(tracer.spans), 5)
+
+
+    def test_sample_every_is_per_callable(self):
+        """
+        One in every `sample_every` calls is traced, per callable.
+        """
+        tracer = WiresTracer(sample_every=10)
+        tracer.attach(self.w)
+
+        for _ in range(30):
+            self.w.this()
+        for _ in range(10):
+            self.w.that()
+
+        names = [span.name for span in tracer.spans]
+        self.assertEqual(names.count('this'), 3)
+        self.assertEqual(names.count('that'), 1)
+
+
+    def test_max_rate_bounds_traced_calls(self):
+        """
+        No more than about `max_rate` calls per second are traced.
+        """
+        tracer = WiresTracer(max_rate=5)
+        tracer.attach(self.w)
+
+        for _ in range(1000):
+            self.w.this()
+
+        self.assertLessEqual(len(tracer.spans), 6)
+        self.assertGreaterEqual(len(tracer.spans), 1)
+
+
+    def test_span_tree_covers_nested_callables(self):
+        """
+        Nested WiresCallable calls become children of the wiring span.
+        """
+        tracer = WiresTracer(sample_every=2)
+        tracer.attach(self.w)
+        self.w.inner.wire(self.returns_42)
+        self.w.outer.wire(self.w.inner)
+        self.w.outer.wire(self.raises_exception)
+
+        self.w.outer()
+        self.w.outer()
+
+        # Only the 2nd outer call is sampled; its nested inner call is traced
+        # even though, on its own, inner would not yet have been sampled.
+        self.assertEqual(len(tracer.spans), 1)
+        root = tracer.spans[0]
+        self.assertEqual((root.name, root.function), ('outer', None))
+        self.assertIsNotNone(root.duration)
+
+        inner_wiring, failing_wiring = root.children
+        self.assertIs(inner_wiring.function, self.w.inner)
+        self.assertIsNone(inner_wiring.exception)
+        self.assertIs(failing_wiring.function, self.raises_exception)
+        self.assertIs(failing_wiring.exception, self.EXCEPTION)
+
+        inner_call, = inner_wiring.children
+        self.assertEqual(inner_call.name, 'inner')
+        self.assertIs(inner_call.children[0].function, self.returns_42)
+
+        depths = [depth for depth, _ in root.walk()]
+        self.assertEqual(depths, [0, 1, 2, 3, 1])
+
+
+    def test_unsampled_calls_skip_wiring_hooks(self):
+        """
+        Unsampled calls record nothing.
+        """
+        spans = []
+        tracer = WiresTracer(sample_every=1000, on_span=spans.append)
+        tracer.attach(self.w)
+        self.w.this.wire(self.returns_42)
+
+        self.w.this()
+
+        self.assertEqual(tracer.spans, [])
+        self.assertEqual(spans, [])
+
+
+    def test_invalid_sampling_raises_value_error(self):
+        """
+        Non-positive sampling settings raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            WiresTracer(sample_every=0)
+        with self.assertRaises(ValueError):
+            WiresTracer(max_rate=-1)
+
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,184 @@
+# ----------------------------------------------------------------------------
+# Python Wires Tests
+# ----------------------------------------------------------------------------
+# Copyright (c) Tiago Montes.
+# See LICENSE for details.
+# ----------------------------------------------------------------------------
+
+"""
+Atomic wiring replacement tests.
+"""
+
+
+import threading
+import unittest
+
+from wires import Wires
+from wires._importpath import ImportPath
+
+
+
+def _one():
+
+    return 1
+
+
+
+def _two():
+
+    return 2
+
+
+
+class TestReplaceWirings(unittest.TestCase):
+
+    """
+    replace_wirings tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.w.this.wire(_one)
+
+
+    def test_replace_wirings(self):
+
+        self.w.this.replace_wirings([_two, (_one,), 'os.path:join'])
+        self.assertEqual(self.w.this.wirings, [
+            (_two, (), {}),
+            (_one, (), {}),
+            (ImportPath('os.path:join'), (), {}),
+        ])
+
+
+    def test_replace_validates_final_state_only(self):
+
+        self.w.this.min_wirings = 1
+        self.w.this.max_wirings = 1
+        with self.assertRaises(RuntimeError):
+            self.w.this.unwire(_one)
+        self.w.this.replace_wirings([_two])
+        self.assertEqual(self.w.this(), [(None, 2)])
+
+
+    def test_replace_limits(self):
+
+        self.w.this.min_wirings = 1
+        with self.assertRaises(RuntimeError):
+            self.w.this.replace_wirings([])
+        self.w.this.max_wirings = 2
+        with self.assertRaises(RuntimeError):
+            self.w.this.replace_wirings([_one, _one, _one])
+        with self.assertRaises(TypeError):
+            self.w.this.replace_wirings([_one, 42])
+        self.assertEqual(self.w.this.wirings, [(_one, (), {})])
+
+
+    def test_replace_during_call_uses_previous_wirings(self):
+
+        def replacer():
+            self.w.this.replace_wirings([_two])
+            return 0
+
+        self.w.this.replace_wirings([replacer, _one])
+        self.assertEqual(self.w.this(), [(None, 0), (None, 1)])
+        self.assertEqual(self.w.this(), [(None, 2)])
+
+
+    def test_unwire_during_call_skips_nothing(self):
+
+        def unwirer():
+            self.w.this.unwire(unwirer)
+            return 0
+
+        self.w.this.replace_wirings([unwirer, _one, _two])
+        self.assertEqual(self.w.this(), [(None, 0), (None, 1), (None, 2)])
+        self.assertEqual(self.w.this(), [(None, 1), (None, 2)])
+
+
+    def test_concurrent_calls_see_whole_wiring_sets(self):
+
+        first = [(lambda: 'a')] * 10
+        second = [(lambda: 'b')] * 10
+        stop = threading.Event()
+        mixed = []
+
+        def caller():
+            while not stop.is_set():
+                results = set(r for _, r in self.w.this())
+                if len(results) != 1:
+                    mixed.append(results)
+
+        self.w.this.replace_wirings(first)
+        threads = [threading.Thread(target=caller) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for _ in range(2000):
+            self.w.this.replace_wirings(second)
+            self.w.this.replace_wirings(first)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(mixed, [])
+
+
+
+class TestTransaction(unittest.TestCase):
+
+    """
+    transaction tests.
+    """
+
+    def setUp(self):
+
+        self.w = Wires(returns=True)
+        self.w.this.wire(_one)
+
+
+    def test_transaction_publishes_on_exit(self):
+
+        with self.w.this.transaction() as staged:
+            staged.unwire(_one)
+            staged.wire(_two)
+            staged.wire_many([_one])
+            self.assertEqual(self.w.this(), [(None, 1)])
+        self.assertEqual(self.w.this(), [(None, 2), (None, 1)])
+
+
+    def test_transaction_checks_limits_on_exit(self):
+
+        self.w.this.min_wirings = 1
+        self.w.this.max_wirings = 1
+        with self.w.this.transaction() as staged:
+            staged.unwire(_one)
+            staged.wire(_two)
+            staged.wire(_two)
+            staged.unwire(_two)
+        self.assertEqual(self.w.this.wirings, [(_two, (), {})])
+
+        with self.assertRaises(RuntimeError):
+            with self.w.this.transaction() as staged:
+                staged.unwire(_two)
+        self.assertEqual(self.w.this.wirings, [(_two, (), {})])
+
+
+    def test_transaction_discarded_on_exception(self):
+
+        with self.assertRaises(KeyError):
+            with self.w.this.transaction() as staged:
+                staged.wire(_two)
+                raise KeyError()
+        self.assertEqual(self.w.this.wirings, [(_one, (), {})])
+
+
+    def test_transaction_disabled_wires(self):
+
+        w = Wires(enabled=False)
+        with w.this.transaction() as staged:
+            staged.wire(_two)
+        self.assertEqual(w.this.wirings, [(_two, (), {})])
+        self.assertIsNone(w.this())
+
+
+# ----------------------------------------------------------------------------
@@ -10,8 +10,6 @@ Shared Wires instance generic usage tests.
 """
 
 
-from __future__ import absolute_import
-
 import unittest
 
 from . import mixin_test_usage, mixin_use_shared_instance